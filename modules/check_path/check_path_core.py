@@ -2,7 +2,7 @@
 import argparse
 import logging
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
@@ -13,7 +13,8 @@ from utils.cli import (
     resolve_input_paths,
     resolve_reporting_root,
 )
-from utils.constants import MAX_THREAD_WORKERS
+from utils.constants import DEFAULT_EXECUTOR, WORKLOAD_IO
+from utils.core import create_cpu_executor, resolve_executor_kind
 
 from .check_path_executor import execute_check_path_action
 from .check_path_internal import (
@@ -113,10 +114,13 @@ def process_check_path_logic(
             files_to_submit.append(file_path)
 
         if files_to_submit:
-            max_workers = MAX_THREAD_WORKERS
-            logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
+            executor_kind = resolve_executor_kind(
+                logger, getattr(cli_args, "executor", DEFAULT_EXECUTOR), WORKLOAD_IO
+            )
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            with create_cpu_executor(
+                logger, executor_kind, getattr(cli_args, "jobs", None)
+            ) as executor:
                 future_to_file = {
                     executor.submit(
                         analyze_single_file_for_path_comment,
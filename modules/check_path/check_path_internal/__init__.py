@@ -1,11 +1,15 @@
 # Path: modules/check_path/check_path_internal/__init__.py
-from .check_path_analyzer import analyze_single_file_for_path_comment
+from .check_path_analyzer import (
+    analyze_path_comment_lines,
+    analyze_single_file_for_path_comment,
+)
 from .check_path_loader import load_config_files
 from .check_path_merger import merge_check_path_configs
 from .check_path_task_dir import process_check_path_task_dir
 
 __all__ = [
     "analyze_single_file_for_path_comment",
+    "analyze_path_comment_lines",
     "load_config_files",
     "merge_check_path_configs",
     "process_check_path_task_dir",
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from ..check_path_config import COMMENT_RULES_BY_EXT
 from .check_path_rules import apply_block_comment_rule, apply_line_comment_rule
 
-__all__ = ["analyze_single_file_for_path_comment"]
+__all__ = ["analyze_single_file_for_path_comment", "analyze_path_comment_lines"]
 
 FileResult = Dict[str, Any]
 
@@ -29,15 +29,38 @@ def analyze_single_file_for_path_comment(
         return None
 
     try:
-        try:
-            original_lines = file_path.read_text(encoding="utf-8").splitlines(True)
-            lines = list(original_lines)
-        except UnicodeDecodeError:
-            logger.warning(f"Bỏ qua file lỗi encoding: {relative_path.as_posix()}")
-            return None
-        except IOError as e:
-            logger.error(f"Không thể đọc file {relative_path.as_posix()}: {e}")
-            return None
+        original_lines = file_path.read_text(encoding="utf-8").splitlines(True)
+    except UnicodeDecodeError:
+        logger.warning(f"Bỏ qua file lỗi encoding: {relative_path.as_posix()}")
+        return None
+    except IOError as e:
+        logger.error(f"Không thể đọc file {relative_path.as_posix()}: {e}")
+        return None
+
+    return analyze_path_comment_lines(file_path, scan_root, original_lines, logger)
+
+
+def analyze_path_comment_lines(
+    file_path: Path,
+    scan_root: Path,
+    original_lines: List[str],
+    logger: logging.Logger,
+) -> Optional[FileResult]:
+    try:
+        relative_path = file_path.relative_to(scan_root)
+    except ValueError:
+
+        relative_path = file_path.relative_to(file_path.parent)
+
+    file_ext = "".join(file_path.suffixes)
+    rule = COMMENT_RULES_BY_EXT.get(file_ext)
+
+    if not rule:
+        logger.debug(f"Bỏ qua kiểu file không hỗ trợ: {relative_path.as_posix()}")
+        return None
+
+    try:
+        lines = list(original_lines)
 
         if not lines:
             return None
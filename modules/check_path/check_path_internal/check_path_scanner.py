@@ -16,7 +16,9 @@ if TYPE_CHECKING:
     import pathspec
 
 
+from utils.constants import DEFAULT_SCAN_BACKEND
 from utils.core import (
+    ScanContext,
     get_submodule_paths,
     is_extension_matched,
     is_path_matched,
@@ -35,6 +37,8 @@ def scan_files(
     extensions: List[str],
     scan_root: Path,
     script_file_path: Path,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
 ) -> Tuple[List[Path], Dict[str, bool]]:
     scan_status = {"gitignore_found": False, "gitmodules_found": False}
     scan_path = start_path.resolve()
@@ -68,6 +72,8 @@ def scan_files(
             prune_spec=None,
             extensions_filter=extensions_set,
             submodule_paths=submodule_paths,
+            use_scan_cache=use_scan_cache,
+            scan_backend=scan_backend,
         )
 
     elif scan_path.is_file():
@@ -85,9 +91,9 @@ def scan_files(
     if scan_path.is_file():
         if all_files:
             file_path = all_files[0]
-            abs_file_path = file_path.resolve()
-            is_in_submodule = any(
-                abs_file_path.is_relative_to(p) for p in submodule_paths
+            scan_context = ScanContext(scan_root, submodule_paths)
+            is_in_submodule = scan_context.is_in_submodule(
+                scan_context.relative_of(file_path)
             )
 
             if not is_in_submodule and not is_path_matched(
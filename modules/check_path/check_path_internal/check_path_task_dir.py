@@ -1,7 +1,7 @@
 # Path: modules/check_path/check_path_internal/check_path_task_dir.py
 import argparse
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
@@ -9,8 +9,13 @@ if TYPE_CHECKING:
     pass
 
 
-from utils.constants import MAX_THREAD_WORKERS
-from utils.core import compile_spec_from_patterns, parse_gitignore
+from utils.constants import DEFAULT_EXECUTOR, DEFAULT_SCAN_BACKEND, WORKLOAD_IO
+from utils.core import (
+    compile_spec_from_patterns,
+    create_cpu_executor,
+    parse_gitignore,
+    resolve_executor_kind,
+)
 
 from .check_path_analyzer import analyze_single_file_for_path_comment
 from .check_path_loader import load_config_files
@@ -56,6 +61,8 @@ def process_check_path_task_dir(
         extensions=final_extensions_list,
         scan_root=scan_dir,
         script_file_path=script_file_path,
+        use_scan_cache=getattr(cli_args, "scan_cache", False),
+        scan_backend=getattr(cli_args, "scan_backend", DEFAULT_SCAN_BACKEND),
     )
 
     logger.info("  [Cấu hình áp dụng]")
@@ -95,10 +102,13 @@ def process_check_path_task_dir(
         logger.info("  -> ✅ Tất cả file đã được xử lý (do là file input riêng lẻ).")
     else:
 
-        max_workers = MAX_THREAD_WORKERS
-        logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
+        executor_kind = resolve_executor_kind(
+            logger, getattr(cli_args, "executor", DEFAULT_EXECUTOR), WORKLOAD_IO
+        )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with create_cpu_executor(
+            logger, executor_kind, getattr(cli_args, "jobs", None)
+        ) as executor:
             future_to_file = {
                 executor.submit(
                     analyze_single_file_for_path_comment,
@@ -78,12 +78,17 @@ def orchestrate_format_code(
         elif path.is_dir():
             dirs_to_scan.append(path)
 
+    batch_mode = getattr(cli_args, "force", False) and not getattr(
+        cli_args, "dry_run", False
+    )
+
     files_to_fix = process_format_code_logic(
         logger=logger,
         files_to_process=files_to_process,
         dirs_to_scan=dirs_to_scan,
         cli_args=cli_args,
         script_file_path=this_script_path,
+        collect_only=batch_mode,
     )
 
     execute_format_code_action(
@@ -100,6 +105,7 @@ def process_format_code_logic(
     dirs_to_scan: List[Path],
     cli_args: argparse.Namespace,
     script_file_path: Path,
+    collect_only: bool = False,
 ) -> List[FileResult]:
 
     all_results: List[FileResult] = []
@@ -137,7 +143,9 @@ def process_format_code_logic(
             processed_files.add(resolved_file)
             files_to_submit.append(file_path)
 
-        if files_to_submit:
+        if files_to_submit and collect_only:
+            file_only_results = [{"path": file_path} for file_path in files_to_submit]
+        elif files_to_submit:
             max_workers = MAX_THREAD_WORKERS
             logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
 
@@ -175,6 +183,7 @@ def process_format_code_logic(
                 processed_files=processed_files,
                 reporting_root=reporting_root,
                 script_file_path=script_file_path,
+                collect_only=collect_only,
             )
             all_results.extend(results)
 
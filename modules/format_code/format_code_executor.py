@@ -2,17 +2,21 @@
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 if "PROJECT_ROOT" not in locals():
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 from modules.format_code.format_code_internal import (
+    analyze_file_content_for_formatting,
     load_config_files,
     merge_format_code_configs,
 )
 from utils.cli.ui_helpers import print_grouped_report
+from utils.constants import DEFAULT_EXTENSIONS_LANG_MAP, MAX_THREAD_WORKERS
+from utils.core import format_files_in_place, has_batch_formatter
 from utils.core.git import auto_commit_changes
 from utils.logging_config import log_success
 
@@ -22,6 +26,45 @@ __all__ = ["execute_format_code_action"]
 FileResult = Dict[str, Any]
 
 
+def _format_in_batches(
+    logger: logging.Logger, file_infos: List[FileResult]
+) -> Tuple[List[Path], List[FileResult]]:
+    paths_by_language: Dict[str, List[Path]] = {}
+    fallback_paths: List[Path] = []
+    for info in file_infos:
+        file_path: Path = info["path"]
+        file_ext = "".join(file_path.suffixes).lstrip(".")
+        language_id = DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
+        if language_id and has_batch_formatter(language_id):
+            paths_by_language.setdefault(language_id, []).append(file_path)
+        else:
+            fallback_paths.append(file_path)
+
+    changed_paths: List[Path] = []
+    for language_id, paths in paths_by_language.items():
+        logger.info(f"Đang định dạng theo lô {len(paths)} file '{language_id}'...")
+        changed, not_formatted = format_files_in_place(paths, language_id, logger)
+        changed_paths.extend(changed)
+        fallback_paths.extend(not_formatted)
+
+    fallback_results: List[FileResult] = []
+    if fallback_paths:
+        logger.info(
+            f"Đang định dạng từng file cho {len(fallback_paths)} file còn lại..."
+        )
+        with ThreadPoolExecutor(max_workers=MAX_THREAD_WORKERS) as executor:
+            for result in executor.map(
+                lambda file_path: analyze_file_content_for_formatting(
+                    file_path, logger
+                ),
+                fallback_paths,
+            ):
+                if result:
+                    fallback_results.append(result)
+
+    return sorted(changed_paths), fallback_results
+
+
 def execute_format_code_action(
     logger: logging.Logger,
     all_files_to_fix: List[FileResult],
@@ -37,7 +80,13 @@ def execute_format_code_action(
     if total_files_to_fix == 0:
         return
 
-    logger.warning(f"\n⚠️ Tổng cộng {total_files_to_fix} file cần được định dạng.")
+    batch_mode = force and not dry_run
+    if batch_mode:
+        logger.info(
+            f"\n⚡ Chế độ --force: Định dạng trực tiếp {total_files_to_fix} file theo lô."
+        )
+    else:
+        logger.warning(f"\n⚠️ Tổng cộng {total_files_to_fix} file cần được định dạng.")
 
     def _title_formatter(info: FileResult) -> str:
         file_path: Path = info["path"]
@@ -93,7 +142,20 @@ def execute_format_code_action(
     if proceed_to_write:
         written_count = 0
         files_written_relative: List[str] = []
-        for info in all_files_to_fix:
+
+        files_to_write = all_files_to_fix
+        if batch_mode:
+            changed_paths, files_to_write = _format_in_batches(logger, all_files_to_fix)
+            for target_path in changed_paths:
+                try:
+                    rel_path_str = target_path.relative_to(scan_root).as_posix()
+                except ValueError:
+                    rel_path_str = target_path.as_posix()
+                files_written_relative.append(rel_path_str)
+                logger.info(f"Đã định dạng: {rel_path_str}")
+                written_count += 1
+
+        for info in files_to_write:
             target_path: Path = info["path"]
             new_content: str = info["new_content"]
 
@@ -2,7 +2,7 @@
 import logging
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
 if "PROJECT_ROOT" not in locals():
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent))
@@ -15,26 +15,30 @@ except ImportError:
 if TYPE_CHECKING:
     pass
 
+from utils.constants import DEFAULT_SCAN_BACKEND
 from utils.core import (
+    ScanContext,
     compile_spec_from_patterns,
     get_submodule_paths,
     is_extension_matched,
     is_path_matched,
     parse_gitignore,
-    scan_directory_recursive,
+    stream_directory_recursive,
 )
 
-__all__ = ["scan_files"]
+__all__ = ["scan_files", "stream_files"]
 
 
-def scan_files(
+def stream_files(
     logger: logging.Logger,
     start_path: Path,
     ignore_list: List[str],
     extensions: List[str],
     scan_root: Path,
     script_file_path: Path,
-) -> Tuple[List[Path], Dict[str, bool]]:
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
+) -> Tuple[Iterable[Path], Dict[str, bool]]:
     scan_status = {"gitignore_found": False, "gitmodules_found": False}
 
     scan_path = start_path.resolve()
@@ -54,49 +58,60 @@ def scan_files(
     all_ignore_patterns_list: List[str] = ignore_list + gitignore_patterns
     ignore_spec = compile_spec_from_patterns(all_ignore_patterns_list, scan_root)
 
-    all_files: List[Path] = []
     extensions_set = set(extensions)
 
     if scan_path.is_dir():
 
-        all_files = scan_directory_recursive(
-            logger=logger,
-            directory=scan_path,
-            scan_root=scan_root,
-            ignore_spec=ignore_spec,
-            include_spec=None,
-            prune_spec=None,
-            extensions_filter=extensions_set,
-            submodule_paths=submodule_paths,
+        return (
+            stream_directory_recursive(
+                logger=logger,
+                directory=scan_path,
+                scan_root=scan_root,
+                ignore_spec=ignore_spec,
+                include_spec=None,
+                prune_spec=None,
+                extensions_filter=extensions_set,
+                submodule_paths=submodule_paths,
+                use_scan_cache=use_scan_cache,
+                scan_backend=scan_backend,
+            ),
+            scan_status,
         )
 
-    elif scan_path.is_file():
+    if not scan_path.is_file():
+        return [], scan_status
 
-        if is_extension_matched(scan_path, extensions_set):
-            all_files.append(scan_path)
-        else:
-            logger.warning(
-                f"File '{scan_path.name}' bị bỏ qua do không khớp extension."
-            )
-            return [], scan_status
+    if not is_extension_matched(scan_path, extensions_set):
+        logger.warning(f"File '{scan_path.name}' bị bỏ qua do không khớp extension.")
+        return [], scan_status
 
-    files_to_process: List[Path] = []
+    scan_context = ScanContext(scan_root, submodule_paths)
+    is_in_submodule = scan_context.is_in_submodule(scan_context.relative_of(scan_path))
 
-    if scan_path.is_file():
-        if all_files:
-            file_path = all_files[0]
-            abs_file_path = file_path.resolve()
-            is_in_submodule = any(
-                abs_file_path.is_relative_to(p) for p in submodule_paths
-            )
+    if is_in_submodule or is_path_matched(scan_path, ignore_spec, scan_root):
+        return [], scan_status
 
-            if not is_in_submodule and not is_path_matched(
-                file_path, ignore_spec, scan_root
-            ):
-                files_to_process.append(file_path)
-    else:
+    return [scan_path], scan_status
 
-        files_to_process = all_files
 
-    files_to_process.sort(key=lambda p: p.as_posix())
-    return files_to_process, scan_status
+def scan_files(
+    logger: logging.Logger,
+    start_path: Path,
+    ignore_list: List[str],
+    extensions: List[str],
+    scan_root: Path,
+    script_file_path: Path,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
+) -> Tuple[List[Path], Dict[str, bool]]:
+    files, scan_status = stream_files(
+        logger=logger,
+        start_path=start_path,
+        ignore_list=ignore_list,
+        extensions=extensions,
+        scan_root=scan_root,
+        script_file_path=script_file_path,
+        use_scan_cache=use_scan_cache,
+        scan_backend=scan_backend,
+    )
+    return sorted(files, key=lambda p: p.as_posix()), scan_status
@@ -1,16 +1,17 @@
 # Path: modules/format_code/format_code_internal/format_code_task_dir.py
 import argparse
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from utils.constants import MAX_THREAD_WORKERS
+from utils.constants import DEFAULT_SCAN_BACKEND, MAX_THREAD_WORKERS
+from utils.core import PathStream, submit_as_arrived
 
 from .format_code_analyzer import analyze_file_content_for_formatting
 from .format_code_loader import load_config_files
 from .format_code_merger import merge_format_code_configs
-from .format_code_scanner import scan_files
+from .format_code_scanner import stream_files
 
 __all__ = ["process_format_code_task_dir"]
 
@@ -24,6 +25,7 @@ def process_format_code_task_dir(
     processed_files: Set[Path],
     reporting_root: Path,
     script_file_path: Path,
+    collect_only: bool = False,
 ) -> List[FileResult]:
     logger.info(f"--- 📁 Quét thư mục: {scan_dir.name} ---")
 
@@ -40,13 +42,15 @@ def process_format_code_task_dir(
     final_extensions_list = merged_config["final_extensions_list"]
     final_ignore_list = merged_config["final_ignore_list"]
 
-    files_in_dir, scan_status = scan_files(
+    files_in_dir, scan_status = stream_files(
         logger=logger,
         start_path=scan_dir,
         ignore_list=final_ignore_list,
         extensions=final_extensions_list,
         scan_root=scan_dir,
         script_file_path=script_file_path,
+        use_scan_cache=getattr(cli_args, "scan_cache", False),
+        scan_backend=getattr(cli_args, "scan_backend", DEFAULT_SCAN_BACKEND),
     )
 
     logger.info("  [Cấu hình áp dụng]")
@@ -59,47 +63,23 @@ def process_format_code_task_dir(
         f"    - Tải .gitmodules cục bộ: {'Có' if scan_status['gitmodules_found'] else 'Không'}"
     )
 
-    if not files_in_dir:
-        logger.info(
-            f"  -> 🤷 Không tìm thấy file nào khớp tiêu chí trong: {scan_dir.name}"
-        )
-        logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
-        logger.info("")
-        return []
-
-    logger.info(
-        f"  -> ⚡ Tìm thấy {len(files_in_dir)} file, đang phân tích (song song)..."
-    )
-
     dir_results: List[FileResult] = []
+    path_stream = PathStream(files_in_dir, processed_files)
 
-    files_to_submit: List[Path] = []
-    for file_path in files_in_dir:
-        resolved_file = file_path.resolve()
-        if resolved_file in processed_files:
-            continue
-
-        processed_files.add(resolved_file)
-        files_to_submit.append(file_path)
-
-    if not files_to_submit:
-        logger.info("  -> ✅ Tất cả file đã được xử lý (do là file input riêng lẻ).")
+    if collect_only:
+        dir_results = [{"path": file_path} for file_path in path_stream]
     else:
-
         max_workers = MAX_THREAD_WORKERS
         logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-
-            future_to_file = {
-                executor.submit(
-                    analyze_file_content_for_formatting, file_path, logger
-                ): file_path
-                for file_path in files_to_submit
-            }
-
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+            for file_path, future in submit_as_arrived(
+                executor,
+                analyze_file_content_for_formatting,
+                path_stream,
+                logger,
+                max_in_flight=max_workers * 4,
+            ):
                 try:
                     result = future.result()
                     if result:
@@ -109,9 +89,29 @@ def process_format_code_task_dir(
                         f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}"
                     )
 
+    if not path_stream.found_count:
+        logger.info(
+            f"  -> 🤷 Không tìm thấy file nào khớp tiêu chí trong: {scan_dir.name}"
+        )
+        logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
+        logger.info("")
+        return []
+
+    if collect_only:
+        logger.info(
+            f"  -> ⚡ Tìm thấy {path_stream.found_count} file, sẽ định dạng trực tiếp theo lô."
+        )
+    else:
+        logger.info(
+            f"  -> ⚡ Tìm thấy {path_stream.found_count} file, đã phân tích song song trong lúc quét."
+        )
+
+    if not path_stream.submitted_count:
+        logger.info("  -> ✅ Tất cả file đã được xử lý (do là file input riêng lẻ).")
+
     dir_results.sort(key=lambda r: r["path"])
 
-    if not dir_results and files_to_submit:
+    if not dir_results and path_stream.submitted_count and not collect_only:
         logger.info("  -> ✅ Tất cả file trong thư mục đã được định dạng.")
 
     logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
@@ -2,7 +2,6 @@
 import argparse
 import logging
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
@@ -10,12 +9,12 @@ if "PROJECT_ROOT" not in locals():
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 from utils.cli import resolve_reporting_root, resolve_stepwise_paths
-from utils.constants import MAX_THREAD_WORKERS
+from utils.constants import DEFAULT_EXECUTOR
 
 from .no_doc_config import DEFAULT_START_PATH
 from .no_doc_executor import execute_ndoc_action
 from .no_doc_internal import (
-    analyze_file_for_cleaning_and_formatting,
+    analyze_files,
     load_config_files,
     merge_ndoc_configs,
     process_no_doc_task_dir,
@@ -157,32 +156,15 @@ def process_no_doc_logic(
             files_to_submit.append(file_path)
 
         if files_to_submit:
-            max_workers = MAX_THREAD_WORKERS
-            logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_file = {
-                    executor.submit(
-                        analyze_file_for_cleaning_and_formatting,
-                        file_path,
-                        logger,
-                        all_clean,
-                        format_flag,
-                        file_format_extensions_set,
-                    ): file_path
-                    for file_path in files_to_submit
-                }
-
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    try:
-                        result = future.result()
-                        if result:
-                            file_only_results.append(result)
-                    except Exception as e:
-                        logger.error(
-                            f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}"
-                        )
+            file_only_results = analyze_files(
+                logger,
+                files_to_submit,
+                all_clean,
+                format_flag,
+                file_format_extensions_set,
+                executor_kind=getattr(cli_args, "executor", DEFAULT_EXECUTOR),
+                jobs=getattr(cli_args, "jobs", None),
+            )
 
         if file_only_results:
             file_only_results.sort(key=lambda r: r["path"])
@@ -1,14 +1,16 @@
 # Path: modules/no_doc/no_doc_internal/__init__.py
-from .no_doc_analyzer import analyze_file_for_cleaning_and_formatting
+from .no_doc_analyzer import analyze_file_for_cleaning_and_formatting, analyze_files
 from .no_doc_loader import load_config_files
 from .no_doc_merger import merge_ndoc_configs
-from .no_doc_scanner import scan_files
+from .no_doc_scanner import scan_files, stream_files
 from .no_doc_task_dir import process_no_doc_task_dir
 
 __all__ = [
     "analyze_file_for_cleaning_and_formatting",
+    "analyze_files",
     "load_config_files",
     "merge_ndoc_configs",
     "scan_files",
+    "stream_files",
     "process_no_doc_task_dir",
 ]
@@ -1,30 +1,52 @@
 # Path: modules/no_doc/no_doc_internal/no_doc_analyzer.py
 import logging
 import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 if "PROJECT_ROOT" not in locals():
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent))
 
 
-from utils.constants import DEFAULT_EXTENSIONS_LANG_MAP
-from utils.core import clean_code, format_code
+from utils.constants import (
+    DEFAULT_EXECUTOR,
+    DEFAULT_EXTENSIONS_LANG_MAP,
+    EXECUTOR_THREAD,
+    MAX_THREAD_WORKERS,
+    WORKLOAD_CPU,
+)
+from utils.core import (
+    clean_code,
+    create_cpu_executor,
+    format_code,
+    iter_batches,
+    merge_transform_cache_stats,
+    resolve_executor_kind,
+    submit_as_arrived,
+    take_transform_cache_stats,
+)
 
-__all__ = ["analyze_file_for_cleaning_and_formatting"]
+__all__ = [
+    "load_file_for_analysis",
+    "analyze_content_for_cleaning_and_formatting",
+    "analyze_file_for_cleaning_and_formatting",
+    "analyze_content_batch",
+    "analyze_files",
+]
 
 FileResult = Dict[str, Any]
 
 
-def analyze_file_for_cleaning_and_formatting(
-    file_path: Path,
-    logger: logging.Logger,
-    all_clean: bool,
-    format_flag: bool,
-    format_extensions_set: Set[str],
-) -> Optional[FileResult]:
+def load_file_for_analysis(file_path: Path, logger: logging.Logger) -> Optional[str]:
     try:
-        original_content = file_path.read_text(encoding="utf-8")
+        return file_path.read_text(encoding="utf-8")
     except (IOError, UnicodeDecodeError) as e:
         logger.warning(f"⚠️ Bỏ qua file '{file_path.name}' do lỗi đọc/encoding: {e}")
         return None
@@ -34,6 +56,15 @@ def analyze_file_for_cleaning_and_formatting(
         )
         return None
 
+
+def analyze_content_for_cleaning_and_formatting(
+    file_path: Path,
+    original_content: str,
+    logger: logging.Logger,
+    all_clean: bool,
+    format_flag: bool,
+    format_extensions_set: Set[str],
+) -> Optional[FileResult]:
     file_ext = "".join(file_path.suffixes).lstrip(".")
     language_id = DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
 
@@ -71,3 +102,160 @@ def analyze_file_for_cleaning_and_formatting(
         }
 
     return None
+
+
+def analyze_file_for_cleaning_and_formatting(
+    file_path: Path,
+    logger: logging.Logger,
+    all_clean: bool,
+    format_flag: bool,
+    format_extensions_set: Set[str],
+) -> Optional[FileResult]:
+    original_content = load_file_for_analysis(file_path, logger)
+    if original_content is None:
+        return None
+
+    return analyze_content_for_cleaning_and_formatting(
+        file_path,
+        original_content,
+        logger,
+        all_clean,
+        format_flag,
+        format_extensions_set,
+    )
+
+
+def analyze_content_batch(
+    items: List[Tuple[Path, str]],
+    logger: logging.Logger,
+    all_clean: bool,
+    format_flag: bool,
+    format_extensions_set: Set[str],
+) -> Tuple[List[FileResult], Optional[Dict[str, int]]]:
+    results: List[FileResult] = []
+    for file_path, original_content in items:
+        result = analyze_content_for_cleaning_and_formatting(
+            file_path,
+            original_content,
+            logger,
+            all_clean,
+            format_flag,
+            format_extensions_set,
+        )
+        if result:
+            results.append(result)
+    return results, take_transform_cache_stats()
+
+
+def _analyze_files_in_pool(
+    logger: logging.Logger,
+    file_paths: Iterable[Path],
+    all_clean: bool,
+    format_flag: bool,
+    format_extensions_set: Set[str],
+    executor_kind: str,
+    jobs: Optional[int],
+) -> List[FileResult]:
+    results: List[FileResult] = []
+    batch_futures: Dict[Future, List[Tuple[Path, str]]] = {}
+
+    def _collect(future: Future) -> None:
+        items = batch_futures.pop(future)
+        try:
+            batch_results, cache_stats = future.result()
+            merge_transform_cache_stats(cache_stats)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Worker gặp lỗi ({e}), xử lý lại {len(items)} file trong tiến trình chính."
+            )
+            batch_results, _ = analyze_content_batch(
+                items, logger, all_clean, format_flag, format_extensions_set
+            )
+        results.extend(batch_results)
+
+    def _iter_loaded(read_executor: ThreadPoolExecutor) -> Iterator[Tuple[Path, str]]:
+        for file_path, future in submit_as_arrived(
+            read_executor,
+            load_file_for_analysis,
+            file_paths,
+            logger,
+            max_in_flight=MAX_THREAD_WORKERS * 4,
+        ):
+            content = future.result()
+            if content is not None:
+                yield file_path, content
+
+    max_in_flight = (jobs or MAX_THREAD_WORKERS) * 2
+    with ThreadPoolExecutor(max_workers=MAX_THREAD_WORKERS) as read_executor:
+        with create_cpu_executor(logger, executor_kind, jobs) as cpu_executor:
+            for batch in iter_batches(
+                _iter_loaded(read_executor), size_of=lambda item: len(item[1])
+            ):
+                try:
+                    future = cpu_executor.submit(
+                        analyze_content_batch,
+                        batch,
+                        logger,
+                        all_clean,
+                        format_flag,
+                        format_extensions_set,
+                    )
+                except BrokenExecutor as e:
+                    future = Future()
+                    future.set_exception(e)
+                batch_futures[future] = batch
+                if len(batch_futures) >= max_in_flight:
+                    done, _ = wait(batch_futures, return_when=FIRST_COMPLETED)
+                    for done_future in done:
+                        _collect(done_future)
+
+            for future in list(batch_futures):
+                _collect(future)
+
+    return results
+
+
+def analyze_files(
+    logger: logging.Logger,
+    file_paths: Iterable[Path],
+    all_clean: bool,
+    format_flag: bool,
+    format_extensions_set: Set[str],
+    executor_kind: str = DEFAULT_EXECUTOR,
+    jobs: Optional[int] = None,
+) -> List[FileResult]:
+    executor_kind = resolve_executor_kind(
+        logger, executor_kind, WORKLOAD_CPU, subinterpreter_safe=False
+    )
+    if executor_kind != EXECUTOR_THREAD:
+        return _analyze_files_in_pool(
+            logger,
+            file_paths,
+            all_clean,
+            format_flag,
+            format_extensions_set,
+            executor_kind,
+            jobs,
+        )
+
+    results: List[FileResult] = []
+    max_workers = jobs or MAX_THREAD_WORKERS
+    with create_cpu_executor(logger, EXECUTOR_THREAD, max_workers) as executor:
+        for file_path, future in submit_as_arrived(
+            executor,
+            analyze_file_for_cleaning_and_formatting,
+            file_paths,
+            logger,
+            all_clean,
+            format_flag,
+            format_extensions_set,
+            max_in_flight=max_workers * 4,
+        ):
+            try:
+                result = future.result()
+                if result:
+                    results.append(result)
+            except Exception as e:
+                logger.error(f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}")
+
+    return results
@@ -1,17 +1,17 @@
 # Path: modules/no_doc/no_doc_internal/no_doc_task_dir.py
 import argparse
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from utils.constants import MAX_THREAD_WORKERS
+from utils.constants import DEFAULT_EXECUTOR, DEFAULT_SCAN_BACKEND
+from utils.core import PathStream
 
 from . import (
-    analyze_file_for_cleaning_and_formatting,
+    analyze_files,
     load_config_files,
     merge_ndoc_configs,
-    scan_files,
+    stream_files,
 )
 
 __all__ = ["process_no_doc_task_dir"]
@@ -45,13 +45,15 @@ def process_no_doc_task_dir(
 
     final_format_extensions_set = merged_config["final_format_extensions_set"]
 
-    files_in_dir, scan_status = scan_files(
+    files_in_dir, scan_status = stream_files(
         logger=logger,
         start_path=scan_dir,
         ignore_list=final_ignore_list,
         extensions=final_extensions_list,
         scan_root=scan_dir,
         script_file_path=script_file_path,
+        use_scan_cache=getattr(cli_args, "scan_cache", False),
+        scan_backend=getattr(cli_args, "scan_backend", DEFAULT_SCAN_BACKEND),
     )
 
     logger.info("  [Cấu hình áp dụng]")
@@ -68,7 +70,23 @@ def process_no_doc_task_dir(
         f"    - Tải .gitmodules cục bộ: {'Có' if scan_status['gitmodules_found'] else 'Không'}"
     )
 
-    if not files_in_dir:
+    dir_results: List[FileResult] = []
+    all_clean: bool = getattr(cli_args, "all_clean", False)
+    path_stream = PathStream(files_in_dir, processed_files)
+
+    dir_results.extend(
+        analyze_files(
+            logger,
+            path_stream,
+            all_clean,
+            format_flag,
+            final_format_extensions_set,
+            executor_kind=getattr(cli_args, "executor", DEFAULT_EXECUTOR),
+            jobs=getattr(cli_args, "jobs", None),
+        )
+    )
+
+    if not path_stream.found_count:
         logger.info(
             f"  -> 🤷 Không tìm thấy file nào khớp tiêu chí trong: {scan_dir.name}"
         )
@@ -77,55 +95,15 @@ def process_no_doc_task_dir(
         return []
 
     logger.info(
-        f"  -> ⚡ Tìm thấy {len(files_in_dir)} file, đang phân tích (song song)..."
+        f"  -> ⚡ Tìm thấy {path_stream.found_count} file, đã phân tích song song trong lúc quét."
     )
 
-    dir_results: List[FileResult] = []
-    all_clean: bool = getattr(cli_args, "all_clean", False)
-
-    files_to_submit: List[Path] = []
-    for file_path in files_in_dir:
-        resolved_file = file_path.resolve()
-        if resolved_file in processed_files:
-            continue
-
-        processed_files.add(resolved_file)
-        files_to_submit.append(file_path)
-
-    if not files_to_submit:
+    if not path_stream.submitted_count:
         logger.info("  -> ✅ Tất cả file đã được xử lý (do là file input riêng lẻ).")
-    else:
-
-        max_workers = MAX_THREAD_WORKERS
-        logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {
-                executor.submit(
-                    analyze_file_for_cleaning_and_formatting,
-                    file_path,
-                    logger,
-                    all_clean,
-                    format_flag,
-                    final_format_extensions_set,
-                ): file_path
-                for file_path in files_to_submit
-            }
-
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    if result:
-                        dir_results.append(result)
-                except Exception as e:
-                    logger.error(
-                        f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}"
-                    )
 
     dir_results.sort(key=lambda r: r["path"])
 
-    if not dir_results and files_to_submit:
+    if not dir_results and path_stream.submitted_count:
         logger.info("  -> ✅ Tất cả file trong thư mục đã sạch / đã định dạng.")
 
     logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
@@ -3,16 +3,19 @@ from .pack_code_config import (
     CONFIG_FILENAME,
     CONFIG_SECTION_NAME,
     DEFAULT_START_PATH,
+    EXTRACT_COMMANDS,
     MODULE_DIR,
     PCODE_DEFAULTS,
     PROJECT_CONFIG_FILENAME,
     PROJECT_CONFIG_ROOT_KEY,
     TEMPLATE_FILENAME,
 )
-from .pack_code_core import orchestrate_pack_code
+from .pack_code_core import orchestrate_pack_code, orchestrate_pack_extract
 
 __all__ = [
     "orchestrate_pack_code",
+    "orchestrate_pack_extract",
+    "EXTRACT_COMMANDS",
     "DEFAULT_START_PATH",
     "PROJECT_CONFIG_FILENAME",
     "PROJECT_CONFIG_ROOT_KEY",
@@ -17,6 +17,18 @@ __all__ = [
     "MODULE_DIR",
     "TEMPLATE_FILENAME",
     "PCODE_DEFAULTS",
+    "CHARS_PER_TOKEN",
+    "SHARD_INDEX_WIDTH",
+    "MANIFEST_SUFFIX",
+    "MANIFEST_VERSION",
+    "INDEX_SUFFIX",
+    "INDEX_VERSION",
+    "EXTRACT_COMMANDS",
+    "ZIP_ARCHIVE_SUFFIXES",
+    "TAR_ARCHIVE_SUFFIXES",
+    "COMPRESSED_TAR_SUFFIXES",
+    "PREFETCH_MAX_BYTES",
+    "ARCHIVE_REORDER_MAX_BYTES",
 ]
 
 DEFAULT_START_PATH: Final[str] = "."
@@ -57,6 +69,19 @@ DEFAULT_OUTPUT_DIR: Final[str] = "~/Documents/code.context"
 DEFAULT_CLEAN_EXTENSIONS: Final[Set[str]] = {"py", "zsh", "sh"}
 DEFAULT_FORMAT_EXTENSIONS: Final[Set[str]] = {"py"}
 
+CHARS_PER_TOKEN: Final[int] = 4
+SHARD_INDEX_WIDTH: Final[int] = 3
+MANIFEST_SUFFIX: Final[str] = ".manifest.json"
+MANIFEST_VERSION: Final[int] = 1
+INDEX_SUFFIX: Final[str] = ".index.json"
+INDEX_VERSION: Final[int] = 1
+EXTRACT_COMMANDS: Final[Set[str]] = {"cat", "unpack"}
+ZIP_ARCHIVE_SUFFIXES: Final[Set[str]] = {".zip"}
+COMPRESSED_TAR_SUFFIXES: Final[Set[str]] = {".tar.gz", ".tgz", ".tar.xz", ".txz"}
+TAR_ARCHIVE_SUFFIXES: Final[Set[str]] = {".tar"} | COMPRESSED_TAR_SUFFIXES
+PREFETCH_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+ARCHIVE_REORDER_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
 PROJECT_CONFIG_FILENAME: Final[str] = "pyproject.toml"
 PROJECT_CONFIG_ROOT_KEY: Final[str] = "tool"
 CONFIG_FILENAME: Final[str] = ".pcode.toml"
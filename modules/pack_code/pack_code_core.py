@@ -3,38 +3,66 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Union
 
 from utils.cli import (
     resolve_input_paths,
     resolve_reporting_root,
 )
+from utils.constants import (
+    DEFAULT_EXECUTOR,
+    EXECUTOR_THREAD,
+    WORKLOAD_CPU,
+    WORKLOAD_IO,
+)
+from utils.core import find_git_root, resolve_executor_kind
+from utils.logging_config import log_success
 
 from .pack_code_config import DEFAULT_START_PATH
 from .pack_code_executor import execute_pack_code_action
 from .pack_code_internal import (
-    assemble_packed_content,
+    ArchiveReader,
+    GitBlobReader,
+    PackArchive,
+    PrefetchReader,
+    ShardBudget,
     generate_tree_string,
+    is_archive_path,
     load_config_files,
+    process_pack_code_task_archive,
     process_pack_code_task_dir,
     process_pack_code_task_file,
+    process_pack_code_task_rev,
     resolve_output_path,
+    resolve_pack_paths,
+    resolve_revision_tree,
 )
 
-__all__ = ["process_pack_code_logic", "orchestrate_pack_code"]
+__all__ = [
+    "process_pack_code_logic",
+    "orchestrate_pack_code",
+    "orchestrate_pack_extract",
+]
 
 FileResult = Dict[str, Any]
+EntrySource = Union[GitBlobReader, ArchiveReader, PrefetchReader]
 
 
 def orchestrate_pack_code(
     logger: logging.Logger, cli_args: argparse.Namespace, this_script_path: Path
 ) -> None:
 
-    validated_paths: List[Path] = resolve_input_paths(
-        logger=logger,
-        raw_paths=cli_args.start_paths_arg,
-        default_path_str=DEFAULT_START_PATH,
-    )
+    if getattr(cli_args, "rev", None):
+        validated_paths = [
+            Path(path_str).expanduser().resolve()
+            for path_str in (cli_args.start_paths_arg or [DEFAULT_START_PATH])
+        ]
+    else:
+        validated_paths = resolve_input_paths(
+            logger=logger,
+            raw_paths=cli_args.start_paths_arg,
+            default_path_str=DEFAULT_START_PATH,
+        )
 
     if not validated_paths:
         logger.warning("Không tìm thấy đường dẫn hợp lệ nào để quét. Đã dừng.")
@@ -53,7 +81,12 @@ def orchestrate_pack_code(
             script_file_path=this_script_path,
         )
 
-        execute_pack_code_action(logger=logger, result=results_from_core)
+        try:
+            execute_pack_code_action(logger=logger, result=results_from_core)
+        finally:
+            entry_source: Optional[EntrySource] = results_from_core.get("entry_source")
+            if entry_source is not None:
+                entry_source.close()
 
     except Exception as e:
         logger.error(
@@ -76,8 +109,38 @@ def process_pack_code_logic(
         all_file_results: List[FileResult] = []
         processed_files: Set[Path] = set()
 
-        files_to_process: List[Path] = [p for p in validated_paths if p.is_file()]
-        dirs_to_scan: List[Path] = [p for p in validated_paths if p.is_dir()]
+        rev: Optional[str] = cli_args.get("rev")
+        files_to_process: List[Path] = (
+            [] if rev else [p for p in validated_paths if p.is_file()]
+        )
+        archives_to_scan: List[Path] = [
+            p for p in files_to_process if is_archive_path(p)
+        ]
+        files_to_process = [p for p in files_to_process if p not in archives_to_scan]
+        dirs_to_scan: List[Path] = (
+            [] if rev else [p for p in validated_paths if p.is_dir()]
+        )
+
+        max_tokens: Optional[int] = cli_args.get("max_tokens")
+        max_bytes: Optional[int] = cli_args.get("max_bytes")
+        shard_budget: Optional[ShardBudget] = None
+        if max_tokens is not None or max_bytes is not None:
+            if any(
+                limit is not None and limit <= 0 for limit in (max_tokens, max_bytes)
+            ):
+                raise ValueError("--max-tokens/--max-bytes phải là số nguyên dương.")
+            if cli_args.get("stdout", False):
+                raise ValueError(
+                    "--max-tokens/--max-bytes cần ghi ra file, không dùng được với --stdout."
+                )
+            shard_budget = ShardBudget(max_tokens=max_tokens, max_bytes=max_bytes)
+            logger.info(
+                f"⚡ Chế độ SHARD đã bật: Mỗi file output tối đa {shard_budget.describe()}."
+            )
+
+        jobs: Optional[int] = cli_args.get("jobs")
+        if jobs is not None and jobs <= 0:
+            raise ValueError("--jobs phải là số nguyên dương.")
 
         format_flag: bool = cli_args.get("format", False)
         if format_flag:
@@ -85,6 +148,59 @@ def process_pack_code_logic(
                 "⚡ Chế độ FORMAT (-f) đã bật: Nội dung file sẽ được định dạng."
             )
 
+        executor_kind = resolve_executor_kind(
+            logger,
+            cli_args.get("executor", DEFAULT_EXECUTOR),
+            workload=(
+                WORKLOAD_CPU
+                if cli_args.get("all_clean", False) or format_flag
+                else WORKLOAD_IO
+            ),
+            subinterpreter_safe=False,
+        )
+
+        transform_on_read = executor_kind == EXECUTOR_THREAD
+        entry_source: Optional[EntrySource] = None
+        if rev:
+            repo_root = find_git_root(reporting_root or Path.cwd())
+            if repo_root is None:
+                raise ValueError("--rev cần chạy bên trong một Git repo.")
+            tree_id = resolve_revision_tree(logger, repo_root, rev)
+            logger.info(f"🏷️ Đóng gói từ revision '{rev}' (tree {tree_id[:12]}).")
+
+            processed_paths: Set[str] = set()
+            for target_path in validated_paths:
+                all_file_results.extend(
+                    process_pack_code_task_rev(
+                        target_path=target_path,
+                        cli_args=cli_args,
+                        logger=logger,
+                        repo_root=repo_root,
+                        tree_id=tree_id,
+                        processed_paths=processed_paths,
+                        reporting_root=reporting_root,
+                    )
+                )
+            entry_source = GitBlobReader(
+                logger, repo_root, transform_on_read=transform_on_read
+            )
+
+        archive_reader: Optional[ArchiveReader] = None
+        if archives_to_scan:
+            archive_reader = ArchiveReader(logger, transform_on_read=transform_on_read)
+            entry_source = archive_reader
+            for archive_path in archives_to_scan:
+                all_file_results.extend(
+                    process_pack_code_task_archive(
+                        archive_path=archive_path,
+                        cli_args=cli_args,
+                        logger=logger,
+                        archive_reader=archive_reader,
+                        processed_files=processed_files,
+                        reporting_root=reporting_root,
+                    )
+                )
+
         if files_to_process:
             for file_path in files_to_process:
                 results = process_pack_code_task_file(
@@ -99,6 +215,17 @@ def process_pack_code_logic(
 
         if dirs_to_scan:
             logger.info(f"Đang xử lý {len(dirs_to_scan)} thư mục...")
+            prefetcher: Optional[PrefetchReader] = None
+            if not cli_args.get("incremental", False) and not cli_args.get(
+                "dry_run", False
+            ):
+                prefetcher = PrefetchReader(
+                    logger,
+                    transform_on_read=transform_on_read,
+                    fallback=entry_source,
+                    max_workers=jobs if transform_on_read else None,
+                )
+                entry_source = prefetcher
             for scan_dir in dirs_to_scan:
                 results = process_pack_code_task_dir(
                     scan_dir=scan_dir,
@@ -107,10 +234,13 @@ def process_pack_code_logic(
                     processed_files=processed_files,
                     reporting_root=reporting_root,
                     script_file_path=script_file_path,
+                    prefetcher=prefetcher,
                 )
                 all_file_results.extend(results)
 
         if not all_file_results:
+            if entry_source is not None:
+                entry_source.close()
             logger.warning("Không tìm thấy file nào khớp với tiêu chí.")
             return {"status": "empty"}
 
@@ -124,12 +254,9 @@ def process_pack_code_logic(
             logger.debug("Đang tạo cây thư mục...")
             tree_str = generate_tree_string(all_file_results, reporting_root)
 
-        final_content = assemble_packed_content(
-            all_file_results=all_file_results,
-            tree_str=tree_str,
-            no_header=cli_args.get("no_header", False),
-            dry_run=dry_run,
-        )
+        all_file_results.sort(key=lambda r: r["rel_path"])
+        if archive_reader is not None:
+            archive_reader.plan_reads(all_file_results)
 
         config_load_dir = reporting_root if reporting_root else Path.cwd()
         file_config = load_config_files(config_load_dir, logger)
@@ -140,7 +267,8 @@ def process_pack_code_logic(
 
         return {
             "status": "ok",
-            "final_content": final_content,
+            "file_entries": all_file_results,
+            "no_header": cli_args.get("no_header", False),
             "output_path": final_output_path,
             "stdout": cli_args.get("stdout", False),
             "dry_run": dry_run,
@@ -149,12 +277,64 @@ def process_pack_code_logic(
             "scan_root": reporting_root if reporting_root else Path.cwd(),
             "tree_string": tree_str,
             "no_tree": no_tree,
+            "reporting_root": reporting_root,
+            "shard_budget": shard_budget,
+            "incremental": cli_args.get("incremental", False),
+            "write_index": cli_args.get("write_index", False),
+            "executor_kind": executor_kind,
+            "jobs": cli_args.get("jobs"),
+            "entry_source": entry_source,
         }
 
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ValueError) as e:
         logger.error(f"❌ {e}")
         return {"status": "error", "message": str(e)}
     except Exception as e:
         logger.error(f"Lỗi không mong muốn trong logic cốt lõi pack_code: {e}")
         logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": f"Lỗi không mong muốn: {e}"}
+
+
+def orchestrate_pack_extract(
+    logger: logging.Logger, cli_args: argparse.Namespace, this_script_path: Path
+) -> None:
+    pack_arg: Optional[Path] = cli_args.pack
+    if pack_arg is None:
+        file_config = load_config_files(Path.cwd(), logger)
+        pack_arg = resolve_output_path(logger, {}, file_config, Path.cwd())
+        logger.debug(f"Không chỉ định --pack, dùng output mặc định: {pack_arg}")
+
+    pack_path = pack_arg.expanduser().resolve()
+    pack_paths = resolve_pack_paths(pack_path)
+    if not pack_paths:
+        logger.error(f"❌ Không tìm thấy file pack: {pack_path.as_posix()}")
+        sys.exit(1)
+
+    with PackArchive(logger) as archive:
+        for path in pack_paths:
+            archive.add_pack(path)
+
+        rel_paths = archive.match(cli_args.paths)
+        if not rel_paths:
+            logger.warning("Không có file nào để trích xuất.")
+            sys.exit(1)
+
+        if cli_args.command == "cat":
+            for rel_path in rel_paths:
+                sys.stdout.buffer.write(archive.read_bytes(rel_path))
+            sys.stdout.buffer.flush()
+            return
+
+        dest_dir = Path(cli_args.dest).expanduser().resolve()
+        logger.info(
+            f"Đang giải nén {len(rel_paths)} file từ {len(pack_paths)} pack vào {dest_dir.as_posix()}..."
+        )
+        counts = archive.extract_to(
+            rel_paths, dest_dir, force=cli_args.force, max_workers=cli_args.jobs
+        )
+
+    if counts["exists"]:
+        logger.warning(
+            f"⚠️ Bỏ qua {counts['exists']} file đã tồn tại (dùng --force để ghi đè)."
+        )
+    log_success(logger, f"Đã giải nén {counts['written']} file.")
@@ -4,9 +4,19 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from utils.constants import EXECUTOR_THREAD
 from utils.core import copy_file_to_clipboard
 from utils.logging_config import log_success
 
+from .pack_code_internal import (
+    PackIndex,
+    ShardBudget,
+    log_pack_stats,
+    write_incremental_packed_content,
+    write_packed_content,
+    write_sharded_content,
+)
+
 __all__ = ["execute_pack_code_action"]
 
 
@@ -30,12 +40,21 @@ def execute_pack_code_action(logger: logging.Logger, result: Dict[str, Any]) ->
 
     dry_run: bool = result.get("dry_run", False)
     stdout: bool = result.get("stdout", False)
-    final_content: str = result.get("final_content", "")
+    file_entries: List[Dict[str, Any]] = result.get("file_entries", [])
+    no_header: bool = result.get("no_header", False)
     output_path_raw: Optional[Path] = result.get("output_path")
     copy_to_clipboard: bool = result.get("copy_to_clipboard", False)
     file_list_relative: List[Path] = result.get("file_list_relative", [])
     tree_string: str = result.get("tree_string", "")
     no_tree: bool = result.get("no_tree", False)
+    reporting_root: Optional[Path] = result.get("reporting_root")
+    shard_budget: Optional[ShardBudget] = result.get("shard_budget")
+    incremental: bool = result.get("incremental", False)
+    write_index: bool = result.get("write_index", False)
+    executor_kind: str = result.get("executor_kind", EXECUTOR_THREAD)
+    jobs: Optional[int] = result.get("jobs")
+    entry_source = result.get("entry_source")
+    read_func = entry_source.read_entry if entry_source is not None else None
 
     if dry_run:
         logger.info("⚡ [Dry Run] Các file sẽ được đóng gói:")
@@ -56,9 +75,36 @@ def execute_pack_code_action(logger: logging.Logger, result: Dict[str, Any]) ->
             )
         return
 
+    if incremental and (stdout or shard_budget is not None):
+        logger.warning(
+            "⚠️ Bỏ qua --incremental: Chỉ hỗ trợ khi ghi ra một file output duy nhất."
+        )
+        incremental = False
+    if incremental and read_func is not None:
+        logger.warning(
+            "⚠️ Bỏ qua --incremental: Không hỗ trợ khi đóng gói từ --rev hoặc file nén."
+        )
+        incremental = False
+    if write_index and (stdout or shard_budget is not None):
+        logger.warning(
+            "⚠️ Bỏ qua --index: Chỉ hỗ trợ khi ghi ra một file output duy nhất."
+        )
+        write_index = False
+
     if stdout:
         logger.debug("Đang in kết quả ra STDOUT...")
-        print(final_content)
+        stats = write_packed_content(
+            logger=logger,
+            sink=sys.stdout,
+            file_entries=file_entries,
+            tree_str=tree_string,
+            no_header=no_header,
+            read_func=read_func,
+            executor_kind=executor_kind,
+            jobs=jobs,
+        )
+        print()
+        log_pack_stats(logger, stats)
         logger.debug("In ra STDOUT hoàn tất.")
         return
 
@@ -75,11 +121,64 @@ def execute_pack_code_action(logger: logging.Logger, result: Dict[str, Any]) ->
             print("\n" + ("=" * 80) + "\n")
 
         try:
+            if shard_budget is not None:
+                stats = write_sharded_content(
+                    logger=logger,
+                    output_path=output_path,
+                    file_entries=file_entries,
+                    reporting_root=reporting_root,
+                    no_tree=no_tree,
+                    no_header=no_header,
+                    budget=shard_budget,
+                    read_func=read_func,
+                    executor_kind=executor_kind,
+                    jobs=jobs,
+                )
+                log_pack_stats(logger, stats)
+                logger.info("✅ Ghi các shard hoàn tất.")
+                if copy_to_clipboard:
+                    logger.warning(
+                        "⚠️ Bỏ qua --copy: Output đã được chia thành nhiều shard."
+                    )
+                return
+
             logger.info(f"Đang ghi vào file: {output_path.as_posix()}")
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            pack_index = PackIndex() if write_index else None
+            segment_callbacks = (
+                [pack_index.record_segment] if pack_index is not None else None
+            )
 
-            output_path.write_text(final_content, encoding="utf-8")
+            if incremental:
+                stats = write_incremental_packed_content(
+                    logger=logger,
+                    output_path=output_path,
+                    file_entries=file_entries,
+                    tree_str=tree_string,
+                    no_header=no_header,
+                    segment_callbacks=segment_callbacks,
+                    executor_kind=executor_kind,
+                    jobs=jobs,
+                )
+            else:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                with output_path.open("w", encoding="utf-8") as output_file:
+                    stats = write_packed_content(
+                        logger=logger,
+                        sink=output_file,
+                        file_entries=file_entries,
+                        tree_str=tree_string,
+                        no_header=no_header,
+                        read_func=read_func,
+                        segment_callbacks=segment_callbacks,
+                        executor_kind=executor_kind,
+                        jobs=jobs,
+                    )
+            log_pack_stats(logger, stats)
+            if pack_index is not None:
+                index_path = pack_index.save(output_path)
+                logger.info(f"🗂️ Đã ghi index: {index_path.as_posix()}")
             logger.info("✅ Ghi file hoàn tất.")
 
             if copy_to_clipboard:
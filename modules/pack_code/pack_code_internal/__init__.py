@@ -1,18 +1,94 @@
 # Path: modules/pack_code/pack_code_internal/__init__.py
-from .pack_code_builder import assemble_packed_content
-from .pack_code_loader import load_config_files, load_files_content
-from .pack_code_resolver import resolve_filters, resolve_output_path
+from .pack_code_archive import (
+    ArchiveReader,
+    is_archive_path,
+    process_pack_code_task_archive,
+)
+from .pack_code_builder import (
+    TREE_SEPARATOR,
+    PackedContentWriter,
+    iter_contents_in_order,
+    log_pack_stats,
+    write_packed_content,
+)
+from .pack_code_loader import (
+    build_read_options,
+    decode_source_bytes,
+    load_config_files,
+    load_pack_source,
+    read_pack_file,
+    transform_pack_batch,
+    transform_pack_content,
+)
+from .pack_code_manifest import (
+    PackManifest,
+    manifest_path_for,
+    write_incremental_packed_content,
+)
+from .pack_code_prefetch import PrefetchReader
+from .pack_code_resolver import (
+    build_relative_path_filter,
+    resolve_filters,
+    resolve_output_path,
+)
+from .pack_code_revision import (
+    GitBlobReader,
+    iter_revision_files,
+    process_pack_code_task_rev,
+    resolve_revision_tree,
+)
+from .pack_code_shard import (
+    ShardBudget,
+    estimate_tokens,
+    shard_output_path,
+    write_sharded_content,
+)
 from .pack_code_task_dir import process_pack_code_task_dir
 from .pack_code_task_file import process_pack_code_task_file
 from .pack_code_tree import generate_tree_string
+from .pack_code_unpack import (
+    PackArchive,
+    PackIndex,
+    index_path_for,
+    resolve_pack_paths,
+)
 
 __all__ = [
-    "assemble_packed_content",
-    "load_files_content",
+    "TREE_SEPARATOR",
+    "PackedContentWriter",
+    "iter_contents_in_order",
+    "write_packed_content",
+    "log_pack_stats",
+    "build_read_options",
+    "decode_source_bytes",
+    "load_pack_source",
+    "transform_pack_content",
+    "transform_pack_batch",
+    "read_pack_file",
+    "PackManifest",
+    "manifest_path_for",
+    "write_incremental_packed_content",
     "load_config_files",
     "resolve_filters",
+    "build_relative_path_filter",
     "resolve_output_path",
+    "GitBlobReader",
+    "resolve_revision_tree",
+    "iter_revision_files",
+    "process_pack_code_task_rev",
+    "ArchiveReader",
+    "is_archive_path",
+    "process_pack_code_task_archive",
+    "ShardBudget",
+    "estimate_tokens",
+    "shard_output_path",
+    "write_sharded_content",
     "process_pack_code_task_dir",
     "process_pack_code_task_file",
     "generate_tree_string",
+    "PackArchive",
+    "PackIndex",
+    "index_path_for",
+    "resolve_pack_paths",
+    "PrefetchReader",
 ]
@@ -0,0 +1,307 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_archive.py
+import logging
+import stat
+import tarfile
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from ..pack_code_config import (
+    ARCHIVE_REORDER_MAX_BYTES,
+    COMPRESSED_TAR_SUFFIXES,
+    TAR_ARCHIVE_SUFFIXES,
+    ZIP_ARCHIVE_SUFFIXES,
+)
+from .pack_code_loader import (
+    build_read_options,
+    load_config_files,
+    load_pack_source,
+    read_pack_file,
+)
+from .pack_code_resolver import build_relative_path_filter, resolve_filters
+
+__all__ = [
+    "ArchiveReader",
+    "is_archive_path",
+    "process_pack_code_task_archive",
+]
+
+FileResult = Dict[str, Any]
+MemberKey = Union[zipfile.ZipInfo, tarfile.TarInfo]
+ArchiveMember = Tuple[str, MemberKey]
+
+
+def _archive_suffix(path: Path) -> str:
+    name = path.name.lower()
+    for suffix in sorted(
+        ZIP_ARCHIVE_SUFFIXES | TAR_ARCHIVE_SUFFIXES, key=len, reverse=True
+    ):
+        if name.endswith(suffix):
+            return suffix
+    return ""
+
+
+def is_archive_path(path: Path) -> bool:
+    return bool(_archive_suffix(path))
+
+
+def _normalize_member_name(name: str) -> Optional[str]:
+    parts = [part for part in PurePosixPath(name).parts if part not in ("", ".")]
+    if not parts or name.startswith("/") or ".." in parts:
+        return None
+    return "/".join(parts)
+
+
+class _ZipSource:
+    def __init__(self, path: Path):
+        self.archive = zipfile.ZipFile(path)
+        self.lock = threading.Lock()
+
+    def iter_members(self) -> Iterator[ArchiveMember]:
+        for info in self.archive.infolist():
+            if info.is_dir() or stat.S_ISLNK(info.external_attr >> 16):
+                continue
+            yield info.filename, info
+
+    def plan_reads(self, keys: List[MemberKey]) -> None:
+        return None
+
+    def read(self, key: MemberKey) -> bytes:
+        with self.lock:
+            return self.archive.read(key)
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class _TarSource:
+    def __init__(self, path: Path, sequential: bool, max_cached_bytes: int):
+        self.path = path
+        self.archive = tarfile.open(path, "r:*")
+        self.sequential = sequential
+        self.max_cached_bytes = max_cached_bytes
+        self.lock = threading.Lock()
+        self.stream: Optional[tarfile.TarFile] = None
+        self.cursor = -1
+        self.passes = 0
+        self.planned: Set[int] = set()
+        self.cached: Dict[int, bytes] = {}
+        self.cached_bytes = 0
+
+    def iter_members(self) -> Iterator[ArchiveMember]:
+        for info in self.archive.getmembers():
+            if info.isfile():
+                yield info.name, info
+
+    def plan_reads(self, keys: List[MemberKey]) -> None:
+        if not self.sequential:
+            return
+        with self.lock:
+            self.planned.update(key.offset_data for key in keys)
+
+    def _extract(self, archive: tarfile.TarFile, key: tarfile.TarInfo) -> bytes:
+        member_file = archive.extractfile(key)
+        if member_file is None:
+            raise OSError(f"không đọc được member '{key.name}'")
+        with member_file:
+            return member_file.read()
+
+    def _restart_stream(self) -> tarfile.TarFile:
+        if self.stream is not None:
+            self.stream.close()
+        self.stream = tarfile.open(self.path, "r|*")
+        self.cursor = -1
+        self.passes += 1
+        return self.stream
+
+    def _read_forward(self, key: MemberKey) -> bytes:
+        stream = self.stream
+        if stream is None or key.offset_data <= self.cursor:
+            stream = self._restart_stream()
+
+        while True:
+            info = stream.next()
+            if info is None:
+                raise KeyError(f"không tìm thấy member '{key.name}'")
+            self.cursor = info.offset_data
+            if info.offset_data == key.offset_data:
+                return self._extract(stream, info)
+            if (
+                info.offset_data in self.planned
+                and info.offset_data not in self.cached
+                and info.isfile()
+                and self.cached_bytes + info.size <= self.max_cached_bytes
+            ):
+                try:
+                    data = self._extract(stream, info)
+                except (OSError, tarfile.TarError):
+                    continue
+                self.cached[info.offset_data] = data
+                self.cached_bytes += len(data)
+
+    def read(self, key: MemberKey) -> bytes:
+        with self.lock:
+            if not self.sequential:
+                return self._extract(self.archive, key)
+
+            self.planned.discard(key.offset_data)
+            data = self.cached.pop(key.offset_data, None)
+            if data is not None:
+                self.cached_bytes -= len(data)
+                return data
+            return self._read_forward(key)
+
+    def close(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        self.planned.clear()
+        self.cached.clear()
+        self.cached_bytes = 0
+        self.archive.close()
+
+
+def _open_source(path: Path, max_cached_bytes: int) -> Union[_ZipSource, _TarSource]:
+    suffix = _archive_suffix(path)
+    if suffix in ZIP_ARCHIVE_SUFFIXES:
+        return _ZipSource(path)
+    return _TarSource(
+        path,
+        sequential=suffix in COMPRESSED_TAR_SUFFIXES,
+        max_cached_bytes=max_cached_bytes,
+    )
+
+
+class ArchiveReader:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        transform_on_read: bool = True,
+        max_cached_bytes: int = ARCHIVE_REORDER_MAX_BYTES,
+    ):
+        self.logger = logger
+        self.transform_on_read = transform_on_read
+        self.max_cached_bytes = max_cached_bytes
+        self.sources: Dict[str, Union[_ZipSource, _TarSource]] = {}
+
+    def open(self, archive_path: Path) -> List[ArchiveMember]:
+        key = archive_path.as_posix()
+        if key not in self.sources:
+            self.logger.debug(f"Mở file nén: {key}")
+            self.sources[key] = _open_source(archive_path, self.max_cached_bytes)
+        return list(self.sources[key].iter_members())
+
+    def plan_reads(self, file_entries: List[FileResult]) -> None:
+        planned: Dict[str, List[MemberKey]] = {}
+        for entry in file_entries:
+            if "archive" in entry:
+                planned.setdefault(entry["archive"], []).append(entry["archive_member"])
+        for key, members in planned.items():
+            self.sources[key].plan_reads(members)
+
+    def read_entry(
+        self, logger: logging.Logger, entry: FileResult
+    ) -> Tuple[Optional[str], str, str]:
+        read_source = read_pack_file if self.transform_on_read else load_pack_source
+
+        raw: Optional[bytes] = None
+        if "archive" in entry:
+            try:
+                raw = self.sources[entry["archive"]].read(entry["archive_member"])
+            except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile) as e:
+                return (
+                    None,
+                    "skipped",
+                    f"   -> Bỏ qua (lỗi đọc file nén: {e}): {entry['rel_path']}",
+                )
+
+        return read_source(logger, entry["path"], entry["read_options"], raw=raw)
+
+    def close(self) -> None:
+        sources = list(self.sources.values())
+        self.sources.clear()
+        for source in sources:
+            source.close()
+
+
+def process_pack_code_task_archive(
+    archive_path: Path,
+    cli_args: Dict[str, Any],
+    logger: logging.Logger,
+    archive_reader: ArchiveReader,
+    processed_files: Set[Path],
+    reporting_root: Optional[Path],
+) -> List[FileResult]:
+    logger.info(f"--- 🗜️ Đang quét file nén: {archive_path.name} ---")
+
+    resolved_archive = archive_path.resolve()
+    if resolved_archive in processed_files:
+        logger.info("   -> Bỏ qua (đã xử lý).")
+        logger.info("")
+        return []
+
+    try:
+        members = archive_reader.open(archive_path)
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+        logger.warning(f"  -> ⚠️ Bỏ qua '{archive_path.name}': không mở được ({e}).")
+        logger.info("")
+        return []
+    processed_files.add(resolved_archive)
+
+    file_config = load_config_files(archive_path.parent, logger)
+    (
+        ext_filter_set,
+        ignore_spec,
+        include_spec,
+        _,
+        clean_extensions_set,
+        format_extensions_set,
+    ) = resolve_filters(logger, cli_args, file_config, archive_path)
+
+    passes_filter = build_relative_path_filter(
+        archive_path, ext_filter_set, ignore_spec, include_spec
+    )
+
+    read_options = build_read_options(
+        base_dir=archive_path,
+        all_clean=cli_args.get("all_clean", False),
+        clean_extensions_set=clean_extensions_set,
+        format_flag=cli_args.get("format", False),
+        format_extensions_set=format_extensions_set,
+    )
+
+    if reporting_root:
+        try:
+            archive_rel = archive_path.relative_to(reporting_root).as_posix()
+        except ValueError:
+            archive_rel = archive_path.as_posix()
+    else:
+        archive_rel = archive_path.as_posix()
+
+    archive_key = archive_path.as_posix()
+    seen_members: Set[str] = set()
+    final_results: List[FileResult] = []
+    for raw_name, member_key in members:
+        member_name = _normalize_member_name(raw_name)
+        if member_name is None or member_name in seen_members:
+            continue
+        if not passes_filter(member_name):
+            continue
+        seen_members.add(member_name)
+
+        final_results.append(
+            {
+                "path": archive_path / member_name,
+                "rel_path": f"{archive_rel}/{member_name}",
+                "read_options": read_options,
+                "archive": archive_key,
+                "archive_member": member_key,
+            }
+        )
+
+    logger.info(
+        f"  -> ⚡ {len(members)} file trong file nén, {len(final_results)} file khớp tiêu chí."
+    )
+    logger.info("")
+    return final_results
@@ -1,47 +1,289 @@
 # Path: modules/pack_code/pack_code_internal/pack_code_builder.py
-from typing import Any, Dict, List
+import logging
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
-__all__ = ["assemble_packed_content"]
+from utils.constants import EXECUTOR_THREAD, MAX_THREAD_WORKERS
+from utils.core import (
+    create_cpu_executor,
+    iter_batches,
+    merge_transform_cache_stats,
+)
+
+from .pack_code_loader import load_pack_source, read_pack_file, transform_pack_batch
+
+__all__ = [
+    "TREE_SEPARATOR",
+    "PackedContentWriter",
+    "iter_contents_in_order",
+    "write_packed_content",
+    "log_pack_stats",
+]
 
 FileResult = Dict[str, Any]
+EntryReader = Callable[[logging.Logger, FileResult], Tuple[Optional[str], str, str]]
+SegmentCallback = Callable[[str, int, str], None]
+ReadResult = Tuple[FileResult, Optional[str], str, str]
+
+TREE_SEPARATOR = "\n" + ("=" * 80) + "\n"
+
+
+class PackedContentWriter:
+    def __init__(self, sink: TextIO, track_offsets: bool = False):
+        self._sink = sink
+        self._has_piece = False
+        self._pending_whitespace = ""
+        self._track_offsets = track_offsets
+        self.position = 0
+
+    def write_piece(self, piece: str) -> Optional[int]:
+        chunk = "\n" + piece if self._has_piece else piece
+        piece_offset: Optional[int] = None
+        if self._track_offsets:
+            piece_offset = self.position + (1 if self._has_piece else 0)
+            self.position += len(chunk.encode("utf-8"))
+        self._has_piece = True
+
+        body = chunk.rstrip()
+        if not body:
+            self._pending_whitespace += chunk
+            return piece_offset
+
+        if self._pending_whitespace:
+            self._sink.write(self._pending_whitespace)
+        self._sink.write(body)
+        self._pending_whitespace = chunk[len(body) :]
+        return piece_offset
+
+    def close(self) -> None:
+        self._sink.write("\n")
+        self._pending_whitespace = ""
+
+
+def _read_entry(
+    logger: logging.Logger, entry: FileResult
+) -> Tuple[Optional[str], str, str]:
+    return read_pack_file(logger, entry["path"], entry["read_options"])
+
+
+def _load_entry(
+    logger: logging.Logger, entry: FileResult
+) -> Tuple[Optional[str], str, str]:
+    return load_pack_source(logger, entry["path"], entry["read_options"])
+
+
+def _default_entry_reader(executor_kind: str) -> EntryReader:
+    return _read_entry if executor_kind == EXECUTOR_THREAD else _load_entry
+
+
+def _iter_read_in_order(
+    logger: logging.Logger,
+    file_entries: List[FileResult],
+    window_size: int,
+    read_func: EntryReader,
+    max_workers: int,
+) -> Iterator[ReadResult]:
+    entries = iter(file_entries)
+    window: Deque[Tuple[FileResult, Future]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def _fill_window() -> None:
+            while len(window) < window_size:
+                entry = next(entries, None)
+                if entry is None:
+                    return
+                window.append(
+                    (
+                        entry,
+                        executor.submit(read_func, logger, entry),
+                    )
+                )
 
+        _fill_window()
+        while window:
+            entry, future = window.popleft()
+            content, status, log_msg = future.result()
+            _fill_window()
+            yield entry, content, status, log_msg
 
-def assemble_packed_content(
-    all_file_results: List[FileResult],
+
+def _loaded_items(batch: List[ReadResult]) -> List[Tuple[Path, str, Dict[str, Any]]]:
+    return [
+        (entry["path"], content, entry["read_options"])
+        for entry, content, status, _ in batch
+        if status == "loaded" and content is not None
+    ]
+
+
+def _merge_batch_results(
+    logger: logging.Logger, batch: List[ReadResult], future: Optional[Future]
+) -> Iterator[ReadResult]:
+    results: List[Tuple[Optional[str], str, str]] = []
+    if future is not None:
+        try:
+            results, cache_stats = future.result()
+            merge_transform_cache_stats(cache_stats)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Worker gặp lỗi ({e}), xử lý lại batch trong tiến trình chính."
+            )
+            results, _ = transform_pack_batch(logger, _loaded_items(batch))
+
+    result_iter = iter(results)
+    for entry, content, status, log_msg in batch:
+        if status == "loaded" and content is not None:
+            content, status, log_msg = next(result_iter)
+        yield entry, content, status, log_msg
+
+
+def _submit_batch(
+    executor: Executor, logger: logging.Logger, items: List[Tuple[Path, str, Any]]
+) -> Future:
+    try:
+        return executor.submit(transform_pack_batch, logger, items)
+    except BrokenExecutor as e:
+        future: Future = Future()
+        future.set_exception(e)
+        return future
+
+
+def _iter_transformed_in_pool(
+    logger: logging.Logger,
+    loaded: Iterator[ReadResult],
+    executor_kind: str,
+    jobs: Optional[int],
+) -> Iterator[ReadResult]:
+    max_in_flight = (jobs or MAX_THREAD_WORKERS) * 2
+    pending: Deque[Tuple[List[ReadResult], Optional[Future]]] = deque()
+
+    with create_cpu_executor(logger, executor_kind, jobs) as executor:
+        for batch in iter_batches(loaded, size_of=lambda result: len(result[1] or "")):
+            items = _loaded_items(batch)
+            future = _submit_batch(executor, logger, items) if items else None
+            pending.append((batch, future))
+            if len(pending) > max_in_flight:
+                yield from _merge_batch_results(logger, *pending.popleft())
+
+        while pending:
+            yield from _merge_batch_results(logger, *pending.popleft())
+
+
+def iter_contents_in_order(
+    logger: logging.Logger,
+    file_entries: List[FileResult],
+    window_size: int,
+    read_func: Optional[EntryReader] = None,
+    executor_kind: str = EXECUTOR_THREAD,
+    jobs: Optional[int] = None,
+) -> Iterator[ReadResult]:
+    read_func = read_func or _default_entry_reader(executor_kind)
+
+    if executor_kind == EXECUTOR_THREAD:
+        yield from _iter_read_in_order(
+            logger, file_entries, window_size, read_func, jobs or MAX_THREAD_WORKERS
+        )
+        return
+
+    loaded = _iter_read_in_order(
+        logger, file_entries, window_size, read_func, MAX_THREAD_WORKERS
+    )
+    yield from _iter_transformed_in_pool(logger, loaded, executor_kind, jobs)
+
+
+def write_packed_content(
+    logger: logging.Logger,
+    sink: TextIO,
+    file_entries: List[FileResult],
     tree_str: str,
     no_header: bool,
-    dry_run: bool,
-) -> str:
-    final_content_lines: List[str] = []
-
-    if tree_str:
-        final_content_lines.append(tree_str)
-        final_content_lines.append("\n" + ("=" * 80) + "\n")
+    window_size: Optional[int] = None,
+    read_func: Optional[EntryReader] = None,
+    segment_callbacks: Optional[List[SegmentCallback]] = None,
+    executor_kind: str = EXECUTOR_THREAD,
+    jobs: Optional[int] = None,
+) -> Dict[str, Any]:
+    window_size = window_size or MAX_THREAD_WORKERS * 4
+    stats: Dict[str, Any] = {
+        "written": 0,
+        "cleaned": 0,
+        "formatted": 0,
+        "reused": 0,
+        "skipped_messages": [],
+    }
 
-    if not dry_run:
+    logger.info(f"Đang đọc và ghi nội dung từ {len(file_entries)} file (song song)...")
+    logger.debug(
+        f"Chế độ thực thi: {executor_kind}, jobs={jobs or MAX_THREAD_WORKERS}, cửa sổ={window_size}"
+    )
 
-        sorted_results = sorted(all_file_results, key=lambda r: r["rel_path"])
+    segment_callbacks = segment_callbacks or []
+    writer = PackedContentWriter(sink, track_offsets=bool(segment_callbacks))
 
-        for result in sorted_results:
-            content = result.get("content")
-            if content is None:
-                continue
+    if tree_str:
+        writer.write_piece(tree_str)
+        writer.write_piece(TREE_SEPARATOR)
 
-            rel_path_str = result["rel_path"]
+    for entry, content, status, log_msg in iter_contents_in_order(
+        logger, file_entries, window_size, read_func, executor_kind, jobs
+    ):
+        if status == "skipped":
+            stats["skipped_messages"].append(log_msg)
+            continue
+        if status in ("cleaned", "formatted", "reused"):
+            stats[status] += 1
 
-            if not no_header:
+        rel_path_str = entry["rel_path"]
+        if not no_header:
+            writer.write_piece(f"[[START_FILE_CONTENT: {rel_path_str}]]")
+            content_offset = writer.write_piece(content)
+            writer.write_piece(f"[[END_FILE_CONTENT: {rel_path_str}]]")
+            writer.write_piece("\n")
+        else:
+            content_offset = writer.write_piece(content)
+        if content_offset is not None:
+            for callback in segment_callbacks:
+                callback(rel_path_str, content_offset, content)
+        stats["written"] += 1
 
-                start_header = f"[[START_FILE_CONTENT: {rel_path_str}]]"
-                end_header = f"[[END_FILE_CONTENT: {rel_path_str}]]"
+    writer.close()
+    return stats
 
-                final_content_lines.append(start_header)
-                final_content_lines.append(content)
-                final_content_lines.append(end_header)
-                final_content_lines.append("\n")
 
-            else:
+def log_pack_stats(logger: logging.Logger, stats: Dict[str, Any]) -> None:
+    skipped_messages: List[str] = stats.get("skipped_messages", [])
+    for message in skipped_messages:
+        logger.warning(message)
 
-                final_content_lines.append(content)
+    if skipped_messages:
+        logger.warning(
+            f"Đã bỏ qua tổng cộng {len(skipped_messages)} file không thể đọc."
+        )
+    if stats.get("cleaned", 0) > 0:
+        logger.info(f"Đã làm sạch nội dung của {stats['cleaned']} file.")
+    if stats.get("formatted", 0) > 0:
+        logger.info(f"Đã định dạng nội dung của {stats['formatted']} file.")
+    if stats.get("reused", 0) > 0:
+        logger.info(
+            f"♻️ Tái sử dụng nội dung của {stats['reused']} file từ lần đóng gói trước."
+        )
 
-    final_content = "\n".join(final_content_lines)
-    return final_content.rstrip() + "\n"
+    shards: List[Dict[str, Any]] = stats.get("shards", [])
+    if shards:
+        logger.info(f"Đã chia output thành {len(shards)} shard:")
+        for shard in shards:
+            logger.info(
+                f"   -> {shard['path'].as_posix()} ({shard['files']} file, ~{shard['tokens']} token, {shard['bytes']} byte)"
+            )
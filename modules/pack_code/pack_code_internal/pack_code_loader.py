@@ -1,13 +1,19 @@
 # Path: modules/pack_code/pack_code_internal/pack_code_loader.py
 import logging
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
-    from utils.constants import DEFAULT_EXTENSIONS_LANG_MAP, MAX_THREAD_WORKERS
-    from utils.core import clean_code, format_code, load_and_merge_configs
+    from utils.constants import DEFAULT_EXTENSIONS_LANG_MAP
+    from utils.core import (
+        clean_code,
+        cleaner_fingerprint,
+        format_code,
+        formatter_fingerprint,
+        load_and_merge_configs,
+        take_transform_cache_stats,
+    )
 except ImportError:
     print("Lỗi: Không thể import utils.core hoặc utils.constants.", file=sys.stderr)
     sys.exit(1)
@@ -19,7 +25,18 @@ from ..pack_code_config import (
     PROJECT_CONFIG_ROOT_KEY,
 )
 
-__all__ = ["load_files_content", "load_config_files"]
+__all__ = [
+    "build_read_options",
+    "decode_source_bytes",
+    "load_pack_source",
+    "transform_pack_content",
+    "transform_fingerprint",
+    "transform_pack_batch",
+    "read_pack_file",
+    "load_config_files",
+]
+
+ReadOptions = Dict[str, Any]
 
 
 def load_config_files(start_dir: Path, logger: logging.Logger) -> Dict[str, Any]:
@@ -33,131 +50,169 @@ def load_config_files(start_dir: Path, logger: logging.Logger) -> Dict[str, Any]
     )
 
 
-def load_files_content(
-    logger: logging.Logger,
-    file_paths: List[Path],
+def build_read_options(
     base_dir: Path,
     all_clean: bool,
     clean_extensions_set: Set[str],
     format_flag: bool,
     format_extensions_set: Set[str],
-) -> Dict[Path, str]:
-    logger.info(f"Đang đọc nội dung từ {len(file_paths)} file (song song)...")
-    content_map: Dict[Path, str] = {}
-    skipped_count = 0
-    cleaned_count = 0
-    formatted_count = 0
+) -> ReadOptions:
+    return {
+        "base_dir": base_dir,
+        "all_clean": all_clean,
+        "clean_extensions_set": clean_extensions_set,
+        "format_flag": format_flag,
+        "format_extensions_set": format_extensions_set,
+    }
+
+
+def decode_source_bytes(raw: bytes) -> str:
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _skip_result(
+    file_path: Path, base_dir: Path, error: Exception
+) -> Tuple[Optional[str], str, str]:
+    rel_path = file_path.relative_to(base_dir).as_posix()
+    if isinstance(error, UnicodeDecodeError):
+        return None, "skipped", f"   -> Bỏ qua (lỗi encoding): {rel_path}"
+    if isinstance(error, IOError):
+        return None, "skipped", f"   -> Bỏ qua (lỗi I/O: {error}): {rel_path}"
+    return (
+        None,
+        "skipped",
+        f"    -> Bỏ qua (lỗi không xác định: {error}): {rel_path}",
+    )
 
-    def _process_single_file(file_path: Path) -> Tuple[Path, Optional[str], str, str]:
 
-        try:
+def load_pack_source(
+    logger: logging.Logger,
+    file_path: Path,
+    read_options: ReadOptions,
+    raw: Optional[bytes] = None,
+) -> Tuple[Optional[str], str, str]:
+    try:
+        if raw is None:
             content = file_path.read_text(encoding="utf-8")
-            original_content = content
-            file_was_cleaned = False
-            file_was_formatted = False
-
-            file_ext = "".join(file_path.suffixes).lstrip(".")
-            language_id = DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
-
-            if all_clean and file_ext in clean_extensions_set:
-                if language_id:
-                    logger.debug(
-                        f"   -> Đang làm sạch '{file_path.relative_to(base_dir).as_posix()}' (ngôn ngữ: {language_id})..."
-                    )
-                    cleaned_content = clean_code(
-                        code_content=content,
-                        language=language_id,
-                        logger=logger,
-                        all_clean=True,
-                    )
-                    if cleaned_content != content:
-                        file_was_cleaned = True
-                        content = cleaned_content
-                else:
-                    logger.debug(
-                        f"   -> Bỏ qua làm sạch '{file_path.relative_to(base_dir).as_posix()}': Không tìm thấy language ID cho extension '{file_ext}'."
-                    )
-
-            if format_flag and file_ext in format_extensions_set:
-                if language_id:
-                    logger.debug(
-                        f"   -> Đang định dạng '{file_path.relative_to(base_dir).as_posix()}' (ngôn ngữ: {language_id})..."
-                    )
-
-                    formatted_content = format_code(
-                        code_content=content,
-                        language=language_id,
-                        logger=logger,
-                        file_path=file_path,
-                    )
-                    if formatted_content != content:
-
-                        if not (all_clean and content == original_content):
-                            file_was_formatted = True
-                        content = formatted_content
-                else:
-                    logger.debug(
-                        f"   -> Bỏ qua định dạng '{file_path.relative_to(base_dir).as_posix()}': Không tìm thấy language ID cho extension '{file_ext}'."
-                    )
-
-            status = "ok"
-            if file_was_cleaned:
-                status = "cleaned"
-            if file_was_formatted:
-                status = "formatted"
-
-            return file_path, content, status, ""
-
-        except UnicodeDecodeError:
-            return (
-                file_path,
-                None,
-                "skipped",
-                f"   -> Bỏ qua (lỗi encoding): {file_path.relative_to(base_dir).as_posix()}",
-            )
-        except IOError as e:
-            return (
-                file_path,
-                None,
-                "skipped",
-                f"   -> Bỏ qua (lỗi I/O: {e}): {file_path.relative_to(base_dir).as_posix()}",
-            )
-        except Exception as e:
-            return (
-                file_path,
-                None,
-                "skipped",
-                f"    -> Bỏ qua (lỗi không xác định: {e}): {file_path.relative_to(base_dir).as_posix()}",
-            )
-
-    max_workers = MAX_THREAD_WORKERS
-    logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(_process_single_file, file_path) for file_path in file_paths
-        ]
-
-        for future in as_completed(futures):
-            f_path, f_content, f_status, log_msg = future.result()
-
-            if f_status == "skipped":
-                logger.warning(log_msg)
-                skipped_count += 1
-            elif f_status == "cleaned":
-                cleaned_count += 1
-                content_map[f_path] = f_content
-            elif f_status == "formatted":
-                formatted_count += 1
-                content_map[f_path] = f_content
-            elif f_status == "ok":
-                content_map[f_path] = f_content
-
-    if skipped_count > 0:
-        logger.warning(f"Đã bỏ qua tổng cộng {skipped_count} file không thể đọc.")
-    if all_clean and cleaned_count > 0:
-        logger.info(f"Đã làm sạch nội dung của {cleaned_count} file.")
-    if format_flag and formatted_count > 0:
-        logger.info(f"Đã định dạng nội dung của {formatted_count} file.")
-
-    return content_map
+        else:
+            content = decode_source_bytes(raw)
+    except Exception as e:
+        return _skip_result(file_path, read_options["base_dir"], e)
+    return content, "loaded", ""
+
+
+def transform_pack_content(
+    logger: logging.Logger,
+    file_path: Path,
+    content: str,
+    read_options: ReadOptions,
+) -> Tuple[Optional[str], str, str]:
+    base_dir: Path = read_options["base_dir"]
+    all_clean: bool = read_options["all_clean"]
+    clean_extensions_set: Set[str] = read_options["clean_extensions_set"]
+    format_flag: bool = read_options["format_flag"]
+    format_extensions_set: Set[str] = read_options["format_extensions_set"]
+
+    try:
+        original_content = content
+        file_was_cleaned = False
+        file_was_formatted = False
+
+        file_ext = "".join(file_path.suffixes).lstrip(".")
+        language_id = DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
+
+        if all_clean and file_ext in clean_extensions_set:
+            if language_id:
+                logger.debug(
+                    f"   -> Đang làm sạch '{file_path.relative_to(base_dir).as_posix()}' (ngôn ngữ: {language_id})..."
+                )
+                cleaned_content = clean_code(
+                    code_content=content,
+                    language=language_id,
+                    logger=logger,
+                    all_clean=True,
+                )
+                if cleaned_content != content:
+                    file_was_cleaned = True
+                    content = cleaned_content
+            else:
+                logger.debug(
+                    f"   -> Bỏ qua làm sạch '{file_path.relative_to(base_dir).as_posix()}': Không tìm thấy language ID cho extension '{file_ext}'."
+                )
+
+        if format_flag and file_ext in format_extensions_set:
+            if language_id:
+                logger.debug(
+                    f"   -> Đang định dạng '{file_path.relative_to(base_dir).as_posix()}' (ngôn ngữ: {language_id})..."
+                )
+
+                formatted_content = format_code(
+                    code_content=content,
+                    language=language_id,
+                    logger=logger,
+                    file_path=file_path,
+                )
+                if formatted_content != content:
+
+                    if not (all_clean and content == original_content):
+                        file_was_formatted = True
+                    content = formatted_content
+            else:
+                logger.debug(
+                    f"   -> Bỏ qua định dạng '{file_path.relative_to(base_dir).as_posix()}': Không tìm thấy language ID cho extension '{file_ext}'."
+                )
+
+        status = "ok"
+        if file_was_cleaned:
+            status = "cleaned"
+        if file_was_formatted:
+            status = "formatted"
+
+        return content, status, ""
+
+    except Exception as e:
+        return _skip_result(file_path, base_dir, e)
+
+
+def transform_fingerprint(
+    logger: logging.Logger, file_path: Path, read_options: ReadOptions
+) -> Optional[str]:
+    file_ext = "".join(file_path.suffixes).lstrip(".")
+    language_id = DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
+    if not language_id:
+        return ""
+
+    parts: List[str] = []
+    if read_options["all_clean"] and file_ext in read_options["clean_extensions_set"]:
+        parts.append(f"clean:{cleaner_fingerprint(language_id) or ''}")
+    if (
+        read_options["format_flag"]
+        and file_ext in read_options["format_extensions_set"]
+    ):
+        fingerprint = formatter_fingerprint(language_id, logger, file_path)
+        if fingerprint is None:
+            return None
+        parts.append(f"format:{fingerprint}")
+    return "|".join(parts)
+
+
+def transform_pack_batch(
+    logger: logging.Logger, items: List[Tuple[Path, str, ReadOptions]]
+) -> Tuple[List[Tuple[Optional[str], str, str]], Optional[Dict[str, int]]]:
+    results = [
+        transform_pack_content(logger, file_path, content, read_options)
+        for file_path, content, read_options in items
+    ]
+    return results, take_transform_cache_stats()
+
+
+def read_pack_file(
+    logger: logging.Logger,
+    file_path: Path,
+    read_options: ReadOptions,
+    raw: Optional[bytes] = None,
+) -> Tuple[Optional[str], str, str]:
+    content, status, log_msg = load_pack_source(logger, file_path, read_options, raw)
+    if content is None:
+        return content, status, log_msg
+    return transform_pack_content(logger, file_path, content, read_options)
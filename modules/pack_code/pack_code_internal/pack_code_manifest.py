@@ -0,0 +1,228 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_manifest.py
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.constants import EXECUTOR_THREAD
+
+from ..pack_code_config import MANIFEST_SUFFIX, MANIFEST_VERSION
+from .pack_code_builder import SegmentCallback, write_packed_content
+from .pack_code_loader import (
+    ReadOptions,
+    load_pack_source,
+    read_pack_file,
+    transform_fingerprint,
+)
+
+__all__ = [
+    "PackManifest",
+    "manifest_path_for",
+    "write_incremental_packed_content",
+]
+
+FileResult = Dict[str, Any]
+FileRecord = Dict[str, Any]
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + MANIFEST_SUFFIX)
+
+
+def _options_digest(
+    read_options: ReadOptions, fingerprint: Optional[str]
+) -> Optional[str]:
+    if fingerprint is None:
+        return None
+    signature = json.dumps(
+        {
+            "all_clean": read_options["all_clean"],
+            "clean_extensions": sorted(read_options["clean_extensions_set"]),
+            "format": read_options["format_flag"],
+            "format_extensions": sorted(read_options["format_extensions_set"]),
+            "transform": fingerprint,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:16]
+
+
+class PackManifest:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        output_path: Path,
+        transform_on_read: bool = True,
+    ):
+        self.logger = logger
+        self.transform_on_read = transform_on_read
+        self.output_path = output_path
+        self.manifest_path = manifest_path_for(output_path)
+        self.previous: Dict[str, FileRecord] = {}
+        self.current: Dict[str, FileRecord] = {}
+        self.previous_fd: Optional[int] = None
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            output_size = self.output_path.stat().st_size
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Không dùng được manifest cũ: {e}")
+            return
+
+        if data.get("version") != MANIFEST_VERSION:
+            self.logger.debug("Manifest cũ khác phiên bản, bỏ qua.")
+            return
+        if data.get("output_size") != output_size:
+            self.logger.debug("File output đã thay đổi kể từ lần đóng gói trước.")
+            return
+
+        try:
+            self.previous_fd = os.open(self.output_path, os.O_RDONLY)
+        except OSError as e:
+            self.logger.debug(f"Không thể mở output cũ: {e}")
+            return
+
+        self.previous = data.get("files", {})
+        self.logger.debug(
+            f"Đã tải manifest với {len(self.previous)} file: {self.manifest_path.as_posix()}"
+        )
+
+    def _read_segment(self, record: FileRecord) -> Optional[str]:
+        if self.previous_fd is None:
+            return None
+        try:
+            segment = os.pread(self.previous_fd, record["length"], record["offset"])
+        except (OSError, KeyError, TypeError):
+            return None
+        if len(segment) != record["length"]:
+            return None
+        if hashlib.sha256(segment).hexdigest() != record.get("segment_sha256"):
+            return None
+        return segment.decode("utf-8")
+
+    def read_entry(
+        self, logger: logging.Logger, entry: FileResult
+    ) -> Tuple[Optional[str], str, str]:
+        file_path: Path = entry["path"]
+        rel_path: str = entry["rel_path"]
+        read_options: ReadOptions = entry["read_options"]
+
+        read_source = read_pack_file if self.transform_on_read else load_pack_source
+
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            return read_source(logger, file_path, read_options)
+
+        record: FileRecord = {
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns,
+            "options": _options_digest(
+                read_options, transform_fingerprint(logger, file_path, read_options)
+            ),
+        }
+        previous = self.previous.get(rel_path)
+        if previous is not None and (
+            record["options"] is None or previous.get("options") != record["options"]
+        ):
+            previous = None
+
+        if (
+            previous is not None
+            and previous.get("size") == record["size"]
+            and previous.get("mtime_ns") == record["mtime_ns"]
+        ):
+            content = self._read_segment(previous)
+            if content is not None:
+                record["sha256"] = previous["sha256"]
+                self.current[rel_path] = record
+                return content, "reused", ""
+
+        try:
+            raw = file_path.read_bytes()
+        except OSError:
+            return read_source(logger, file_path, read_options)
+
+        record["sha256"] = hashlib.sha256(raw).hexdigest()
+        self.current[rel_path] = record
+
+        if previous is not None and previous.get("sha256") == record["sha256"]:
+            content = self._read_segment(previous)
+            if content is not None:
+                return content, "reused", ""
+
+        return read_source(logger, file_path, read_options, raw=raw)
+
+    def record_segment(self, rel_path: str, offset: int, content: str) -> None:
+        record = self.current.get(rel_path)
+        if record is None:
+            return
+        segment = content.encode("utf-8")
+        record["offset"] = offset
+        record["length"] = len(segment)
+        record["segment_sha256"] = hashlib.sha256(segment).hexdigest()
+
+    def close_previous(self) -> None:
+        if self.previous_fd is not None:
+            os.close(self.previous_fd)
+            self.previous_fd = None
+
+    def save(self) -> None:
+        files = {
+            rel_path: record
+            for rel_path, record in self.current.items()
+            if "offset" in record
+        }
+        data = {
+            "version": MANIFEST_VERSION,
+            "output_size": self.output_path.stat().st_size,
+            "files": files,
+        }
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        temp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+
+
+def write_incremental_packed_content(
+    logger: logging.Logger,
+    output_path: Path,
+    file_entries: List[FileResult],
+    tree_str: str,
+    no_header: bool,
+    segment_callbacks: Optional[List[SegmentCallback]] = None,
+    executor_kind: str = EXECUTOR_THREAD,
+    jobs: Optional[int] = None,
+) -> Dict[str, Any]:
+    manifest = PackManifest(
+        logger, output_path, transform_on_read=executor_kind == EXECUTOR_THREAD
+    )
+    manifest.load()
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as output_file:
+            stats = write_packed_content(
+                logger=logger,
+                sink=output_file,
+                file_entries=file_entries,
+                tree_str=tree_str,
+                no_header=no_header,
+                read_func=manifest.read_entry,
+                segment_callbacks=[manifest.record_segment, *(segment_callbacks or [])],
+                executor_kind=executor_kind,
+                jobs=jobs,
+            )
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        manifest.close_previous()
+
+    manifest.save()
+    logger.debug(f"Đã ghi manifest: {manifest.manifest_path.as_posix()}")
+    return stats
@@ -0,0 +1,98 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_prefetch.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.constants import MAX_THREAD_WORKERS
+from utils.core import submit_as_arrived
+
+from ..pack_code_config import PREFETCH_MAX_BYTES
+from .pack_code_loader import load_pack_source, read_pack_file
+
+__all__ = ["PrefetchReader"]
+
+FileResult = Dict[str, Any]
+ReadOutcome = Tuple[Optional[str], str, str]
+
+
+class PrefetchReader:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        transform_on_read: bool = True,
+        fallback: Optional[Any] = None,
+        max_workers: Optional[int] = None,
+        max_bytes: int = PREFETCH_MAX_BYTES,
+    ):
+        self.logger = logger
+        self.transform_on_read = transform_on_read
+        self.fallback = fallback
+        self.max_workers = max_workers or MAX_THREAD_WORKERS
+        self.max_bytes = max_bytes
+        self.buffered: Dict[Path, ReadOutcome] = {}
+        self.buffered_bytes = 0
+        self.prefetched_count = 0
+        self.lock = threading.Lock()
+
+    def _read(self, logger: logging.Logger, entry: FileResult) -> ReadOutcome:
+        if self.fallback is not None:
+            return self.fallback.read_entry(logger, entry)
+        read_source = read_pack_file if self.transform_on_read else load_pack_source
+        return read_source(logger, entry["path"], entry["read_options"])
+
+    def read_while_scanning(
+        self, paths: Iterable[Path], entry_for: Callable[[Path], FileResult]
+    ) -> List[FileResult]:
+        entries: Dict[Path, FileResult] = {}
+        remaining = iter(paths)
+
+        def _admitted() -> Iterator[Path]:
+            for path in remaining:
+                entries[path] = entry_for(path)
+                yield path
+                if self.buffered_bytes >= self.max_bytes:
+                    return
+
+        def _read_path(path: Path) -> ReadOutcome:
+            return self._read(self.logger, entries[path])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for path, future in submit_as_arrived(
+                executor, _read_path, _admitted(), max_in_flight=self.max_workers * 4
+            ):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Đọc trước thất bại, sẽ đọc lại: {e}")
+                    continue
+                with self.lock:
+                    self.buffered[path] = outcome
+                    self.buffered_bytes += len(outcome[0] or "")
+                    self.prefetched_count += 1
+
+        for path in remaining:
+            entries[path] = entry_for(path)
+
+        self.logger.debug(
+            f"Đã đọc trước {self.prefetched_count}/{len(entries)} file trong lúc quét "
+            f"(bộ đệm {self.buffered_bytes} ký tự)."
+        )
+        return list(entries.values())
+
+    def read_entry(self, logger: logging.Logger, entry: FileResult) -> ReadOutcome:
+        with self.lock:
+            outcome = self.buffered.pop(entry["path"], None)
+            if outcome is not None:
+                self.buffered_bytes -= len(outcome[0] or "")
+        if outcome is not None:
+            return outcome
+        return self._read(logger, entry)
+
+    def close(self) -> None:
+        with self.lock:
+            self.buffered.clear()
+            self.buffered_bytes = 0
+        if self.fallback is not None:
+            self.fallback.close()
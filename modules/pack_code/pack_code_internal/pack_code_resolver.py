@@ -1,14 +1,16 @@
 # Path: modules/pack_code/pack_code_internal/pack_code_resolver.py
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     import pathspec
 
 from utils.core import (
+    ScanContext,
     compile_spec_from_patterns,
     get_submodule_paths,
+    is_extension_matched,
     parse_gitignore,
     resolve_config_list,
     resolve_config_value,
@@ -24,7 +26,7 @@ from ..pack_code_config import (
     DEFAULT_OUTPUT_DIR,
 )
 
-__all__ = ["resolve_filters", "resolve_output_path"]
+__all__ = ["resolve_filters", "build_relative_path_filter", "resolve_output_path"]
 
 
 def resolve_filters(
@@ -129,6 +131,42 @@ def resolve_filters(
     )
 
 
+def build_relative_path_filter(
+    base_dir: Path,
+    ext_filter_set: Optional[Set[str]],
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+) -> Callable[[str], bool]:
+    scan_context = ScanContext(base_dir)
+    dir_excluded: Dict[str, bool] = {"": False}
+
+    def is_dir_excluded(dir_rel: str) -> bool:
+        cached = dir_excluded.get(dir_rel)
+        if cached is not None:
+            return cached
+        excluded = is_dir_excluded(
+            dir_rel.rpartition("/")[0]
+        ) or scan_context.is_matched(dir_rel, True, ignore_spec)
+        dir_excluded[dir_rel] = excluded
+        return excluded
+
+    def passes(rel_path: str) -> bool:
+        parent_rel, _, file_name = rel_path.rpartition("/")
+        if is_dir_excluded(parent_rel):
+            return False
+        if scan_context.is_matched(rel_path, False, ignore_spec):
+            return False
+        if include_spec and not scan_context.is_matched(rel_path, False, include_spec):
+            return False
+        if ext_filter_set is not None and not is_extension_matched(
+            Path(file_name), ext_filter_set
+        ):
+            return False
+        return True
+
+    return passes
+
+
 def resolve_output_path(
     logger: logging.Logger,
     cli_args: Dict[str, Any],
@@ -0,0 +1,226 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_revision.py
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.core import run_command, stream_command
+
+from .pack_code_loader import (
+    build_read_options,
+    load_config_files,
+    load_pack_source,
+    read_pack_file,
+)
+from .pack_code_resolver import build_relative_path_filter, resolve_filters
+
+__all__ = [
+    "GitBlobReader",
+    "resolve_revision_tree",
+    "iter_revision_files",
+    "process_pack_code_task_rev",
+]
+
+FileResult = Dict[str, Any]
+RevisionFile = Tuple[str, str]
+
+SKIPPED_GIT_MODES = frozenset({"120000", "160000"})
+
+
+def resolve_revision_tree(logger: logging.Logger, repo_root: Path, rev: str) -> str:
+    success, output = run_command(
+        ["git", "rev-parse", "--verify", "--end-of-options", f"{rev}^{{tree}}"],
+        logger,
+        description="Phân giải revision Git",
+        cwd=repo_root,
+    )
+    if not success or not output.strip():
+        raise ValueError(f"Không tìm thấy revision Git: {rev}")
+    return output.strip()
+
+
+def iter_revision_files(
+    logger: logging.Logger, repo_root: Path, tree_id: str, prefix: str
+) -> Iterator[RevisionFile]:
+    command = ["git", "ls-tree", "-r", "-z", "--full-tree", tree_id]
+    if prefix:
+        command.extend(["--", prefix])
+
+    for record in stream_command(
+        command, logger, description="Liệt kê file bằng git ls-tree", cwd=repo_root
+    ):
+        meta, sep, path = record.partition("\t")
+        if not sep:
+            continue
+        mode, object_type, object_id = meta.split(" ")
+        if object_type != "blob" or mode in SKIPPED_GIT_MODES:
+            continue
+        yield path, object_id
+
+
+class GitBlobReader:
+    def __init__(
+        self, logger: logging.Logger, repo_root: Path, transform_on_read: bool = True
+    ):
+        self.logger = logger
+        self.repo_root = repo_root
+        self.transform_on_read = transform_on_read
+        self.process: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self.process is None:
+            self.logger.debug(
+                f"Khởi động 'git cat-file --batch' trong {self.repo_root.as_posix()}"
+            )
+            self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_root,
+            )
+        return self.process
+
+    def read_blob(self, object_id: str) -> bytes:
+        with self.lock:
+            process = self._ensure_process()
+            assert process.stdin is not None and process.stdout is not None
+
+            process.stdin.write(object_id.encode("ascii") + b"\n")
+            process.stdin.flush()
+
+            header = process.stdout.readline().decode("ascii", "replace").split()
+            if len(header) != 3:
+                raise ValueError(f"git cat-file không trả về object {object_id}")
+            size = int(header[2])
+            data = process.stdout.read(size)
+            process.stdout.read(1)
+
+        if len(data) != size:
+            raise OSError(f"git cat-file trả về thiếu dữ liệu cho {object_id}")
+        return data
+
+    def read_entry(
+        self, logger: logging.Logger, entry: FileResult
+    ) -> Tuple[Optional[str], str, str]:
+        try:
+            raw = self.read_blob(entry["git_object"])
+        except (OSError, ValueError) as e:
+            return (
+                None,
+                "skipped",
+                f"   -> Bỏ qua (lỗi đọc từ Git: {e}): {entry['rel_path']}",
+            )
+
+        read_source = read_pack_file if self.transform_on_read else load_pack_source
+        return read_source(logger, entry["path"], entry["read_options"], raw=raw)
+
+    def close(self) -> None:
+        with self.lock:
+            process = self.process
+            self.process = None
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+
+def _relative_to_prefix(path: str, prefix: str) -> str:
+    return path[len(prefix) + 1 :] if prefix else path
+
+
+def process_pack_code_task_rev(
+    target_path: Path,
+    cli_args: Dict[str, Any],
+    logger: logging.Logger,
+    repo_root: Path,
+    tree_id: str,
+    processed_paths: Set[str],
+    reporting_root: Optional[Path],
+) -> List[FileResult]:
+    rev: str = cli_args["rev"]
+    try:
+        prefix = target_path.relative_to(repo_root).as_posix()
+    except ValueError:
+        logger.warning(
+            f"⚠️ Bỏ qua '{target_path.as_posix()}': không nằm trong repo {repo_root.as_posix()}"
+        )
+        return []
+    prefix = "" if prefix == "." else prefix
+
+    logger.info(f"--- 🏷️ Quét '{prefix or '.'}' tại revision {rev} ---")
+
+    revision_files = list(iter_revision_files(logger, repo_root, tree_id, prefix))
+    if not revision_files:
+        logger.info(f"  -> 🤷 Không tìm thấy '{prefix or '.'}' tại revision {rev}.")
+        logger.info("")
+        return []
+
+    is_single_file = len(revision_files) == 1 and revision_files[0][0] == prefix
+    base_prefix = prefix.rpartition("/")[0] if is_single_file else prefix
+    base_dir = repo_root / base_prefix if base_prefix else repo_root
+
+    file_config = load_config_files(base_dir, logger)
+    (
+        ext_filter_set,
+        ignore_spec,
+        include_spec,
+        _,
+        clean_extensions_set,
+        format_extensions_set,
+    ) = resolve_filters(logger, cli_args, file_config, base_dir)
+
+    passes_filter = build_relative_path_filter(
+        base_dir, ext_filter_set, ignore_spec, include_spec
+    )
+
+    read_options = build_read_options(
+        base_dir=base_dir,
+        all_clean=cli_args.get("all_clean", False),
+        clean_extensions_set=clean_extensions_set,
+        format_flag=cli_args.get("format", False),
+        format_extensions_set=format_extensions_set,
+    )
+
+    final_results: List[FileResult] = []
+    for repo_rel, object_id in revision_files:
+        if repo_rel in processed_paths:
+            continue
+
+        if not passes_filter(_relative_to_prefix(repo_rel, base_prefix)):
+            continue
+
+        processed_paths.add(repo_rel)
+        file_path = repo_root / repo_rel
+        if reporting_root:
+            try:
+                report_rel = file_path.relative_to(reporting_root).as_posix()
+            except ValueError:
+                report_rel = file_path.as_posix()
+        else:
+            report_rel = file_path.as_posix()
+
+        final_results.append(
+            {
+                "path": file_path,
+                "rel_path": report_rel,
+                "read_options": read_options,
+                "git_object": object_id,
+            }
+        )
+
+    logger.info(
+        f"  -> ⚡ {len(revision_files)} file tại revision, {len(final_results)} file khớp tiêu chí."
+    )
+    logger.info("")
+    return final_results
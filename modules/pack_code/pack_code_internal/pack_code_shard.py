@@ -0,0 +1,310 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_shard.py
+import glob
+import logging
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.constants import EXECUTOR_THREAD, MAX_THREAD_WORKERS
+
+from ..pack_code_config import CHARS_PER_TOKEN, SHARD_INDEX_WIDTH
+from .pack_code_builder import (
+    TREE_SEPARATOR,
+    EntryReader,
+    PackedContentWriter,
+    iter_contents_in_order,
+)
+from .pack_code_tree import generate_tree_string
+
+__all__ = [
+    "ShardBudget",
+    "estimate_tokens",
+    "shard_output_path",
+    "write_sharded_content",
+]
+
+FileResult = Dict[str, Any]
+Cost = Tuple[int, int]
+TreeNode = Tuple[str, ...]
+
+TREE_LINE_INDENT = "│   "
+TREE_LINE_POINTER = "├── "
+MULTI_ROOT_TREE_HEADER = "[Không thể tạo cây: Nhiều gốc báo cáo]"
+PART_LABEL_PLACEHOLDER = " (part 999999/999999)"
+
+
+def estimate_tokens(text: str, byte_length: Optional[int] = None) -> int:
+    if byte_length is None:
+        byte_length = len(text.encode("utf-8", "surrogatepass"))
+    return math.ceil(len(text) / CHARS_PER_TOKEN) + (byte_length - len(text)) // 2
+
+
+def _add_cost(left: Cost, right: Cost) -> Cost:
+    return left[0] + right[0], left[1] + right[1]
+
+
+class ShardBudget:
+    def __init__(self, max_tokens: Optional[int], max_bytes: Optional[int]):
+        self.max_tokens = max_tokens
+        self.max_bytes = max_bytes
+
+    def measure(self, text: str, joined: bool = True) -> Cost:
+        byte_length = len(text.encode("utf-8", "surrogatepass"))
+        return (
+            estimate_tokens(text, byte_length),
+            byte_length + (1 if joined else 0),
+        )
+
+    def measure_pieces(self, pieces: List[str]) -> Cost:
+        total: Cost = (0, 0)
+        for piece in pieces:
+            total = _add_cost(total, self.measure(piece))
+        return total
+
+    def fits(self, cost: Cost) -> bool:
+        tokens, byte_length = cost
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            return False
+        if self.max_bytes is not None and byte_length > self.max_bytes:
+            return False
+        return True
+
+    def describe(self) -> str:
+        limits: List[str] = []
+        if self.max_tokens is not None:
+            limits.append(f"~{self.max_tokens} token")
+        if self.max_bytes is not None:
+            limits.append(f"{self.max_bytes} byte")
+        return ", ".join(limits)
+
+
+class _Shard:
+    def __init__(
+        self, budget: ShardBudget, reporting_root: Optional[Path], no_tree: bool
+    ):
+        self.budget = budget
+        self.reporting_root = reporting_root
+        self.no_tree = no_tree
+        self.entries: List[FileResult] = []
+        self.pieces: List[str] = []
+        self.tree_nodes: Set[TreeNode] = set()
+        self.cost: Cost = (0, 0)
+
+        if not no_tree:
+            if reporting_root is None:
+                root_line = MULTI_ROOT_TREE_HEADER
+            else:
+                root_line = f"{reporting_root.name or '/'}/"
+            self.cost = _add_cost(
+                budget.measure(root_line), budget.measure(TREE_SEPARATOR)
+            )
+
+    def tree_cost(self, rel_path: str) -> Tuple[Cost, List[TreeNode]]:
+        if self.no_tree:
+            return (0, 0), []
+        if self.reporting_root is None:
+            node: TreeNode = (rel_path,)
+            if node in self.tree_nodes:
+                return (0, 0), []
+            return self.budget.measure(rel_path), [node]
+
+        parts = Path(rel_path).parts
+        cost: Cost = (0, 0)
+        new_nodes: List[TreeNode] = []
+        for depth, name in enumerate(parts):
+            node = parts[: depth + 1]
+            if node in self.tree_nodes:
+                continue
+            new_nodes.append(node)
+            line = f"{TREE_LINE_INDENT * depth}{TREE_LINE_POINTER}{name}/"
+            cost = _add_cost(cost, self.budget.measure(line))
+        return cost, new_nodes
+
+    def add(
+        self,
+        entry: FileResult,
+        pieces: List[str],
+        cost: Cost,
+        tree_nodes: List[TreeNode],
+    ) -> None:
+        self.entries.append(entry)
+        self.pieces.extend(pieces)
+        self.tree_nodes.update(tree_nodes)
+        self.cost = _add_cost(self.cost, cost)
+
+
+def _file_pieces(
+    rel_path: str, content: str, no_header: bool, part: Optional[Tuple[int, int]]
+) -> List[str]:
+    if no_header:
+        return [content]
+    label = rel_path if part is None else f"{rel_path} (part {part[0]}/{part[1]})"
+    return [
+        f"[[START_FILE_CONTENT: {label}]]",
+        content,
+        f"[[END_FILE_CONTENT: {label}]]",
+        "\n",
+    ]
+
+
+def _split_content(
+    logger: logging.Logger,
+    rel_path: str,
+    content: str,
+    budget: ShardBudget,
+    fixed_cost: Cost,
+) -> List[str]:
+    chunks: List[str] = []
+    current_lines: List[str] = []
+    current_cost = fixed_cost
+    oversized_lines = 0
+
+    for line in content.splitlines(keepends=True):
+        line_cost = budget.measure(line, joined=False)
+        if current_lines and not budget.fits(_add_cost(current_cost, line_cost)):
+            chunks.append("".join(current_lines))
+            current_lines = []
+            current_cost = fixed_cost
+        if not current_lines and not budget.fits(_add_cost(current_cost, line_cost)):
+            oversized_lines += 1
+        current_lines.append(line)
+        current_cost = _add_cost(current_cost, line_cost)
+
+    if current_lines or not chunks:
+        chunks.append("".join(current_lines))
+
+    if oversized_lines:
+        logger.warning(
+            f"⚠️ '{rel_path}' có {oversized_lines} dòng vượt quá giới hạn shard; "
+            "các dòng này được giữ nguyên trong shard riêng."
+        )
+    return chunks
+
+
+def shard_output_path(output_path: Path, index: int) -> Path:
+    return output_path.with_name(
+        f"{output_path.stem}.{index:0{SHARD_INDEX_WIDTH}d}{output_path.suffix}"
+    )
+
+
+def _remove_stale_shards(
+    logger: logging.Logger, output_path: Path, shard_count: int
+) -> None:
+    pattern = (
+        f"{glob.escape(output_path.stem)}."
+        f"{'[0-9]' * SHARD_INDEX_WIDTH}{glob.escape(output_path.suffix)}"
+    )
+    for candidate in output_path.parent.glob(pattern):
+        index_str = candidate.name[len(output_path.stem) + 1 :][:SHARD_INDEX_WIDTH]
+        if int(index_str) > shard_count:
+            logger.debug(f"Xóa shard cũ: {candidate.as_posix()}")
+            candidate.unlink()
+
+
+def _write_shard(shard: _Shard, shard_path: Path) -> Dict[str, Any]:
+    with shard_path.open("w", encoding="utf-8") as shard_file:
+        writer = PackedContentWriter(shard_file)
+        if not shard.no_tree:
+            writer.write_piece(
+                generate_tree_string(shard.entries, shard.reporting_root)
+            )
+            writer.write_piece(TREE_SEPARATOR)
+        for piece in shard.pieces:
+            writer.write_piece(piece)
+        writer.close()
+
+    return {
+        "path": shard_path,
+        "files": len({entry["rel_path"] for entry in shard.entries}),
+        "tokens": shard.cost[0],
+        "bytes": shard_path.stat().st_size,
+    }
+
+
+def write_sharded_content(
+    logger: logging.Logger,
+    output_path: Path,
+    file_entries: List[FileResult],
+    reporting_root: Optional[Path],
+    no_tree: bool,
+    no_header: bool,
+    budget: ShardBudget,
+    window_size: Optional[int] = None,
+    read_func: Optional[EntryReader] = None,
+    executor_kind: str = EXECUTOR_THREAD,
+    jobs: Optional[int] = None,
+) -> Dict[str, Any]:
+    window_size = window_size or MAX_THREAD_WORKERS * 4
+    stats: Dict[str, Any] = {
+        "written": 0,
+        "cleaned": 0,
+        "formatted": 0,
+        "skipped_messages": [],
+        "shards": [],
+    }
+
+    logger.info(
+        f"Đang đọc {len(file_entries)} file và chia thành các shard (giới hạn: {budget.describe()})..."
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    shard = _Shard(budget, reporting_root, no_tree)
+
+    def _flush_shard() -> _Shard:
+        if shard.entries:
+            shard_path = shard_output_path(output_path, len(stats["shards"]) + 1)
+            stats["shards"].append(_write_shard(shard, shard_path))
+        return _Shard(budget, reporting_root, no_tree)
+
+    for entry, content, status, log_msg in iter_contents_in_order(
+        logger, file_entries, window_size, read_func, executor_kind, jobs
+    ):
+        if status == "skipped":
+            stats["skipped_messages"].append(log_msg)
+            continue
+        if status in ("cleaned", "formatted"):
+            stats[status] += 1
+
+        rel_path: str = entry["rel_path"]
+        pieces = _file_pieces(rel_path, content, no_header, None)
+        pieces_cost = budget.measure_pieces(pieces)
+
+        tree_cost, tree_nodes = shard.tree_cost(rel_path)
+        block_cost = _add_cost(tree_cost, pieces_cost)
+        if shard.entries and not budget.fits(_add_cost(shard.cost, block_cost)):
+            shard = _flush_shard()
+            tree_cost, tree_nodes = shard.tree_cost(rel_path)
+            block_cost = _add_cost(tree_cost, pieces_cost)
+
+        if budget.fits(_add_cost(shard.cost, block_cost)):
+            shard.add(entry, pieces, block_cost, tree_nodes)
+            stats["written"] += 1
+            continue
+
+        label_pieces = _file_pieces(
+            rel_path + PART_LABEL_PLACEHOLDER, "", no_header, None
+        )
+        fixed_cost = _add_cost(
+            _add_cost(shard.cost, tree_cost), budget.measure_pieces(label_pieces)
+        )
+        chunks = _split_content(logger, rel_path, content, budget, fixed_cost)
+        logger.debug(f"Chia '{rel_path}' thành {len(chunks)} phần theo dòng.")
+
+        for part_index, chunk in enumerate(chunks, start=1):
+            if part_index > 1:
+                shard = _flush_shard()
+            part_pieces = _file_pieces(
+                rel_path, chunk, no_header, (part_index, len(chunks))
+            )
+            tree_cost, tree_nodes = shard.tree_cost(rel_path)
+            shard.add(
+                entry,
+                part_pieces,
+                _add_cost(tree_cost, budget.measure_pieces(part_pieces)),
+                tree_nodes,
+            )
+        stats["written"] += 1
+
+    _flush_shard()
+    _remove_stale_shards(logger, output_path, len(stats["shards"]))
+    return stats
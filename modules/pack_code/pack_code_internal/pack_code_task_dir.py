@@ -7,9 +7,11 @@ if TYPE_CHECKING:
     pass
 
 
-from utils.core import scan_directory_recursive
+from utils.constants import DEFAULT_SCAN_BACKEND
+from utils.core import PathStream, stream_directory_recursive
 
-from . import load_config_files, load_files_content, resolve_filters
+from . import build_read_options, load_config_files, resolve_filters
+from .pack_code_prefetch import PrefetchReader
 
 __all__ = ["process_pack_code_task_dir"]
 
@@ -23,6 +25,7 @@ def process_pack_code_task_dir(
     processed_files: Set[Path],
     reporting_root: Optional[Path],
     script_file_path: Path,
+    prefetcher: Optional[PrefetchReader] = None,
 ) -> List[FileResult]:
     logger.info(f"--- 📁 Quét thư mục: {scan_dir.name} ---")
 
@@ -49,7 +52,7 @@ def process_pack_code_task_dir(
     logger.info(f"    - Clean Extensions (-a): {sorted(list(clean_extensions_set))}")
     logger.info(f"    - Format Extensions (-f): {sorted(list(format_extensions_set))}")
 
-    files_to_pack = scan_directory_recursive(
+    files_to_pack = stream_directory_recursive(
         logger=logger,
         directory=scan_dir,
         scan_root=scan_dir,
@@ -58,10 +61,38 @@ def process_pack_code_task_dir(
         prune_spec=None,
         extensions_filter=ext_filter_set,
         submodule_paths=submodule_paths,
+        use_scan_cache=cli_args.get("scan_cache", False),
+        scan_backend=cli_args.get("scan_backend", DEFAULT_SCAN_BACKEND),
+        respect_gitignore=not cli_args.get("no_gitignore", False),
+    )
+    read_options = build_read_options(
+        base_dir=scan_dir,
+        all_clean=cli_args.get("all_clean", False),
+        clean_extensions_set=clean_extensions_set,
+        format_flag=cli_args.get("format", False),
+        format_extensions_set=format_extensions_set,
     )
-    files_to_pack.sort(key=lambda p: p.as_posix())
 
-    if not files_to_pack:
+    def _file_entry(f_path: Path) -> FileResult:
+        rel_path: str
+        if reporting_root:
+            try:
+                rel_path = f_path.relative_to(reporting_root).as_posix()
+            except ValueError:
+                rel_path = f_path.as_posix()
+        else:
+            rel_path = f_path.as_posix()
+
+        return {"path": f_path, "rel_path": rel_path, "read_options": read_options}
+
+    path_stream = PathStream(files_to_pack, processed_files)
+    if prefetcher is not None:
+        final_results = prefetcher.read_while_scanning(path_stream, _file_entry)
+    else:
+        final_results = [_file_entry(f_path) for f_path in path_stream]
+    final_results.sort(key=lambda entry: entry["path"].as_posix())
+
+    if not path_stream.found_count:
         logger.info(
             f"  -> 🤷 Không tìm thấy file nào khớp tiêu chí trong: {scan_dir.name}"
         )
@@ -69,14 +100,9 @@ def process_pack_code_task_dir(
         logger.info("")
         return []
 
-    logger.info(f"  -> ⚡ Tìm thấy {len(files_to_pack)} file, đang phân tích...")
-
-    unique_files_to_pack = []
-    for f in files_to_pack:
-        if f.resolve() not in processed_files:
-            unique_files_to_pack.append(f)
+    logger.info(f"  -> ⚡ Tìm thấy {path_stream.found_count} file, đang phân tích...")
 
-    if not unique_files_to_pack:
+    if not final_results:
         logger.info(
             "  -> ✅ Tất cả file trong thư mục này đã được xử lý (do là file input riêng lẻ)."
         )
@@ -84,36 +110,6 @@ def process_pack_code_task_dir(
         logger.info("")
         return []
 
-    files_content = load_files_content(
-        logger=logger,
-        file_paths=unique_files_to_pack,
-        base_dir=scan_dir,
-        all_clean=cli_args.get("all_clean", False),
-        clean_extensions_set=clean_extensions_set,
-        format_flag=cli_args.get("format", False),
-        format_extensions_set=format_extensions_set,
-    )
-
-    final_results: List[FileResult] = []
-
-    for f_path in unique_files_to_pack:
-        if f_path in files_content:
-            f_content = files_content[f_path]
-
-            rel_path: str
-            if reporting_root:
-                try:
-                    rel_path = f_path.relative_to(reporting_root).as_posix()
-                except ValueError:
-                    rel_path = f_path.as_posix()
-            else:
-                rel_path = f_path.as_posix()
-
-            final_results.append(
-                {"path": f_path, "content": f_content, "rel_path": rel_path}
-            )
-            processed_files.add(f_path.resolve())
-
     logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
     logger.info("")
 
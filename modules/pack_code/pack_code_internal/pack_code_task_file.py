@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Set
 
 from utils.core import is_extension_matched, is_path_matched
 
-from . import load_config_files, load_files_content, resolve_filters
+from . import build_read_options, load_config_files, resolve_filters
 
 __all__ = ["process_pack_code_task_file"]
 
@@ -65,9 +65,7 @@ def process_pack_code_task_file(
 
     logger.info("  -> ⚡ Phân tích 1 file...")
 
-    files_content = load_files_content(
-        logger=logger,
-        file_paths=files_to_pack,
+    read_options = build_read_options(
         base_dir=scan_dir,
         all_clean=cli_args.get("all_clean", False),
         clean_extensions_set=clean_extensions_set,
@@ -78,7 +76,7 @@ def process_pack_code_task_file(
     processed_files.add(resolved_file)
     final_results: List[FileResult] = []
 
-    for f_path, f_content in files_content.items():
+    for f_path in files_to_pack:
         rel_path: str
         if reporting_root:
             try:
@@ -89,7 +87,7 @@ def process_pack_code_task_file(
             rel_path = f_path.as_posix()
 
         final_results.append(
-            {"path": f_path, "content": f_content, "rel_path": rel_path}
+            {"path": f_path, "rel_path": rel_path, "read_options": read_options}
         )
 
     logger.info(f"--- ✅ Kết thúc {file_path.name} ---")
@@ -1,16 +1,72 @@
 # Path: modules/pack_code/pack_code_internal/pack_code_tree.py
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 __all__ = ["generate_tree_string"]
 
 FileResult = Dict[str, Any]
+PathTrie = Dict[str, "PathTrie"]
 
 
 logger = logging.getLogger(__name__)
 
 
+def _is_anchor(component: str) -> bool:
+    return Path(component).anchor == component
+
+
+def _build_path_trie(rel_paths: Set[str]) -> PathTrie:
+    trie: PathTrie = {}
+    for rel_path_str in rel_paths:
+        node = trie
+        for component in Path(rel_path_str).parts:
+            node = node.setdefault(component, {})
+    return trie
+
+
+def _iter_children(
+    node: PathTrie, is_root: bool
+) -> Iterator[Tuple[str, bool, PathTrie]]:
+    names = sorted(node)
+
+    if is_root:
+        last_in_group: Dict[bool, str] = {}
+        for name in names:
+            last_in_group[_is_anchor(name)] = name
+        for name in names:
+            yield name, last_in_group[_is_anchor(name)] == name, node[name]
+        return
+
+    last_name = names[-1]
+    for name in names:
+        yield name, name == last_name, node[name]
+
+
+def _render_path_trie(trie: PathTrie, tree_lines: List[str]) -> None:
+    stack: List[Iterator[Tuple[str, bool, PathTrie]]] = [_iter_children(trie, True)]
+    prefixes: List[str] = []
+
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            if prefixes:
+                prefixes.pop()
+            continue
+
+        name, is_last, children = entry
+        pointer = "└── " if is_last else "├── "
+        display_name = "" if _is_anchor(name) else name
+        tree_lines.append(
+            f"{''.join(prefixes)}{pointer}{display_name}{'/' if children else ''}"
+        )
+
+        if children:
+            prefixes.append("    " if is_last else "│   ")
+            stack.append(_iter_children(children, False))
+
+
 def generate_tree_string(
     all_file_results: List[FileResult], reporting_root: Optional[Path]
 ) -> str:
@@ -40,45 +96,10 @@ def generate_tree_string(
 
     tree_lines.append(f"{root_display}/")
 
-    all_relative_parts: Set[Path] = set()
-    for rel_path_str in all_relative_paths_str:
-        rel_p = Path(rel_path_str)
-        all_relative_parts.add(rel_p)
-        for parent in rel_p.parents:
-            if parent != Path("."):
-                all_relative_parts.add(parent)
-
-    if not all_relative_parts:
+    trie = _build_path_trie(all_relative_paths_str)
+    if not trie:
         return "\n".join(tree_lines)
 
-    sorted_parts = sorted(list(all_relative_parts), key=lambda p: p.parts)
-    level_prefixes: Dict[int, str] = {}
-
-    for i, part in enumerate(sorted_parts):
-        level = len(part.parts) - 1
-        prefix = "".join(
-            level_prefixes.get(level_index, "    ") for level_index in range(level)
-        )
-
-        siblings = [
-            p
-            for p in sorted_parts
-            if p.parent == part.parent and len(p.parts) == len(part.parts)
-        ]
-        is_last = part == siblings[-1]
-        pointer = "└── " if is_last else "├── "
-
-        is_directory = any(p.parent == part for p in sorted_parts)
-
-        line = f"{prefix}{pointer}{part.name}{'/' if is_directory else ''}"
-        tree_lines.append(line)
-
-        if is_directory:
-            level_prefixes[level] = "    " if is_last else "│   "
-        elif is_last:
-
-            keys_to_remove = [k for k in level_prefixes if k >= level]
-            for k in keys_to_remove:
-                del level_prefixes[k]
+    _render_path_trie(trie, tree_lines)
 
     return "\n".join(tree_lines)
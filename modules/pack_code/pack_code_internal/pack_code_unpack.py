@@ -0,0 +1,218 @@
+# Path: modules/pack_code/pack_code_internal/pack_code_unpack.py
+import fnmatch
+import json
+import logging
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from utils.constants import MAX_THREAD_WORKERS
+
+from ..pack_code_config import INDEX_SUFFIX, INDEX_VERSION
+from .pack_code_shard import shard_output_path
+
+__all__ = ["PackIndex", "PackArchive", "index_path_for", "resolve_pack_paths"]
+
+IndexEntry = Tuple[str, int, int]
+Segment = Tuple[int, mmap.mmap, int, int]
+
+START_MARKER_RE = re.compile(rb"\[\[START_FILE_CONTENT: (.+?)\]\]\n")
+PART_LABEL_RE = re.compile(r"^(.*) \(part (\d+)/(\d+)\)$")
+
+
+def index_path_for(pack_path: Path) -> Path:
+    return pack_path.with_name(pack_path.name + INDEX_SUFFIX)
+
+
+def resolve_pack_paths(pack_path: Path) -> List[Path]:
+    if pack_path.is_file():
+        return [pack_path]
+
+    shard_paths: List[Path] = []
+    while True:
+        shard_path = shard_output_path(pack_path, len(shard_paths) + 1)
+        if not shard_path.is_file():
+            return shard_paths
+        shard_paths.append(shard_path)
+
+
+class PackIndex:
+    def __init__(self):
+        self.files: List[IndexEntry] = []
+
+    def record_segment(self, rel_path: str, offset: int, content: str) -> None:
+        self.files.append((rel_path, offset, len(content.encode("utf-8"))))
+
+    def save(self, pack_path: Path) -> Path:
+        index_path = index_path_for(pack_path)
+        data = {
+            "version": INDEX_VERSION,
+            "pack_size": pack_path.stat().st_size,
+            "files": [list(entry) for entry in self.files],
+        }
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, index_path)
+        return index_path
+
+
+def _split_part_label(label: str) -> Tuple[str, int]:
+    match = PART_LABEL_RE.match(label)
+    if match is None:
+        return label, 1
+    return match.group(1), int(match.group(2))
+
+
+def _safe_target(dest_dir: Path, rel_path: str) -> Optional[Path]:
+    pure_path = PurePosixPath(rel_path)
+    if pure_path.is_absolute() or ".." in pure_path.parts or not pure_path.parts:
+        return None
+    return dest_dir.joinpath(*pure_path.parts)
+
+
+class PackArchive:
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self.segments: Dict[str, List[Segment]] = {}
+        self._handles: List[BinaryIO] = []
+        self._maps: List[mmap.mmap] = []
+
+    def __enter__(self) -> "PackArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add_pack(self, pack_path: Path) -> None:
+        handle = pack_path.open("rb")
+        pack_size = os.fstat(handle.fileno()).st_size
+        if pack_size == 0:
+            handle.close()
+            self.logger.warning(f"⚠️ File pack rỗng: {pack_path.as_posix()}")
+            return
+
+        pack_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._handles.append(handle)
+        self._maps.append(pack_map)
+
+        entries = self._load_index(pack_path, pack_size)
+        if entries is None:
+            self.logger.debug(
+                f"Không có index hợp lệ, quét marker trong {pack_path.as_posix()}..."
+            )
+            entries = self._scan_markers(pack_map)
+
+        for label, offset, length in entries:
+            rel_path, part = _split_part_label(label)
+            length = max(0, min(length, pack_size - offset))
+            self.segments.setdefault(rel_path, []).append(
+                (part, pack_map, offset, length)
+            )
+
+    def _load_index(
+        self, pack_path: Path, pack_size: int
+    ) -> Optional[List[IndexEntry]]:
+        index_path = index_path_for(pack_path)
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != INDEX_VERSION or data.get("pack_size") != pack_size:
+            self.logger.debug(f"Index không khớp với pack: {index_path.as_posix()}")
+            return None
+
+        self.logger.debug(f"Sử dụng index: {index_path.as_posix()}")
+        return [(label, offset, length) for label, offset, length in data["files"]]
+
+    @staticmethod
+    def _scan_markers(pack_map: mmap.mmap) -> List[IndexEntry]:
+        entries: List[IndexEntry] = []
+        position = 0
+        while True:
+            match = START_MARKER_RE.search(pack_map, position)
+            if match is None:
+                return entries
+
+            label = match.group(1)
+            end_marker = b"\n[[END_FILE_CONTENT: " + label + b"]]"
+            end = pack_map.find(end_marker, match.end())
+            if end == -1:
+                position = match.end()
+                continue
+
+            entries.append((label.decode("utf-8"), match.end(), end - match.end()))
+            position = end + len(end_marker)
+
+    def match(self, patterns: List[str]) -> List[str]:
+        all_paths = sorted(self.segments)
+        if not patterns:
+            return all_paths
+
+        matched: Dict[str, None] = {}
+        for pattern in patterns:
+            if pattern in self.segments:
+                matched[pattern] = None
+                continue
+            hits = fnmatch.filter(all_paths, pattern)
+            if not hits:
+                self.logger.warning(f"⚠️ Không tìm thấy file nào khớp: {pattern}")
+            for hit in hits:
+                matched[hit] = None
+        return list(matched)
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        parts = sorted(self.segments[rel_path], key=lambda segment: segment[0])
+        return b"".join(
+            pack_map[offset : offset + length] for _, pack_map, offset, length in parts
+        )
+
+    def _extract_one(self, rel_path: str, dest_dir: Path, force: bool) -> str:
+        target = _safe_target(dest_dir, rel_path)
+        if target is None:
+            return "unsafe"
+        if target.exists() and not force:
+            return "exists"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(self.read_bytes(rel_path))
+        return "written"
+
+    def extract_to(
+        self,
+        rel_paths: List[str],
+        dest_dir: Path,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, int]:
+        counts = {"written": 0, "exists": 0, "unsafe": 0}
+        with ThreadPoolExecutor(
+            max_workers=max_workers or MAX_THREAD_WORKERS
+        ) as executor:
+            results = executor.map(
+                lambda rel_path: (
+                    rel_path,
+                    self._extract_one(rel_path, dest_dir, force),
+                ),
+                rel_paths,
+            )
+            for rel_path, status in results:
+                counts[status] += 1
+                if status == "exists":
+                    self.logger.debug(f"   -> Bỏ qua (đã tồn tại): {rel_path}")
+                elif status == "unsafe":
+                    self.logger.warning(
+                        f"⚠️ Bỏ qua đường dẫn không an toàn trong pack: {rel_path}"
+                    )
+        return counts
+
+    def close(self) -> None:
+        for pack_map in self._maps:
+            pack_map.close()
+        for handle in self._handles:
+            handle.close()
+        self._maps.clear()
+        self._handles.clear()
+        self.segments.clear()
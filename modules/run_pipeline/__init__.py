@@ -0,0 +1,23 @@
+# Path: modules/run_pipeline/__init__.py
+from .run_pipeline_config import (
+    COMMIT_SCOPE,
+    DEFAULT_STAGES,
+    DEFAULT_START_PATH,
+    MODULE_DIR,
+    STAGE_CHOICES,
+    TOOL_NAME,
+)
+from .run_pipeline_core import orchestrate_run_pipeline, process_run_pipeline_logic
+from .run_pipeline_executor import execute_run_pipeline_action
+
+__all__ = [
+    "DEFAULT_START_PATH",
+    "STAGE_CHOICES",
+    "DEFAULT_STAGES",
+    "COMMIT_SCOPE",
+    "TOOL_NAME",
+    "MODULE_DIR",
+    "process_run_pipeline_logic",
+    "execute_run_pipeline_action",
+    "orchestrate_run_pipeline",
+]
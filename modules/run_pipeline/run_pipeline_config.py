@@ -0,0 +1,26 @@
+# Path: modules/run_pipeline/run_pipeline_config.py
+from pathlib import Path
+from typing import Final, Tuple
+
+__all__ = [
+    "DEFAULT_START_PATH",
+    "STAGE_CHOICES",
+    "DEFAULT_STAGES",
+    "COMMIT_SCOPE",
+    "TOOL_NAME",
+    "MODULE_DIR",
+]
+
+
+DEFAULT_START_PATH: Final[str] = "."
+
+
+STAGE_CHOICES: Final[Tuple[str, ...]] = ("cpath", "ndoc", "forc")
+DEFAULT_STAGES: Final[str] = "cpath,ndoc,forc"
+
+
+COMMIT_SCOPE: Final[str] = "pipeline"
+TOOL_NAME: Final[str] = "drun"
+
+
+MODULE_DIR: Final[Path] = Path(__file__).parent
@@ -0,0 +1,162 @@
+# Path: modules/run_pipeline/run_pipeline_core.py
+import argparse
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+if "PROJECT_ROOT" not in locals():
+    sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from utils.cli import resolve_input_paths, resolve_reporting_root
+from utils.constants import MAX_THREAD_WORKERS
+
+from .run_pipeline_config import DEFAULT_START_PATH
+from .run_pipeline_executor import execute_run_pipeline_action
+from .run_pipeline_internal import (
+    build_pipeline_stages,
+    merge_stage_timings,
+    parse_stage_names,
+    process_run_pipeline_task_dir,
+    run_pipeline_on_file,
+)
+
+__all__ = ["process_run_pipeline_logic", "orchestrate_run_pipeline"]
+
+FileResult = Dict[str, Any]
+
+
+def orchestrate_run_pipeline(
+    logger: logging.Logger, cli_args: argparse.Namespace, this_script_path: Path
+) -> None:
+    try:
+        stage_names = parse_stage_names(cli_args.stages)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
+
+    validated_paths: List[Path] = resolve_input_paths(
+        logger=logger,
+        raw_paths=cli_args.start_paths_arg,
+        default_path_str=DEFAULT_START_PATH,
+    )
+    if not validated_paths:
+        logger.warning("Không tìm thấy đường dẫn hợp lệ nào để quét. Đã dừng.")
+        sys.exit(0)
+
+    reporting_root = resolve_reporting_root(logger, validated_paths, cli_args.root)
+    logger.info(f"🔗 Pipeline: {' → '.join(stage_names)}")
+
+    files_to_fix, timings = process_run_pipeline_logic(
+        logger=logger,
+        validated_paths=validated_paths,
+        stage_names=stage_names,
+        cli_args=cli_args,
+        reporting_root=reporting_root,
+    )
+
+    execute_run_pipeline_action(
+        logger=logger,
+        all_files_to_fix=files_to_fix,
+        cli_args=cli_args,
+        scan_root=reporting_root,
+        stage_names=stage_names,
+        timings=timings,
+    )
+
+
+def process_run_pipeline_logic(
+    logger: logging.Logger,
+    validated_paths: List[Path],
+    stage_names: List[str],
+    cli_args: argparse.Namespace,
+    reporting_root: Path,
+) -> Tuple[List[FileResult], Dict[str, float]]:
+
+    all_results: List[FileResult] = []
+    timings: Dict[str, float] = {}
+    processed_files: Set[Path] = set()
+
+    files_to_process: List[Path] = [p for p in validated_paths if p.is_file()]
+    dirs_to_scan: List[Path] = [p for p in validated_paths if p.is_dir()]
+
+    if files_to_process:
+        logger.info(f"Đang xử lý {len(files_to_process)} file riêng lẻ (song song)...")
+
+        file_stages = build_pipeline_stages(
+            logger=logger,
+            stage_names=stage_names,
+            config_dir=reporting_root,
+            reporting_root=reporting_root,
+            cli_args=cli_args,
+            use_file_config=False,
+        )
+
+        files_to_submit: List[Path] = []
+        for file_path in files_to_process:
+            resolved_file = file_path.resolve()
+            if resolved_file in processed_files:
+                continue
+
+            if not any(stage.applies_to(file_path, "", None) for stage in file_stages):
+                logger.warning(
+                    f"⚠️ Bỏ qua file '{file_path.name}': không khớp extensions của giai đoạn nào."
+                )
+                continue
+
+            processed_files.add(resolved_file)
+            files_to_submit.append(file_path)
+
+        file_only_results: List[FileResult] = []
+        if files_to_submit:
+            max_workers = MAX_THREAD_WORKERS
+            logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_file = {
+                    executor.submit(
+                        run_pipeline_on_file,
+                        file_path,
+                        "",
+                        file_stages,
+                        None,
+                        logger,
+                    ): file_path
+                    for file_path in files_to_submit
+                }
+
+                for future in as_completed(future_to_file):
+                    file_path = future_to_file[future]
+                    try:
+                        result, file_timings = future.result()
+                        merge_stage_timings(timings, file_timings)
+                        if result:
+                            file_only_results.append(result)
+                    except Exception as e:
+                        logger.error(
+                            f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}"
+                        )
+
+        if file_only_results:
+            file_only_results.sort(key=lambda r: r["path"])
+            all_results.extend(file_only_results)
+
+    if dirs_to_scan:
+        logger.info(f"Đang xử lý {len(dirs_to_scan)} thư mục...")
+        for scan_dir in dirs_to_scan:
+            results = process_run_pipeline_task_dir(
+                scan_dir=scan_dir,
+                stage_names=stage_names,
+                cli_args=cli_args,
+                logger=logger,
+                processed_files=processed_files,
+                reporting_root=reporting_root,
+                timings=timings,
+            )
+            all_results.extend(results)
+
+    if not all_results and (files_to_process or dirs_to_scan):
+        logger.info("Quét hoàn tất. Không tìm thấy file nào cần thay đổi.")
+
+    return all_results, timings
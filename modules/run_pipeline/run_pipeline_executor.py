@@ -0,0 +1,139 @@
+# Path: modules/run_pipeline/run_pipeline_executor.py
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+if "PROJECT_ROOT" not in locals():
+    sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from utils.cli.ui_helpers import print_grouped_report
+from utils.core.git import auto_commit_changes
+from utils.logging_config import log_success
+
+from .run_pipeline_config import COMMIT_SCOPE, TOOL_NAME
+from .run_pipeline_internal import log_pipeline_timings
+
+__all__ = ["execute_run_pipeline_action"]
+
+FileResult = Dict[str, Any]
+
+
+def execute_run_pipeline_action(
+    logger: logging.Logger,
+    all_files_to_fix: List[FileResult],
+    cli_args: argparse.Namespace,
+    scan_root: Path,
+    stage_names: List[str],
+    timings: Dict[str, float],
+) -> None:
+
+    dry_run: bool = getattr(cli_args, "dry_run", False)
+    force: bool = getattr(cli_args, "force", False)
+
+    total_files_to_fix = len(all_files_to_fix)
+
+    if total_files_to_fix == 0:
+        log_pipeline_timings(logger, timings, stage_names)
+        return
+
+    logger.warning(f"\n⚠️ Tổng cộng {total_files_to_fix} file cần được sửa.")
+
+    def _title_formatter(info: FileResult) -> str:
+        file_path: Path = info["path"]
+        try:
+            rel_path = file_path.relative_to(scan_root).as_posix()
+        except ValueError:
+            rel_path = str(file_path)
+        return rel_path
+
+    def _detail_formatter(info: FileResult) -> List[str]:
+        return [f"(Giai đoạn thay đổi: {', '.join(info['stages'])})"]
+
+    if dry_run:
+        logger.info("Chế độ Dry-run: Báo cáo các file cần sửa.")
+        print_grouped_report(
+            logger=logger,
+            group_name="Tổng hợp (Dry Run)",
+            files_in_group=all_files_to_fix,
+            scan_root=scan_root,
+            title_formatter=_title_formatter,
+            detail_formatter=_detail_formatter,
+        )
+        log_pipeline_timings(logger, timings, stage_names)
+        logger.warning("\n-> Chạy lại mà không có cờ -d để sửa (hoặc -f để tự động).")
+        sys.exit(1)
+
+    proceed_to_write = force
+    if not force:
+
+        print_grouped_report(
+            logger=logger,
+            group_name="Các thay đổi sắp thực hiện",
+            files_in_group=all_files_to_fix,
+            scan_root=scan_root,
+            title_formatter=_title_formatter,
+            detail_formatter=_detail_formatter,
+        )
+
+        try:
+            confirmation = input("\nTiếp tục ghi đè các file này? (y/n): ")
+        except (EOFError, KeyboardInterrupt):
+            confirmation = "n"
+
+        if confirmation.lower() == "y":
+            proceed_to_write = True
+        else:
+            logger.warning("Hoạt động sửa file bị hủy bởi người dùng.")
+            sys.exit(0)
+
+    if proceed_to_write:
+        written_count = 0
+        files_written_relative: List[str] = []
+
+        started = time.perf_counter()
+        for info in all_files_to_fix:
+            target_path: Path = info["path"]
+            new_content: str = info["new_content"]
+            try:
+                target_path.write_text(new_content, encoding="utf-8")
+            except IOError as e:
+                logger.error(f"❌ Lỗi khi ghi file {target_path.as_posix()}: {e}")
+                continue
+
+            try:
+                rel_path_str = target_path.relative_to(scan_root).as_posix()
+            except ValueError:
+                rel_path_str = target_path.as_posix()
+            files_written_relative.append(rel_path_str)
+            logger.info(f"Đã sửa: {rel_path_str} ({', '.join(info['stages'])})")
+            written_count += 1
+        timings["write"] = time.perf_counter() - started
+
+        log_success(logger, f"Hoàn tất! Đã sửa {written_count} file.")
+
+        git_commit: bool = getattr(cli_args, "git_commit", False)
+
+        if git_commit and files_written_relative:
+            started = time.perf_counter()
+            settings_to_hash = {
+                "stages": stage_names,
+                "all_clean": getattr(cli_args, "all_clean", False),
+                "ignore": getattr(cli_args, "ignore", None),
+            }
+
+            auto_commit_changes(
+                logger=logger,
+                scan_root=scan_root,
+                files_written_relative=files_written_relative,
+                settings_to_hash=settings_to_hash,
+                commit_scope=COMMIT_SCOPE,
+                tool_name=TOOL_NAME,
+            )
+            timings["commit"] = time.perf_counter() - started
+        elif files_written_relative:
+            logger.info("Bỏ qua auto-commit. (Không có cờ -g/--git-commit)")
+
+        log_pipeline_timings(logger, timings, stage_names)
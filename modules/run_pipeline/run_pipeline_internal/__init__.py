@@ -0,0 +1,22 @@
+# Path: modules/run_pipeline/run_pipeline_internal/__init__.py
+from .run_pipeline_runner import (
+    log_pipeline_timings,
+    merge_stage_timings,
+    run_pipeline_on_file,
+)
+from .run_pipeline_stages import (
+    PipelineStage,
+    build_pipeline_stages,
+    parse_stage_names,
+)
+from .run_pipeline_task_dir import process_run_pipeline_task_dir
+
+__all__ = [
+    "PipelineStage",
+    "parse_stage_names",
+    "build_pipeline_stages",
+    "run_pipeline_on_file",
+    "merge_stage_timings",
+    "log_pipeline_timings",
+    "process_run_pipeline_task_dir",
+]
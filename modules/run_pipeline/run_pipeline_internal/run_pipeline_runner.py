@@ -0,0 +1,94 @@
+# Path: modules/run_pipeline/run_pipeline_internal/run_pipeline_runner.py
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.core import ScanContext
+
+from .run_pipeline_stages import PipelineStage
+
+__all__ = [
+    "WALL_TIMING_KEY",
+    "run_pipeline_on_file",
+    "merge_stage_timings",
+    "log_pipeline_timings",
+]
+
+FileResult = Dict[str, Any]
+StageTimings = Dict[str, float]
+
+WALL_TIMING_KEY = "scan+run"
+
+
+def run_pipeline_on_file(
+    file_path: Path,
+    rel_path: str,
+    stages: List[PipelineStage],
+    scan_context: Optional[ScanContext],
+    logger: logging.Logger,
+) -> Tuple[Optional[FileResult], StageTimings]:
+    timings: StageTimings = {}
+
+    started = time.perf_counter()
+    try:
+        original_content = file_path.read_text(encoding="utf-8")
+    except (IOError, UnicodeDecodeError) as e:
+        logger.warning(f"⚠️ Bỏ qua file '{file_path.name}' do lỗi đọc/encoding: {e}")
+        return None, timings
+    timings["read"] = time.perf_counter() - started
+
+    content = original_content
+    changed_stages: List[str] = []
+
+    for stage in stages:
+        if not stage.applies_to(file_path, rel_path, scan_context):
+            continue
+
+        started = time.perf_counter()
+        try:
+            new_content = stage.transform(content, file_path)
+        except Exception as e:
+            logger.error(
+                f"❌ Giai đoạn '{stage.name}' lỗi trên '{file_path.name}': {e}"
+            )
+            new_content = content
+        timings[stage.name] = timings.get(stage.name, 0.0) + (
+            time.perf_counter() - started
+        )
+
+        if new_content != content:
+            changed_stages.append(stage.name)
+            content = new_content
+
+    if content == original_content:
+        return None, timings
+
+    return {
+        "path": file_path,
+        "original_content": original_content,
+        "new_content": content,
+        "stages": changed_stages,
+    }, timings
+
+
+def merge_stage_timings(target: StageTimings, source: StageTimings) -> None:
+    for key, seconds in source.items():
+        target[key] = target.get(key, 0.0) + seconds
+
+
+def log_pipeline_timings(
+    logger: logging.Logger, timings: StageTimings, stage_names: List[str]
+) -> None:
+    ordered_keys = ["read", *stage_names, "write", "commit"]
+    logger.info("⏱️ Thời gian theo giai đoạn (cộng dồn trên các luồng):")
+    for key in ordered_keys:
+        if key in timings:
+            logger.info(f"   - {key:<8} {timings[key]:>9.3f}s")
+    logger.info(
+        f"   = tổng     {sum(timings[key] for key in ordered_keys if key in timings):>9.3f}s"
+    )
+    if WALL_TIMING_KEY in timings:
+        logger.info(
+            f"   (quét + chạy song song, thời gian thực: {timings[WALL_TIMING_KEY]:.3f}s)"
+        )
@@ -0,0 +1,195 @@
+# Path: modules/run_pipeline/run_pipeline_internal/run_pipeline_stages.py
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+if "PROJECT_ROOT" not in locals():
+    sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent))
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+from modules.check_path.check_path_internal import analyze_path_comment_lines
+from modules.check_path.check_path_internal import (
+    load_config_files as load_cpath_config,
+)
+from modules.check_path.check_path_internal import merge_check_path_configs
+from modules.format_code.format_code_internal import (
+    load_config_files as load_forc_config,
+)
+from modules.format_code.format_code_internal import merge_format_code_configs
+from modules.no_doc.no_doc_internal import load_config_files as load_ndoc_config
+from modules.no_doc.no_doc_internal import merge_ndoc_configs
+from utils.constants import DEFAULT_EXTENSIONS_LANG_MAP
+from utils.core import (
+    ScanContext,
+    clean_code,
+    compile_spec_from_patterns,
+    format_code,
+    is_extension_matched,
+)
+
+from ..run_pipeline_config import STAGE_CHOICES
+
+__all__ = ["PipelineStage", "parse_stage_names", "build_pipeline_stages"]
+
+StageTransform = Callable[[str, Path], str]
+
+
+class PipelineStage:
+    def __init__(
+        self,
+        name: str,
+        extensions: Set[str],
+        ignore_list: List[str],
+        transform: StageTransform,
+        scan_root: Path,
+    ):
+        self.name = name
+        self.extensions = extensions
+        self.ignore_list = ignore_list
+        self.ignore_spec: Optional["pathspec.PathSpec"] = compile_spec_from_patterns(
+            ignore_list, scan_root
+        )
+        self.transform = transform
+
+    def applies_to(
+        self,
+        file_path: Path,
+        rel_path: str,
+        scan_context: Optional[ScanContext],
+    ) -> bool:
+        if not is_extension_matched(file_path, self.extensions):
+            return False
+        if scan_context is None:
+            return True
+        return not scan_context.is_matched(rel_path, False, self.ignore_spec)
+
+
+def parse_stage_names(raw_stages: str) -> List[str]:
+    stage_names: List[str] = []
+    for item in raw_stages.split(","):
+        name = item.strip()
+        if not name or name in stage_names:
+            continue
+        if name not in STAGE_CHOICES:
+            raise ValueError(
+                f"Giai đoạn không hợp lệ: '{name}'. Hỗ trợ: {', '.join(STAGE_CHOICES)}"
+            )
+        stage_names.append(name)
+
+    if not stage_names:
+        raise ValueError("Danh sách giai đoạn rỗng.")
+    return stage_names
+
+
+def _language_of(file_path: Path) -> Optional[str]:
+    file_ext = "".join(file_path.suffixes).lstrip(".")
+    return DEFAULT_EXTENSIONS_LANG_MAP.get(file_ext)
+
+
+def _make_cpath_transform(
+    reporting_root: Path, logger: logging.Logger
+) -> StageTransform:
+    def transform(content: str, file_path: Path) -> str:
+        result = analyze_path_comment_lines(
+            file_path, reporting_root, content.splitlines(True), logger
+        )
+        return "".join(result["new_lines"]) if result else content
+
+    return transform
+
+
+def _make_ndoc_transform(logger: logging.Logger, all_clean: bool) -> StageTransform:
+    def transform(content: str, file_path: Path) -> str:
+        language_id = _language_of(file_path)
+        if not language_id:
+            return content
+        return clean_code(
+            code_content=content,
+            language=language_id,
+            logger=logger,
+            all_clean=all_clean,
+        )
+
+    return transform
+
+
+def _make_forc_transform(logger: logging.Logger) -> StageTransform:
+    def transform(content: str, file_path: Path) -> str:
+        language_id = _language_of(file_path)
+        if not language_id:
+            return content
+        return format_code(
+            code_content=content,
+            language=language_id,
+            logger=logger,
+            file_path=file_path,
+        )
+
+    return transform
+
+
+def build_pipeline_stages(
+    logger: logging.Logger,
+    stage_names: List[str],
+    config_dir: Path,
+    reporting_root: Path,
+    cli_args: argparse.Namespace,
+    use_file_config: bool = True,
+) -> List[PipelineStage]:
+    cli_ignore: Optional[str] = getattr(cli_args, "ignore", None)
+    all_clean: bool = getattr(cli_args, "all_clean", False)
+
+    stages: List[PipelineStage] = []
+    for name in stage_names:
+        merged_config: Dict[str, Any]
+        if name == "cpath":
+            merged_config = merge_check_path_configs(
+                logger=logger,
+                cli_extensions=None,
+                cli_ignore=cli_ignore,
+                file_config_data=(
+                    load_cpath_config(config_dir, logger) if use_file_config else {}
+                ),
+            )
+            transform = _make_cpath_transform(reporting_root, logger)
+        elif name == "ndoc":
+            merged_config = merge_ndoc_configs(
+                logger=logger,
+                cli_extensions=None,
+                cli_ignore=cli_ignore,
+                file_config_data=(
+                    load_ndoc_config(config_dir, logger) if use_file_config else {}
+                ),
+            )
+            transform = _make_ndoc_transform(logger, all_clean)
+        else:
+            merged_config = merge_format_code_configs(
+                logger=logger,
+                cli_extensions=None,
+                cli_ignore=cli_ignore,
+                file_config_data=(
+                    load_forc_config(config_dir, logger) if use_file_config else {}
+                ),
+            )
+            transform = _make_forc_transform(logger)
+
+        stages.append(
+            PipelineStage(
+                name=name,
+                extensions=set(merged_config["final_extensions_list"]),
+                ignore_list=merged_config["final_ignore_list"],
+                transform=transform,
+                scan_root=config_dir,
+            )
+        )
+
+    return stages
@@ -0,0 +1,137 @@
+# Path: modules/run_pipeline/run_pipeline_internal/run_pipeline_task_dir.py
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.constants import DEFAULT_SCAN_BACKEND, MAX_THREAD_WORKERS
+from utils.core import (
+    PathStream,
+    ScanContext,
+    compile_spec_from_patterns,
+    get_submodule_paths,
+    parse_gitignore,
+    stream_directory_recursive,
+    submit_as_arrived,
+)
+
+from .run_pipeline_runner import (
+    WALL_TIMING_KEY,
+    merge_stage_timings,
+    run_pipeline_on_file,
+)
+from .run_pipeline_stages import build_pipeline_stages
+
+__all__ = ["process_run_pipeline_task_dir"]
+
+FileResult = Dict[str, Any]
+
+
+def process_run_pipeline_task_dir(
+    scan_dir: Path,
+    stage_names: List[str],
+    cli_args: argparse.Namespace,
+    logger: logging.Logger,
+    processed_files: Set[Path],
+    reporting_root: Path,
+    timings: Dict[str, float],
+) -> List[FileResult]:
+    logger.info(f"--- 📁 Quét thư mục: {scan_dir.name} ---")
+
+    stages = build_pipeline_stages(
+        logger=logger,
+        stage_names=stage_names,
+        config_dir=scan_dir,
+        reporting_root=reporting_root,
+        cli_args=cli_args,
+    )
+
+    common_ignore_list = [
+        pattern
+        for pattern in stages[0].ignore_list
+        if all(pattern in stage.ignore_list for stage in stages[1:])
+    ]
+    gitignore_patterns: List[str] = parse_gitignore(scan_dir)
+    ignore_spec = compile_spec_from_patterns(
+        common_ignore_list + gitignore_patterns, scan_dir
+    )
+    extensions_union: Set[str] = set().union(*(stage.extensions for stage in stages))
+
+    submodule_paths = get_submodule_paths(scan_dir, logger)
+    scan_context = ScanContext(scan_dir, submodule_paths)
+
+    logger.info("  [Cấu hình áp dụng]")
+    for stage in stages:
+        logger.info(f"    - {stage.name}: extensions={sorted(stage.extensions)}")
+    logger.info(
+        f"    - Tải .gitignore cục bộ: {'Có' if gitignore_patterns else 'Không'}"
+    )
+    logger.info(f"    - Tải .gitmodules cục bộ: {'Có' if submodule_paths else 'Không'}")
+
+    files_in_dir = stream_directory_recursive(
+        logger=logger,
+        directory=scan_dir,
+        scan_root=scan_dir,
+        ignore_spec=ignore_spec,
+        include_spec=None,
+        prune_spec=None,
+        extensions_filter=extensions_union,
+        submodule_paths=submodule_paths,
+        scan_context=scan_context,
+        use_scan_cache=getattr(cli_args, "scan_cache", False),
+        scan_backend=getattr(cli_args, "scan_backend", DEFAULT_SCAN_BACKEND),
+    )
+    path_stream = PathStream(files_in_dir, processed_files)
+
+    def _run_on_file(file_path: Path) -> Tuple[Optional[FileResult], Dict[str, float]]:
+        return run_pipeline_on_file(
+            file_path,
+            scan_context.relative_of(file_path, resolve=False),
+            stages,
+            scan_context,
+            logger,
+        )
+
+    dir_results: List[FileResult] = []
+    max_workers = MAX_THREAD_WORKERS
+    logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for file_path, future in submit_as_arrived(
+            executor, _run_on_file, path_stream, max_in_flight=max_workers * 4
+        ):
+            try:
+                result, file_timings = future.result()
+                merge_stage_timings(timings, file_timings)
+                if result:
+                    dir_results.append(result)
+            except Exception as e:
+                logger.error(f"❌ Lỗi khi xử lý file song song '{file_path.name}': {e}")
+    timings[WALL_TIMING_KEY] = timings.get(WALL_TIMING_KEY, 0.0) + (
+        time.perf_counter() - started
+    )
+
+    if not path_stream.submitted_count:
+        logger.info(
+            f"  -> 🤷 Không tìm thấy file nào khớp tiêu chí trong: {scan_dir.name}"
+        )
+        logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
+        logger.info("")
+        return []
+
+    logger.info(
+        f"  -> ⚡ Tìm thấy {path_stream.submitted_count} file, đã chạy {' → '.join(stage_names)} song song trong lúc quét."
+    )
+
+    dir_results.sort(key=lambda r: r["path"])
+
+    if not dir_results:
+        logger.info("  -> ✅ Tất cả file trong thư mục đã tuân thủ.")
+
+    logger.info(f"--- ✅ Kết thúc {scan_dir.name} ---")
+    logger.info("")
+
+    return dir_results
@@ -1,6 +1,5 @@
 # Path: modules/stubgen/stubgen_internal/stubgen_loader.py
 import logging
-import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
@@ -12,12 +11,14 @@ except ImportError:
 if TYPE_CHECKING:
     import pathspec
 
+from utils.constants import DEFAULT_SCAN_BACKEND
 from utils.core import (
+    ScanContext,
     compile_spec_from_patterns,
     get_submodule_paths,
-    is_path_matched,
     load_and_merge_configs,
     parse_gitignore,
+    scan_directory_recursive,
 )
 
 from ..stubgen_config import (
@@ -58,46 +59,37 @@ def _scan_for_inits_recursive(
     submodule_paths: Set[Path],
     dynamic_import_indicators: List[str],
     script_file_path: Path,
+    scan_context: Optional[ScanContext] = None,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
 ) -> List[Path]:
     found_files: List[Path] = []
 
-    try:
-
-        contents = list(os.scandir(directory))
-    except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
-        logger.debug(f"Không thể truy cập thư mục: {directory.as_posix()} ({e})")
-        return []
-
-    for entry in contents:
-        path = Path(entry.path)
+    if scan_context is None:
+        scan_context = ScanContext(scan_root, submodule_paths)
+    script_rel_path = scan_context.relative_of(script_file_path)
 
-        if is_path_matched(path, ignore_spec, scan_root):
+    for path in scan_directory_recursive(
+        logger=logger,
+        directory=directory,
+        scan_root=scan_root,
+        ignore_spec=ignore_spec,
+        include_spec=None,
+        prune_spec=None,
+        extensions_filter={"py"},
+        submodule_paths=submodule_paths,
+        scan_context=scan_context,
+        use_scan_cache=use_scan_cache,
+        scan_backend=scan_backend,
+    ):
+        if path.name != "__init__.py":
             continue
 
-        abs_path = path.resolve()
-        if abs_path in submodule_paths:
+        if path.relative_to(scan_root).as_posix() == script_rel_path:
             continue
 
-        if entry.is_dir(follow_symlinks=False):
-
-            found_files.extend(
-                _scan_for_inits_recursive(
-                    logger=logger,
-                    directory=path,
-                    scan_root=scan_root,
-                    ignore_spec=ignore_spec,
-                    submodule_paths=submodule_paths,
-                    dynamic_import_indicators=dynamic_import_indicators,
-                    script_file_path=script_file_path,
-                )
-            )
-        elif entry.is_file(follow_symlinks=False) and entry.name == "__init__.py":
-
-            if abs_path.samefile(script_file_path):
-                continue
-
-            if _is_dynamic_gateway(path, dynamic_import_indicators):
-                found_files.append(path)
+        if _is_dynamic_gateway(path, dynamic_import_indicators):
+            found_files.append(path)
 
     return found_files
 
@@ -108,6 +100,8 @@ def find_gateway_files(
     ignore_list: List[str],
     dynamic_import_indicators: List[str],
     script_file_path: Path,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
 ) -> Tuple[List[Path], Dict[str, bool]]:
 
     scan_status = {"gitignore_found": False, "gitmodules_found": False}
@@ -123,6 +117,8 @@ def find_gateway_files(
     if submodule_paths:
         scan_status["gitmodules_found"] = True
 
+    scan_context = ScanContext(scan_root, submodule_paths)
+
     logger.debug(f"Scanning for dynamic '__init__.py' within: {scan_root.as_posix()}")
 
     gateway_files: List[Path] = _scan_for_inits_recursive(
@@ -133,6 +129,10 @@ def find_gateway_files(
         submodule_paths=submodule_paths,
         dynamic_import_indicators=dynamic_import_indicators,
         script_file_path=script_file_path,
+        scan_context=scan_context,
+        use_scan_cache=use_scan_cache,
+        scan_backend=scan_backend,
     )
+    gateway_files.sort(key=lambda p: p.as_posix())
 
     return gateway_files, scan_status
@@ -2,7 +2,7 @@
 
 import argparse
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
@@ -10,7 +10,8 @@ if TYPE_CHECKING:
     pass
 
 
-from utils.constants import MAX_THREAD_WORKERS
+from utils.constants import DEFAULT_EXECUTOR, DEFAULT_SCAN_BACKEND, WORKLOAD_CPU
+from utils.core import create_cpu_executor, resolve_executor_kind
 
 from . import (
     find_gateway_files,
@@ -47,6 +48,8 @@ def process_stubgen_task_dir(
         ignore_list=merged_config["ignore_list"],
         dynamic_import_indicators=merged_config["indicators"],
         script_file_path=script_file_path,
+        use_scan_cache=getattr(cli_args, "scan_cache", False),
+        scan_backend=getattr(cli_args, "scan_backend", DEFAULT_SCAN_BACKEND),
     )
 
     logger.info("  [Cấu hình áp dụng]")
@@ -85,10 +88,13 @@ def process_stubgen_task_dir(
         logger.info("  -> ✅ Tất cả file đã được xử lý (do là file input riêng lẻ).")
     else:
 
-        max_workers = MAX_THREAD_WORKERS
-        logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={max_workers}")
+        executor_kind = resolve_executor_kind(
+            logger, getattr(cli_args, "executor", DEFAULT_EXECUTOR), WORKLOAD_CPU
+        )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with create_cpu_executor(
+            logger, executor_kind, getattr(cli_args, "jobs", None)
+        ) as executor:
             future_to_file = {
                 executor.submit(
                     process_single_gateway,
@@ -59,6 +59,7 @@ def orchestrate_tree(logger: logging.Logger, cli_args: argparse.Namespace) -> No
             dirs_only_spec=config_params["dirs_only_spec"],
             extensions_filter=config_params["extensions_filter"],
             is_in_dirs_only_zone=config_params["is_in_dirs_only_zone"],
+            use_nested_gitignore=config_params["use_nested_gitignore"],
         )
 
         print_final_result(
@@ -1,6 +1,7 @@
 # Path: modules/tree/tree_executor.py
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 try:
     import pathspec
@@ -10,7 +11,14 @@ except ImportError:
 if TYPE_CHECKING:
     import pathspec
 
-from utils.core import is_extension_matched, is_path_matched
+from utils.core import (
+    GITIGNORE_FILENAME,
+    IgnoreStack,
+    ScanContext,
+    extend_ignore_stack,
+    is_extension_matched,
+    is_ignored_by_stack,
+)
 
 from .tree_config import DEFAULT_MAX_LEVEL
 
@@ -21,6 +29,9 @@ __all__ = [
 ]
 
 
+TreeEntry = Tuple[os.DirEntry, str, bool]
+
+
 def print_status_header(
     config_params: Dict[str, Any],
     start_dir: Path,
@@ -95,6 +106,10 @@ def generate_tree(
     extensions_filter: Optional[Set[str]] = None,
     is_in_dirs_only_zone: bool = False,
     counters: Optional[Dict[str, int]] = None,
+    scan_context: Optional[ScanContext] = None,
+    relative_dir: Optional[str] = None,
+    use_nested_gitignore: bool = False,
+    ignore_stack: IgnoreStack = (),
 ) -> None:
     if submodules is None:
         submodules = set()
@@ -105,54 +120,79 @@ def generate_tree(
     if max_level is not None and level >= max_level:
         return
 
+    if scan_context is None:
+        scan_context = ScanContext(start_dir, submodules)
+
+    if relative_dir is None:
+        relative_dir = scan_context.relative_of(directory)
+
     try:
-        contents = [
-            path for path in directory.iterdir() if not path.name.startswith(".")
-        ]
+        with os.scandir(directory) as it:
+            raw_entries = list(it)
     except (FileNotFoundError, NotADirectoryError):
         return
 
-    def is_ignored(path: Path) -> bool:
-        return is_path_matched(path, ignore_spec, start_dir)
+    if use_nested_gitignore and relative_dir:
+        if any(
+            entry.name == GITIGNORE_FILENAME and entry.is_file()
+            for entry in raw_entries
+        ):
+            ignore_stack = extend_ignore_stack(ignore_stack, directory, relative_dir)
+
+    contents: List[TreeEntry] = [
+        (entry, scan_context.child(relative_dir, entry.name), entry.is_dir())
+        for entry in raw_entries
+        if not entry.name.startswith(".")
+    ]
+
+    def is_ignored(item: TreeEntry) -> bool:
+        _, rel_path, is_dir = item
+        if scan_context.is_matched(rel_path, is_dir, ignore_spec):
+            return True
+        return bool(ignore_stack) and is_ignored_by_stack(
+            ignore_stack, rel_path, is_dir
+        )
 
     dirs = sorted(
-        [d for d in contents if d.is_dir() and not is_ignored(d)],
-        key=lambda p: p.name.lower(),
+        [d for d in contents if d[2] and not is_ignored(d)],
+        key=lambda item: item[0].name.lower(),
     )
 
-    files: List[Path] = []
+    files: List[TreeEntry] = []
     if not is_in_dirs_only_zone:
-        files_unfiltered = [f for f in contents if f.is_file() and not is_ignored(f)]
+        files_unfiltered = [
+            f for f in contents if not f[2] and f[0].is_file() and not is_ignored(f)
+        ]
 
         if extensions_filter is not None:
             files_filtered = []
             for f in files_unfiltered:
 
-                if is_extension_matched(f, extensions_filter):
+                if is_extension_matched(Path(f[0].name), extensions_filter):
                     files_filtered.append(f)
-            files = sorted(files_filtered, key=lambda p: p.name.lower())
+            files = sorted(files_filtered, key=lambda item: item[0].name.lower())
         else:
-            files = sorted(files_unfiltered, key=lambda p: p.name.lower())
+            files = sorted(files_unfiltered, key=lambda item: item[0].name.lower())
 
     items_to_print = dirs + files
     pointers = ["├── "] * (len(items_to_print) - 1) + ["└── "]
 
-    for pointer, path in zip(pointers, items_to_print):
-        if path.is_dir():
+    for pointer, (entry, rel_path, is_dir) in zip(pointers, items_to_print):
+        if is_dir:
             counters["dirs"] += 1
         else:
             counters["files"] += 1
 
-        is_submodule = path.is_dir() and path.resolve() in submodules
-        is_pruned = path.is_dir() and is_path_matched(path, prune_spec, start_dir)
+        is_submodule = is_dir and scan_context.is_submodule(rel_path)
+        is_pruned = is_dir and scan_context.is_matched(rel_path, True, prune_spec)
 
         is_dirs_only_entry = (
-            path.is_dir()
-            and is_path_matched(path, dirs_only_spec, start_dir)
+            is_dir
+            and scan_context.is_matched(rel_path, True, dirs_only_spec)
             and not is_in_dirs_only_zone
         )
 
-        line = f"{prefix}{pointer}{path.name}{'/' if path.is_dir() else ''}"
+        line = f"{prefix}{pointer}{entry.name}{'/' if is_dir else ''}"
 
         if is_submodule:
             line += " [submodule]"
@@ -163,12 +203,12 @@ def generate_tree(
 
         print(line)
 
-        if path.is_dir() and not is_submodule and not is_pruned:
+        if is_dir and not is_submodule and not is_pruned:
             extension = "│   " if pointer == "├── " else "    "
             next_is_in_dirs_only_zone = is_in_dirs_only_zone or is_dirs_only_entry
 
             generate_tree(
-                path,
+                Path(entry.path),
                 start_dir,
                 prefix + extension,
                 level + 1,
@@ -180,4 +220,8 @@ def generate_tree(
                 extensions_filter,
                 next_is_in_dirs_only_zone,
                 counters,
+                scan_context=scan_context,
+                relative_dir=rel_path,
+                use_nested_gitignore=use_nested_gitignore,
+                ignore_stack=ignore_stack,
             )
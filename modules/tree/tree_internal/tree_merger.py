@@ -185,6 +185,7 @@ def merge_config_sources(
             "is_in_dirs_only_zone": False,
             "global_dirs_only_flag": False,
             "using_gitignore": False,
+            "use_nested_gitignore": False,
             "filter_lists": {
                 "ignore": set(),
                 "prune": set(),
@@ -242,6 +243,7 @@ def merge_config_sources(
         "using_gitignore": is_git_repo
         and final_use_gitignore
         and (len(gitignore_patterns) > 0),
+        "use_nested_gitignore": is_git_repo and final_use_gitignore,
         "global_dirs_only_flag": global_dirs_only_flag,
         "filter_lists": {
             "ignore": set(final_ignore_list),
@@ -0,0 +1,573 @@
+# Path: scripts/benchmarks/bench_suite.py
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modules.check_path.check_path_core import process_check_path_logic
+from modules.no_doc import process_no_doc_logic
+from modules.pack_code.pack_code_core import process_pack_code_logic
+from modules.pack_code.pack_code_internal import write_packed_content
+from modules.stubgen.stubgen_core import process_stubgen_logic
+from modules.tree.tree_executor import generate_tree
+from utils.core import (
+    compile_spec_from_patterns,
+    get_submodule_paths,
+    parse_gitignore,
+    scan_directory_recursive,
+)
+
+BENCH_SCHEMA_VERSION = 1
+TREE_MARKER_FILENAME = ".bench-tree.json"
+
+TREE_SIZES: Dict[str, int] = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+TREE_SHAPES: Dict[str, Tuple[int, int]] = {
+    "deep": (3, 8),
+    "wide": (40, 2),
+}
+
+EXTENSION_WEIGHTS: List[Tuple[str, int]] = [
+    ("py", 40),
+    ("md", 10),
+    ("js", 10),
+    ("txt", 10),
+    ("json", 8),
+    ("log", 8),
+    ("sh", 6),
+    ("tmp", 4),
+    ("css", 4),
+]
+
+DIR_NAME_POOL = ("src", "lib", "pkg", "core", "utils", "app", "api", "docs")
+IGNORED_DIR_NAMES = ("build", "node_modules", "dist")
+
+PY_TEMPLATE = '''"""Module {name} docstring."""
+import os
+
+
+def func_{index}(value):
+    """Return value unchanged."""
+    # comment {index}
+    return value
+
+
+__all__ = ["func_{index}"]
+'''
+
+GATEWAY_TEMPLATE = """from importlib import import_module
+
+modules_to_export = {modules!r}
+
+for module_name in modules_to_export:
+    module = import_module(f".{{module_name}}", __name__)
+    for name in getattr(module, "__all__", []):
+        obj = getattr(module, name)
+        globals()[name] = obj
+"""
+
+CONTENT_TEMPLATES: Dict[str, str] = {
+    "md": "# Title {index}\n\nSome text.\n",
+    "js": "// comment {index}\nexport const v{index} = {index};\n",
+    "txt": "plain text {index}\n",
+    "json": '{{"key": {index}}}\n',
+    "log": "log line {index}\n",
+    "sh": "#!/bin/sh\n# comment\necho {index}\n",
+    "tmp": "tmp {index}\n",
+    "css": "/* comment */\n.c{index} {{ color: red; }}\n",
+}
+
+
+def _build_gitignore_patterns(count: int) -> List[str]:
+    patterns = ["*.log", "*.tmp", "build/", "node_modules/", "dist/", "__pycache__/"]
+    index = 0
+    while len(patterns) < count:
+        kind = index % 5
+        if kind == 0:
+            patterns.append(f"cache_{index}/")
+        elif kind == 1:
+            patterns.append(f"*.gen{index}")
+        elif kind == 2:
+            patterns.append(f"/generated_{index}")
+        elif kind == 3:
+            patterns.append(f"docs/**/draft_{index}.md")
+        else:
+            patterns.append(f"tmp_{index}_*")
+        index += 1
+    return patterns[:count]
+
+
+def _write_text(path: Path, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def build_synthetic_tree(
+    root: Path,
+    total_files: int,
+    shape: str,
+    gitignore_pattern_count: int,
+    submodule_count: int,
+    seed: int,
+) -> Dict[str, Any]:
+    branching, depth = TREE_SHAPES[shape]
+    rng = random.Random(seed)
+
+    directories: List[Tuple[Path, int]] = [(root, 0)]
+    cursor = 0
+    while cursor < len(directories):
+        directory, level = directories[cursor]
+        cursor += 1
+        if level >= depth:
+            continue
+        for i in range(branching):
+            if rng.random() < 0.05:
+                name = rng.choice(IGNORED_DIR_NAMES)
+            else:
+                name = rng.choice(DIR_NAME_POOL)
+            directories.append((directory / f"{name}_{i}", level + 1))
+
+    extensions = [ext for ext, _ in EXTENSION_WEIGHTS]
+    weights = [weight for _, weight in EXTENSION_WEIGHTS]
+    files_per_dir = max(1, -(-total_files // len(directories)))
+
+    created = 0
+    for dir_index, (directory, _) in enumerate(directories):
+        directory.mkdir(parents=True, exist_ok=True)
+        budget = min(files_per_dir, total_files - created)
+        if budget <= 0:
+            continue
+
+        py_stems: List[str] = []
+        for file_index in range(budget):
+            ext = rng.choices(extensions, weights)[0]
+            name = f"f{dir_index}_{file_index}"
+            if ext == "py":
+                py_stems.append(name)
+                content = PY_TEMPLATE.format(name=name, index=file_index)
+            else:
+                content = CONTENT_TEMPLATES[ext].format(index=file_index)
+            _write_text(directory / f"{name}.{ext}", content)
+        created += budget
+
+        if dir_index % 10 == 0 and py_stems:
+            _write_text(
+                directory / "__init__.py",
+                GATEWAY_TEMPLATE.format(modules=py_stems[:5]),
+            )
+        if dir_index % 50 == 7:
+            _write_text(directory / ".gitignore", "*.json\n!keep.json\n")
+
+    _write_text(
+        root / ".gitignore",
+        "\n".join(_build_gitignore_patterns(gitignore_pattern_count)) + "\n",
+    )
+
+    gitmodules_lines: List[str] = []
+    for i in range(submodule_count):
+        module_dir = root / "vendor" / f"mod_{i}"
+        module_dir.mkdir(parents=True, exist_ok=True)
+        for j in range(20):
+            _write_text(
+                module_dir / f"vendored_{j}.py", PY_TEMPLATE.format(name=j, index=j)
+            )
+        gitmodules_lines.append(
+            f'[submodule "mod_{i}"]\n\tpath = vendor/mod_{i}\n\turl = https://example.invalid/mod_{i}.git\n'
+        )
+    if gitmodules_lines:
+        _write_text(root / ".gitmodules", "".join(gitmodules_lines))
+
+    return {"files": created, "directories": len(directories)}
+
+
+def ensure_tree(
+    workdir: Path,
+    size: str,
+    shape: str,
+    gitignore_pattern_count: int,
+    submodule_count: int,
+    seed: int,
+) -> Tuple[Path, Dict[str, Any]]:
+    spec = {
+        "schema": BENCH_SCHEMA_VERSION,
+        "size": size,
+        "shape": shape,
+        "gitignore_patterns": gitignore_pattern_count,
+        "submodules": submodule_count,
+        "seed": seed,
+    }
+    root = workdir / f"{size}-{shape}"
+    marker = root / TREE_MARKER_FILENAME
+
+    if marker.is_file():
+        try:
+            stored = json.loads(marker.read_text(encoding="utf-8"))
+            if stored.get("spec") == spec:
+                return root, stored["stats"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if root.exists():
+        subprocess.run(["rm", "-rf", str(root)], check=True)
+    root.mkdir(parents=True)
+
+    print(f"Tạo cây tổng hợp {root.name} ({TREE_SIZES[size]} file)...", file=sys.stderr)
+    started = time.perf_counter()
+    stats = build_synthetic_tree(
+        root, TREE_SIZES[size], shape, gitignore_pattern_count, submodule_count, seed
+    )
+    stats["build_seconds"] = round(time.perf_counter() - started, 3)
+    _write_text(marker, json.dumps({"spec": spec, "stats": stats}, indent=2))
+    return root, stats
+
+
+@contextmanager
+def working_directory(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _tool_namespace(**overrides: Any) -> argparse.Namespace:
+    values: Dict[str, Any] = {
+        "extensions": None,
+        "ignore": None,
+        "all_clean": False,
+        "format": False,
+        "force": False,
+        "scan_cache": False,
+        "scan_backend": "walk",
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def _case_scan(root: Path, logger: logging.Logger) -> int:
+    ignore_spec = compile_spec_from_patterns(parse_gitignore(root), root)
+    return len(
+        scan_directory_recursive(
+            logger=logger,
+            directory=root,
+            scan_root=root,
+            ignore_spec=ignore_spec,
+            include_spec=None,
+            prune_spec=None,
+            extensions_filter={"py", "md", "js", "sh"},
+            submodule_paths=get_submodule_paths(root, logger),
+        )
+    )
+
+
+def _case_tree(root: Path, logger: logging.Logger) -> int:
+    ignore_spec = compile_spec_from_patterns(parse_gitignore(root), root)
+    counters: Dict[str, int] = {"dirs": 0, "files": 0}
+    generate_tree(
+        root,
+        root,
+        max_level=None,
+        ignore_spec=ignore_spec,
+        submodules=get_submodule_paths(root, logger),
+        counters=counters,
+        use_nested_gitignore=True,
+    )
+    return counters["files"]
+
+
+def _case_pcode(root: Path, logger: logging.Logger) -> int:
+    result = process_pack_code_logic(
+        logger=logger,
+        cli_args={"stdout": True},
+        validated_paths=[root],
+        reporting_root=root,
+        script_file_path=PROJECT_ROOT / "tools" / "pack_code.py",
+    )
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        write_packed_content(
+            logger=logger,
+            sink=sink,
+            file_entries=result.get("file_entries", []),
+            tree_str=result.get("tree_string", ""),
+            no_header=False,
+        )
+    return len(result.get("file_list_relative", []))
+
+
+def _case_cpath(root: Path, logger: logging.Logger) -> int:
+    return len(
+        process_check_path_logic(
+            logger=logger,
+            validated_paths=[root],
+            cli_args=_tool_namespace(),
+            script_file_path=PROJECT_ROOT / "tools" / "check_path.py",
+            reporting_root=root,
+        )
+    )
+
+
+def _case_ndoc(root: Path, logger: logging.Logger) -> int:
+    return len(
+        process_no_doc_logic(
+            logger=logger,
+            files_to_process=[],
+            dirs_to_scan=[root],
+            cli_args=_tool_namespace(),
+            script_file_path=PROJECT_ROOT / "tools" / "no_doc.py",
+        )
+    )
+
+
+def _case_sgen(root: Path, logger: logging.Logger) -> int:
+    files_to_create, files_to_overwrite = process_stubgen_logic(
+        logger=logger,
+        cli_args=_tool_namespace(),
+        script_file_path=PROJECT_ROOT / "tools" / "stubgen.py",
+        validated_paths=[root],
+    )
+    return len(files_to_create) + len(files_to_overwrite)
+
+
+BENCH_CASES: Dict[str, Callable[[Path, logging.Logger], int]] = {
+    "scan": _case_scan,
+    "tree": _case_tree,
+    "pcode": _case_pcode,
+    "cpath": _case_cpath,
+    "ndoc": _case_ndoc,
+    "sgen": _case_sgen,
+}
+
+
+def _quiet_logger() -> logging.Logger:
+    logger = logging.getLogger("bench_suite")
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.WARNING)
+    return logger
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    logger = _quiet_logger()
+    workdir = Path(args.workdir).expanduser().resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        for shape in args.shapes:
+            root, stats = ensure_tree(
+                workdir,
+                size,
+                shape,
+                args.gitignore_patterns,
+                args.submodules,
+                args.seed,
+            )
+            for case_name in args.cases:
+                case_func = BENCH_CASES[case_name]
+                runs: List[float] = []
+                items = 0
+                for _ in range(args.repeat):
+                    with working_directory(root), redirect_stdout(io.StringIO()):
+                        started = time.perf_counter()
+                        items = case_func(root, logger)
+                        runs.append(time.perf_counter() - started)
+
+                row = {
+                    "key": f"{size}-{shape}/{case_name}",
+                    "tree": root.name,
+                    "case": case_name,
+                    "tree_files": stats["files"],
+                    "items": items,
+                    "runs": [round(r, 6) for r in runs],
+                    "median": round(statistics.median(runs), 6),
+                    "min": round(min(runs), 6),
+                }
+                results.append(row)
+                print(
+                    f"{row['key']:<24}{row['items']:>10}{row['median']:>12.3f}s"
+                    f"{row['min']:>12.3f}s",
+                    file=sys.stderr,
+                )
+
+    return {
+        "schema": BENCH_SCHEMA_VERSION,
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    min_delta: float,
+) -> List[Dict[str, Any]]:
+    baseline_rows = {row["key"]: row for row in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+
+    header = f"{'case':<24}{'baseline':>12}{'current':>12}{'ratio':>9}  status"
+    print(header)
+    print("-" * len(header))
+    for row in current.get("results", []):
+        base_row = baseline_rows.get(row["key"])
+        if base_row is None:
+            print(f"{row['key']:<24}{'-':>12}{row['median']:>11.3f}s{'-':>9}  new")
+            continue
+
+        base_seconds = base_row["median"]
+        ratio = row["median"] / base_seconds if base_seconds > 0 else float("inf")
+        is_regression = (
+            ratio > 1 + threshold and row["median"] - base_seconds > min_delta
+        )
+        status = "REGRESSION" if is_regression else "ok"
+        print(
+            f"{row['key']:<24}{base_seconds:>11.3f}s{row['median']:>11.3f}s"
+            f"{ratio:>9.2f}  {status}"
+        )
+        if is_regression:
+            regressions.append({**row, "baseline": base_seconds, "ratio": ratio})
+
+    return regressions
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _parse_choice_list(value: str, choices: List[str]) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Giá trị không hợp lệ: {', '.join(unknown)} (hỗ trợ: {', '.join(choices)})"
+        )
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark scanner và các công cụ trên cây thư mục tổng hợp (xuất JSON, so sánh baseline)."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Chạy benchmark và ghi kết quả JSON."
+    )
+    run_parser.add_argument(
+        "--sizes",
+        type=lambda v: _parse_choice_list(v, list(TREE_SIZES)),
+        default=["10k"],
+        help=f"Kích thước cây (phân cách bởi dấu phẩy): {', '.join(TREE_SIZES)}.",
+    )
+    run_parser.add_argument(
+        "--shapes",
+        type=lambda v: _parse_choice_list(v, list(TREE_SHAPES)),
+        default=list(TREE_SHAPES),
+        help=f"Hình dạng cây: {', '.join(TREE_SHAPES)}.",
+    )
+    run_parser.add_argument(
+        "--cases",
+        type=lambda v: _parse_choice_list(v, list(BENCH_CASES)),
+        default=list(BENCH_CASES),
+        help=f"Các case cần đo: {', '.join(BENCH_CASES)}.",
+    )
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=1234)
+    run_parser.add_argument("--gitignore-patterns", type=int, default=200)
+    run_parser.add_argument("--submodules", type=int, default=8)
+    run_parser.add_argument(
+        "--workdir",
+        type=str,
+        default=str(Path(tempfile.gettempdir()) / "dutil_bench"),
+        help="Thư mục chứa các cây tổng hợp (được tái sử dụng giữa các lần chạy).",
+    )
+    run_parser.add_argument("-o", "--output", type=str, default=None)
+    run_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="File JSON baseline; thoát với mã 1 nếu có case chậm hơn ngưỡng.",
+    )
+    run_parser.add_argument("--threshold", type=float, default=0.15)
+    run_parser.add_argument("--min-delta", type=float, default=0.01)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="So sánh hai file kết quả JSON."
+    )
+    compare_parser.add_argument("baseline", type=str)
+    compare_parser.add_argument("current", type=str)
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.add_argument("--min-delta", type=float, default=0.01)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run_benchmarks(args)
+        report_json = json.dumps(report, indent=2)
+        if args.output:
+            _write_text(Path(args.output), report_json + "\n")
+        else:
+            print(report_json)
+
+        if not args.baseline:
+            return
+        baseline = _load_json(args.baseline)
+        current = report
+    else:
+        baseline = _load_json(args.baseline)
+        current = _load_json(args.current)
+
+    regressions = compare_results(baseline, current, args.threshold, args.min_delta)
+    if regressions:
+        print(
+            f"\n❌ {len(regressions)} case chậm hơn ngưỡng {args.threshold:.0%}.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    print(f"\n✅ Không có case nào vượt ngưỡng {args.threshold:.0%}.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Path: scripts/benchmarks/black_backend.py
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from utils.constants import BLACK_SUBPROCESS_ENV
+from utils.core.formatter_failure import FormatterFailure
+from utils.core.formatters.formatter_python import format_python_black
+
+BACKENDS = ("in-process", "subprocess")
+
+
+def _format_or_original(content: str, logger: logging.Logger, file_path: Path) -> str:
+    try:
+        return format_python_black(content, logger, file_path)
+    except FormatterFailure:
+        return content
+
+
+def load_sources(root: Path, limit: int) -> List[Tuple[Path, str]]:
+    sources: List[Tuple[Path, str]] = []
+    for file_path in sorted(root.rglob("*.py")):
+        if not file_path.is_file():
+            continue
+        try:
+            sources.append((file_path, file_path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            continue
+        if len(sources) >= limit:
+            break
+    return sources
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="So sánh tốc độ định dạng Black (file/giây) giữa chế độ in-process và subprocess."
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        nargs="?",
+        default=PROJECT_ROOT,
+        help="Thư mục chứa các file .py. Mặc định: thư mục dự án.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=200,
+        help="Số file .py tối đa được định dạng. Mặc định: 200.",
+    )
+    args = parser.parse_args()
+
+    logger = logging.getLogger("BlackBackendBench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    root = args.root.resolve()
+    os.chdir(root)
+    sources = load_sources(root, args.limit)
+    if not sources:
+        print(f"Không tìm thấy file .py nào trong {root.as_posix()}")
+        sys.exit(1)
+    print(f"{len(sources)} file .py từ {root.as_posix()}")
+    print(f"{'backend':>12}{'seconds':>10}{'files/s':>10}")
+    print("-" * 32)
+
+    outputs: Dict[str, List[str]] = {}
+    for backend in BACKENDS:
+        if backend == "subprocess":
+            os.environ[BLACK_SUBPROCESS_ENV] = "1"
+        else:
+            os.environ.pop(BLACK_SUBPROCESS_ENV, None)
+
+        started = time.perf_counter()
+        outputs[backend] = [
+            _format_or_original(content, logger, file_path)
+            for file_path, content in sources
+        ]
+        elapsed = time.perf_counter() - started
+        print(f"{backend:>12}{elapsed:>9.2f}s{len(sources) / elapsed:>10.1f}")
+
+    if outputs["in-process"] != outputs["subprocess"]:
+        print("❌ Kết quả giữa hai backend không khớp.")
+        sys.exit(1)
+    print("✅ Kết quả giữa hai backend khớp byte-by-byte.")
+
+
+if __name__ == "__main__":
+    main()
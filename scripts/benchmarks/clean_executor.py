@@ -0,0 +1,109 @@
+# Path: scripts/benchmarks/clean_executor.py
+import argparse
+import io
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modules.pack_code.pack_code_internal import (
+    build_read_options,
+    write_packed_content,
+)
+from utils.constants import (
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    TRANSFORM_CACHE_DISABLE_ENV,
+)
+
+FileResult = Dict[str, Any]
+
+
+def build_entries(root: Path, extensions: List[str]) -> List[FileResult]:
+    read_options = build_read_options(
+        base_dir=root,
+        all_clean=True,
+        clean_extensions_set=set(extensions),
+        format_flag=False,
+        format_extensions_set=set(),
+    )
+    entries: List[FileResult] = []
+    for extension in extensions:
+        for file_path in root.rglob(f"*.{extension}"):
+            if file_path.is_file():
+                entries.append(
+                    {
+                        "path": file_path,
+                        "rel_path": file_path.relative_to(root).as_posix(),
+                        "read_options": read_options,
+                    }
+                )
+    entries.sort(key=lambda entry: entry["rel_path"])
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="So sánh thời gian làm sạch (-a) của pcode giữa executor 'thread' và 'process'."
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        nargs="?",
+        default=PROJECT_ROOT,
+        help="Thư mục nguồn cần đóng gói. Mặc định: thư mục dự án.",
+    )
+    parser.add_argument(
+        "--extensions",
+        type=lambda v: [x.strip() for x in v.split(",") if x.strip()],
+        default=["py"],
+        help="Các đuôi file cần làm sạch, phân cách bởi dấu phẩy. Mặc định: py.",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ[TRANSFORM_CACHE_DISABLE_ENV] = "1"
+    logger = logging.getLogger("CleanExecutorBench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    root = args.root.resolve()
+    entries = build_entries(root, args.extensions)
+    total_bytes = sum(entry["path"].stat().st_size for entry in entries)
+    print(f"{len(entries)} file, {total_bytes / 1024:.0f} KiB từ {root.as_posix()}")
+    print(f"{'executor':>10}{'best':>12}{'cleaned':>10}")
+    print("-" * 32)
+
+    outputs: Dict[str, str] = {}
+    for executor_kind in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+        best = float("inf")
+        for _ in range(args.repeat):
+            sink = io.StringIO()
+            started = time.perf_counter()
+            stats = write_packed_content(
+                logger=logger,
+                sink=sink,
+                file_entries=entries,
+                tree_str="",
+                no_header=False,
+                executor_kind=executor_kind,
+                jobs=args.jobs,
+            )
+            best = min(best, time.perf_counter() - started)
+        outputs[executor_kind] = sink.getvalue()
+        print(f"{executor_kind:>10}{best:>11.3f}s{stats['cleaned']:>10}")
+
+    if len(set(outputs.values())) != 1:
+        print("❌ Kết quả giữa các executor không khớp.")
+        sys.exit(1)
+    print("✅ Kết quả giữa các executor khớp byte-by-byte.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Path: scripts/benchmarks/pack_tree_render.py
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modules.pack_code.pack_code_internal import generate_tree_string
+
+FileResult = Dict[str, Any]
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DIR_NAMES = ("src", "lib", "core", "utils", "api", "tests", "docs", "internal")
+FILE_SUFFIXES = ("py", "md", "js", "ts", "json", "txt")
+
+
+def legacy_generate_tree_string(
+    all_file_results: List[FileResult], reporting_root: Path
+) -> str:
+    tree_lines: List[str] = [f"{reporting_root.name}/"]
+    all_relative_parts: Set[Path] = set()
+    for rel_path_str in {r["rel_path"] for r in all_file_results}:
+        rel_p = Path(rel_path_str)
+        all_relative_parts.add(rel_p)
+        for parent in rel_p.parents:
+            if parent != Path("."):
+                all_relative_parts.add(parent)
+
+    sorted_parts = sorted(list(all_relative_parts), key=lambda p: p.parts)
+    level_prefixes: Dict[int, str] = {}
+
+    for part in sorted_parts:
+        level = len(part.parts) - 1
+        prefix = "".join(
+            level_prefixes.get(level_index, "    ") for level_index in range(level)
+        )
+        siblings = [
+            p
+            for p in sorted_parts
+            if p.parent == part.parent and len(p.parts) == len(part.parts)
+        ]
+        is_last = part == siblings[-1]
+        pointer = "└── " if is_last else "├── "
+        is_directory = any(p.parent == part for p in sorted_parts)
+        tree_lines.append(f"{prefix}{pointer}{part.name}{'/' if is_directory else ''}")
+
+        if is_directory:
+            level_prefixes[level] = "    " if is_last else "│   "
+        elif is_last:
+            for k in [k for k in level_prefixes if k >= level]:
+                del level_prefixes[k]
+
+    return "\n".join(tree_lines)
+
+
+def build_file_results(count: int, seed: int) -> List[FileResult]:
+    rng = random.Random(seed)
+    results: List[FileResult] = []
+    for index in range(count):
+        depth = rng.randint(0, 6)
+        parts = [f"{rng.choice(DIR_NAMES)}_{rng.randint(0, 9)}" for _ in range(depth)]
+        parts.append(f"file_{index}.{rng.choice(FILE_SUFFIXES)}")
+        results.append({"rel_path": "/".join(parts)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Đo thời gian generate_tree_string (pcode) trên danh sách đường dẫn tổng hợp."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(x) for x in v.split(",") if x.strip()],
+        default=DEFAULT_SIZES,
+        help="Số đường dẫn cần đo, phân cách bởi dấu phẩy. Mặc định: 1000,10000,100000.",
+    )
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument(
+        "--verify-up-to",
+        type=int,
+        default=1_000,
+        help="So sánh byte-by-byte với thuật toán cũ (O(n²)) cho các kích thước <= giá trị này.",
+    )
+    args = parser.parse_args()
+
+    reporting_root = Path("/tmp/project")
+    print(f"{'paths':>10}{'lines':>10}{'seconds':>12}  legacy")
+    print("-" * 44)
+
+    for size in args.sizes:
+        file_results = build_file_results(size, args.seed)
+
+        started = time.perf_counter()
+        tree_str = generate_tree_string(file_results, reporting_root)
+        elapsed = time.perf_counter() - started
+
+        legacy_status = "-"
+        if size <= args.verify_up_to:
+            legacy_started = time.perf_counter()
+            legacy_str = legacy_generate_tree_string(file_results, reporting_root)
+            legacy_elapsed = time.perf_counter() - legacy_started
+            if legacy_str != tree_str:
+                print(f"❌ Kết quả khác thuật toán cũ tại {size} đường dẫn.")
+                sys.exit(1)
+            legacy_status = f"{legacy_elapsed:.3f}s (khớp)"
+
+        print(
+            f"{size:>10}{tree_str.count(chr(10)) + 1:>10}{elapsed:>11.3f}s  {legacy_status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
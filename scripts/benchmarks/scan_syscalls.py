@@ -0,0 +1,172 @@
+# Path: scripts/benchmarks/scan_syscalls.py
+import argparse
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modules.tree.tree_executor import generate_tree
+from utils.core import (
+    compile_spec_from_patterns,
+    is_extension_matched,
+    is_path_matched,
+    scan_directory_recursive,
+)
+
+COUNTED_CALLS = ("stat", "lstat", "scandir", "readlink")
+
+IGNORE_PATTERNS = ["*.log", "build/", "node_modules/", "*.tmp", "dist/"]
+
+
+@contextmanager
+def count_syscalls() -> Iterator[Dict[str, int]]:
+    counts: Dict[str, int] = {name: 0 for name in COUNTED_CALLS}
+    originals = {name: getattr(os, name) for name in COUNTED_CALLS}
+
+    def make_wrapper(name: str, func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for name, func in originals.items():
+        setattr(os, name, make_wrapper(name, func))
+    try:
+        yield counts
+    finally:
+        for name, func in originals.items():
+            setattr(os, name, func)
+
+
+def build_tree(root: Path, width: int, depth: int, files_per_dir: int) -> int:
+    created = 0
+    pending = [(root, 0)]
+    while pending:
+        directory, level = pending.pop()
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(files_per_dir):
+            suffix = ("py", "md", "log", "txt")[i % 4]
+            (directory / f"file_{i}.{suffix}").write_text("x\n", encoding="utf-8")
+            created += 1
+        if level < depth:
+            for j in range(width):
+                name = ("build", "src", "lib", "pkg")[j % 4] + str(j)
+                pending.append((directory / name, level + 1))
+    (root / "build").mkdir(exist_ok=True)
+    (root / "vendor_mod").mkdir(exist_ok=True)
+    (root / "vendor_mod" / "skipped.py").write_text("x\n", encoding="utf-8")
+    return created
+
+
+def legacy_scan(
+    directory: Path,
+    scan_root: Path,
+    ignore_spec,
+    extensions_filter: Set[str],
+    submodule_paths: Set[Path],
+) -> List[Path]:
+    found: List[Path] = []
+    for path in directory.iterdir():
+        if is_path_matched(path, ignore_spec, scan_root):
+            continue
+        if path.resolve() in submodule_paths:
+            continue
+        if path.is_dir():
+            found.extend(
+                legacy_scan(
+                    path, scan_root, ignore_spec, extensions_filter, submodule_paths
+                )
+            )
+        elif path.is_file() and is_extension_matched(path, extensions_filter):
+            found.append(path)
+    return found
+
+
+def measure(label: str, func: Callable[[], object]) -> Dict[str, object]:
+    with count_syscalls() as counts:
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            result = func()
+        elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    row: Dict[str, object] = {"label": label, "seconds": elapsed, "total": total}
+    row.update(counts)
+    if isinstance(result, list):
+        row["files"] = len(result)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Đếm syscall (stat/lstat/scandir/readlink) của scanner và tree."
+    )
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--files-per-dir", type=int, default=12)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("scan_syscalls")
+    logger.addHandler(logging.NullHandler())
+
+    with tempfile.TemporaryDirectory(prefix="dutil_bench_") as tmp:
+        root = Path(tmp)
+        file_count = build_tree(root, args.width, args.depth, args.files_per_dir)
+        ignore_spec = compile_spec_from_patterns(IGNORE_PATTERNS, root)
+        submodule_paths = {(root / "vendor_mod").resolve()}
+        extensions = {"py", "md", "txt"}
+
+        rows = [
+            measure(
+                "legacy scan (is_path_matched + resolve)",
+                lambda: legacy_scan(
+                    root, root, ignore_spec, extensions, submodule_paths
+                ),
+            ),
+            measure(
+                "scan_directory_recursive (ScanContext)",
+                lambda: scan_directory_recursive(
+                    logger=logger,
+                    directory=root,
+                    scan_root=root,
+                    ignore_spec=ignore_spec,
+                    include_spec=None,
+                    prune_spec=None,
+                    extensions_filter=extensions,
+                    submodule_paths=submodule_paths,
+                ),
+            ),
+            measure(
+                "generate_tree (ScanContext)",
+                lambda: generate_tree(
+                    root,
+                    root,
+                    max_level=None,
+                    ignore_spec=ignore_spec,
+                    submodules=submodule_paths,
+                ),
+            ),
+        ]
+
+    print(f"Cây tổng hợp: {file_count} file")
+    header = f"{'case':<42}{'files':>8}{'stat':>9}{'lstat':>9}{'scandir':>9}{'total':>9}{'sec':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['label']:<42}{row.get('files', '-'):>8}{row['stat']:>9}"
+            f"{row['lstat']:>9}{row['scandir']:>9}{row['total']:>9}"
+            f"{row['seconds']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Path: tests/test_code_formatter.py
+import logging
+import shutil
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+pytest.importorskip("black")
+
+from utils.constants import BLACK_SUBPROCESS_ENV, TRANSFORM_CACHE_DISABLE_ENV
+from utils.core import (
+    close_transform_cache,
+    format_code,
+    format_files_in_place,
+    get_transform_cache,
+)
+from utils.core import transform_cache
+
+__all__: List[str] = []
+
+LOGGER = logging.getLogger(__name__)
+
+INVALID_SOURCE = "def broken(:\n    pass\n"
+VALID_SOURCE = "x  =  [1,2]\n"
+
+
+@pytest.fixture
+def isolated_transform_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[transform_cache.TransformCache]:
+    monkeypatch.delenv(TRANSFORM_CACHE_DISABLE_ENV, raising=False)
+    monkeypatch.setattr(transform_cache, "TRANSFORM_CACHE_DIR", tmp_path)
+    close_transform_cache(LOGGER, report=False)
+    cache = get_transform_cache(LOGGER)
+    assert cache is not None
+    yield cache
+    close_transform_cache(LOGGER, report=False)
+
+
+@pytest.mark.parametrize(
+    "use_subprocess", [False, True], ids=["in-process", "subprocess"]
+)
+def test_failed_format_is_not_cached(
+    isolated_transform_cache: transform_cache.TransformCache,
+    monkeypatch: pytest.MonkeyPatch,
+    use_subprocess: bool,
+) -> None:
+    if use_subprocess:
+        if shutil.which("black") is None:
+            pytest.skip("black CLI không có trong $PATH")
+        monkeypatch.setenv(BLACK_SUBPROCESS_ENV, "1")
+
+    for _ in range(2):
+        assert format_code(INVALID_SOURCE, "python", LOGGER) == INVALID_SOURCE
+
+    stats = isolated_transform_cache.stats()
+    assert stats["stores"] == 0
+    assert stats["hits"] == 0
+    assert stats["misses"] == 2
+
+
+def test_successful_format_is_cached(
+    isolated_transform_cache: transform_cache.TransformCache,
+) -> None:
+    for _ in range(2):
+        assert format_code(VALID_SOURCE, "python", LOGGER) == "x = [1, 2]\n"
+
+    stats = isolated_transform_cache.stats()
+    assert stats["stores"] == 1
+    assert stats["hits"] == 1
+
+
+def test_batch_format_matches_per_file_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(TRANSFORM_CACHE_DISABLE_ENV, "1")
+    sources = {
+        "valid.py": VALID_SOURCE,
+        "stub.pyi": "class A:\n\n\n    def f(self) -> int: ...\n",
+        "broken.py": INVALID_SOURCE,
+        "clean.py": "y = 1\n",
+    }
+    paths = []
+    for name, content in sources.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+        paths.append(tmp_path / name)
+    expected = {
+        path.name: format_code(sources[path.name], "python", LOGGER, path)
+        for path in paths
+    }
+
+    changed, not_formatted = format_files_in_place(paths, "python", LOGGER)
+
+    assert not_formatted == []
+    assert sorted(path.name for path in changed) == ["stub.pyi", "valid.py"]
+    assert {path.name: path.read_text(encoding="utf-8") for path in paths} == expected
@@ -0,0 +1,314 @@
+# Path: tests/test_pack_code.py
+import logging
+import os
+import subprocess
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from modules.pack_code.pack_code_internal import ArchiveReader, build_read_options
+from modules.pack_code.pack_code_internal.pack_code_manifest import manifest_path_for
+from modules.pack_code.pack_code_internal.pack_code_unpack import (
+    _safe_target,
+    index_path_for,
+    resolve_pack_paths,
+)
+
+__all__: List[str] = []
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PCODE_SCRIPT = PROJECT_ROOT / "tools" / "pack_code.py"
+PCODE_TIMEOUT_SECONDS = 120
+
+SOURCE_FILES: Dict[str, str] = {
+    **{
+        f"pkg/mod_{index}.py": "".join(
+            f"value_{line} = {line}\n" for line in range(40 * (index + 1))
+        )
+        for index in range(5)
+    },
+    "pkg/sub/notes.md": "# Notes\n\nMột dòng tiếng Việt.\n",
+    "pkg/sub/empty.py": "",
+    "pkg/sub/no_newline.py": "x = 1",
+}
+
+
+def _run_pcode(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, DUTIL_NO_TRANSFORM_CACHE="1")
+    result = subprocess.run(
+        [sys.executable, str(PCODE_SCRIPT), *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=PCODE_TIMEOUT_SECONDS,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result
+
+
+def _write_tree(root: Path, files: Dict[str, str]) -> None:
+    for rel_path, content in files.items():
+        target = root / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+
+def _read_tree(root: Path) -> Dict[str, str]:
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    _write_tree(tmp_path / "src", SOURCE_FILES)
+    (tmp_path / "out").mkdir()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pack_args",
+    [
+        pytest.param(["--max-bytes", "2000"], id="sharded"),
+        pytest.param(["--index"], id="indexed"),
+        pytest.param([], id="marker-scan"),
+    ],
+)
+def test_pack_unpack_round_trip(workspace: Path, pack_args: List[str]) -> None:
+    pack_path = workspace / "out" / "pack.txt"
+    _run_pcode(workspace, "src", "-e", "py,md", "-o", str(pack_path), *pack_args)
+
+    pack_paths = resolve_pack_paths(pack_path)
+    if "--max-bytes" in pack_args:
+        assert len(pack_paths) > 1
+        assert all(path.stat().st_size <= 2000 for path in pack_paths)
+    else:
+        assert pack_paths == [pack_path]
+    assert index_path_for(pack_path).exists() == ("--index" in pack_args)
+
+    restored = workspace / "restored"
+    _run_pcode(workspace, "unpack", "-p", str(pack_path), "-d", str(restored))
+
+    assert _read_tree(restored) == SOURCE_FILES
+
+
+def test_cat_reads_sharded_file(workspace: Path) -> None:
+    pack_path = workspace / "out" / "pack.txt"
+    _run_pcode(
+        workspace, "src", "-e", "py,md", "-o", str(pack_path), "--max-bytes", "2000"
+    )
+
+    result = _run_pcode(workspace, "cat", "pkg/mod_4.py", "-p", str(pack_path))
+
+    assert result.stdout == SOURCE_FILES["pkg/mod_4.py"]
+
+
+@pytest.mark.parametrize(
+    "rel_path",
+    ["../escape.txt", "pkg/../../escape.txt", "/etc/passwd", "", "."],
+)
+def test_safe_target_rejects_traversal(tmp_path: Path, rel_path: str) -> None:
+    assert _safe_target(tmp_path, rel_path) is None
+
+
+def test_safe_target_accepts_nested_path(tmp_path: Path) -> None:
+    assert _safe_target(tmp_path, "pkg/sub/a.py") == tmp_path / "pkg" / "sub" / "a.py"
+
+
+def test_unpack_skips_unsafe_entries(tmp_path: Path) -> None:
+    pack_path = tmp_path / "evil.txt"
+    pack_path.write_text(
+        "[[START_FILE_CONTENT: ../escape.txt]]\nowned\n[[END_FILE_CONTENT: ../escape.txt]]\n\n"
+        "[[START_FILE_CONTENT: ok/safe.txt]]\nfine\n[[END_FILE_CONTENT: ok/safe.txt]]\n",
+        encoding="utf-8",
+    )
+    dest_dir = tmp_path / "dest"
+
+    _run_pcode(tmp_path, "unpack", "-p", str(pack_path), "-d", str(dest_dir))
+
+    assert not (tmp_path / "escape.txt").exists()
+    assert _read_tree(dest_dir) == {"ok/safe.txt": "fine"}
+
+
+def test_incremental_pack_matches_full_pack(workspace: Path) -> None:
+    full_path = workspace / "out" / "full.txt"
+    incremental_path = workspace / "out" / "incremental.txt"
+
+    def _pack_both() -> None:
+        _run_pcode(workspace, "src", "-e", "py,md", "-o", str(full_path))
+        _run_pcode(
+            workspace,
+            "src",
+            "-e",
+            "py,md",
+            "-o",
+            str(incremental_path),
+            "--incremental",
+        )
+        assert incremental_path.read_bytes() == full_path.read_bytes()
+        assert manifest_path_for(incremental_path).is_file()
+
+    _pack_both()
+    _pack_both()
+
+    source_dir = workspace / "src"
+    (source_dir / "pkg" / "mod_1.py").write_text("changed = True\n", encoding="utf-8")
+    (source_dir / "pkg" / "mod_3.py").unlink()
+    (source_dir / "pkg" / "added.py").write_text("added = 1\n", encoding="utf-8")
+    _pack_both()
+
+
+def _write_archive(archive_path: Path, files: Dict[str, str]) -> None:
+    members = sorted(files, reverse=True)
+    if archive_path.suffix == ".zip":
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            for rel_path in members:
+                archive.writestr(f"project/{rel_path}", files[rel_path])
+        return
+
+    mode = "w:gz" if archive_path.name.endswith(".tar.gz") else "w"
+    source_dir = archive_path.parent / "archive_src"
+    _write_tree(source_dir, files)
+    with tarfile.open(archive_path, mode) as archive:
+        for rel_path in members:
+            archive.add(source_dir / rel_path, arcname=f"project/{rel_path}")
+
+
+def _packed_paths(pack_path: Path) -> List[str]:
+    prefix = "[[START_FILE_CONTENT: "
+    return [
+        line[len(prefix) : -2]
+        for line in pack_path.read_text(encoding="utf-8").splitlines()
+        if line.startswith(prefix)
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_archive_inputs_pack_in_sorted_order(tmp_path: Path, executor: str) -> None:
+    packs: Dict[str, bytes] = {}
+    for archive_name in ("src.zip", "src.tar", "src.tar.gz"):
+        archive_dir = tmp_path / archive_name.replace(".", "_") / "work"
+        archive_dir.mkdir(parents=True)
+        archive_path = archive_dir / archive_name
+        _write_archive(archive_path, SOURCE_FILES)
+
+        pack_path = archive_dir / "pack.txt"
+        _run_pcode(
+            archive_dir,
+            archive_name,
+            "-e",
+            "py",
+            "-a",
+            "--executor",
+            executor,
+            "-j",
+            "2",
+            "-o",
+            str(pack_path),
+        )
+
+        packed_paths = _packed_paths(pack_path)
+        expected = sorted(
+            f"{archive_name}/project/{rel_path}"
+            for rel_path in SOURCE_FILES
+            if rel_path.endswith(".py")
+        )
+        assert packed_paths == expected
+        packs[archive_name] = pack_path.read_bytes().replace(
+            archive_name.encode("utf-8"), b"<archive>"
+        )
+
+    assert packs["src.zip"] == packs["src.tar"] == packs["src.tar.gz"]
+
+
+@pytest.mark.parametrize("max_cached_bytes, single_pass", [(0, False), (1 << 20, True)])
+def test_compressed_tar_reads_in_bounded_forward_passes(
+    tmp_path: Path, max_cached_bytes: int, single_pass: bool
+) -> None:
+    archive_path = tmp_path / "src.tar.gz"
+    _write_archive(archive_path, SOURCE_FILES)
+    logger = logging.getLogger(__name__)
+    read_options = build_read_options(
+        base_dir=archive_path,
+        all_clean=False,
+        clean_extensions_set=set(),
+        format_flag=False,
+        format_extensions_set=set(),
+    )
+
+    reader = ArchiveReader(logger, max_cached_bytes=max_cached_bytes)
+    try:
+        entries = sorted(
+            (
+                {
+                    "path": archive_path / name,
+                    "rel_path": name,
+                    "read_options": read_options,
+                    "archive": archive_path.as_posix(),
+                    "archive_member": member,
+                }
+                for name, member in reader.open(archive_path)
+            ),
+            key=lambda entry: entry["rel_path"],
+        )
+        reader.plan_reads(entries)
+        contents = {
+            entry["rel_path"]: reader.read_entry(logger, entry)[0] for entry in entries
+        }
+        source = reader.sources[archive_path.as_posix()]
+        assert (source.passes == 1) == single_pass
+        assert source.cached_bytes == 0
+    finally:
+        reader.close()
+
+    assert contents == {
+        f"project/{rel_path}": content for rel_path, content in SOURCE_FILES.items()
+    }
+
+
+def test_incremental_pack_tracks_black_config(tmp_path: Path) -> None:
+    pytest.importorskip("black")
+    source_dir = tmp_path / "src"
+    _write_tree(
+        source_dir,
+        {
+            "pyproject.toml": "[tool.black]\nline-length = 120\n",
+            "pkg/calls.py": "result = compute(first_argument, second_argument, third_argument)\n",
+        },
+    )
+    full_path = tmp_path / "full.txt"
+    incremental_path = tmp_path / "incremental.txt"
+
+    def _pack_both() -> None:
+        _run_pcode(tmp_path, "src", "-e", "py", "-b", "-o", str(full_path))
+        _run_pcode(
+            tmp_path,
+            "src",
+            "-e",
+            "py",
+            "-b",
+            "-o",
+            str(incremental_path),
+            "--incremental",
+        )
+        assert incremental_path.read_bytes() == full_path.read_bytes()
+
+    _pack_both()
+    assert "compute(first_argument, second_argument" in full_path.read_text(
+        encoding="utf-8"
+    )
+
+    (source_dir / "pyproject.toml").write_text(
+        "[tool.black]\nline-length = 40\n", encoding="utf-8"
+    )
+    _pack_both()
+    assert "compute(first_argument, second_argument" not in full_path.read_text(
+        encoding="utf-8"
+    )
@@ -0,0 +1,194 @@
+# Path: tests/test_scanner.py
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+pytest.importorskip("pathspec")
+
+from utils.core import (
+    SubmoduleTrie,
+    clear_gitignore_cache,
+    compile_spec_from_patterns,
+    parse_gitignore,
+    scan_directory_recursive,
+)
+from utils.core import scan_index
+
+__all__: List[str] = []
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PCODE_SCRIPT = PROJECT_ROOT / "tools" / "pack_code.py"
+GIT_TIMEOUT_SECONDS = 60
+PCODE_TIMEOUT_SECONDS = 120
+BACKDATE_SECONDS = 3600
+
+REPO_FILES: Dict[str, str] = {
+    ".gitignore": "*.log\n",
+    ".dutil-cache/kept.py": "kept = 1\n",
+    "a.py": "a = 1\n",
+    "a.log": "log\n",
+    "other/f.tmp": "tmp\n",
+    "other/g.log": "log\n",
+    "sub/.gitignore": "*.bak\nbuild/\n",
+    "sub/b.py": "b = 1\n",
+    "sub/x.bak": "bak\n",
+    "sub/x.log": "log\n",
+    "sub/build/c.py": "c = 1\n",
+    "sub/deeper/.gitignore": "*.tmp\n!keep.bak\n",
+    "sub/deeper/d.tmp": "tmp\n",
+    "sub/deeper/e.py": "e = 1\n",
+    "sub/deeper/keep.bak": "keep\n",
+    "sub/deeper/y.bak": "bak\n",
+}
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=GIT_TIMEOUT_SECONDS,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def _write_tree(root: Path, files: Dict[str, str]) -> None:
+    for rel_path, content in files.items():
+        target = root / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+
+def _backdate_tree(root: Path) -> None:
+    past = os.stat(root).st_mtime - BACKDATE_SECONDS
+    for directory, _, file_names in os.walk(root):
+        for name in file_names:
+            os.utime(os.path.join(directory, name), (past, past))
+        os.utime(directory, (past, past))
+
+
+def _scan(root: Path, scan_backend: str = "walk", use_scan_cache: bool = False):
+    clear_gitignore_cache()
+    ignore_spec = compile_spec_from_patterns([".git"] + parse_gitignore(root), root)
+    return sorted(
+        path.relative_to(root).as_posix()
+        for path in scan_directory_recursive(
+            logger=logging.getLogger(__name__),
+            directory=root,
+            scan_root=root,
+            ignore_spec=ignore_spec,
+            include_spec=None,
+            prune_spec=None,
+            extensions_filter=None,
+            submodule_paths=set(),
+            use_scan_cache=use_scan_cache,
+            scan_backend=scan_backend,
+        )
+    )
+
+
+def _git_visible_files(root: Path) -> List[str]:
+    return sorted(
+        _git(root, "ls-files", "--cached", "--others", "--exclude-standard")
+        .strip()
+        .splitlines()
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _write_tree(root, REPO_FILES)
+    return root
+
+
+@pytest.fixture
+def isolated_scan_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    index_dir = tmp_path / "scan_index"
+    monkeypatch.setattr(scan_index, "SCAN_INDEX_DIR", index_dir)
+    return index_dir
+
+
+def test_submodule_trie_lookups() -> None:
+    trie = SubmoduleTrie(["libs/core", "vendor/a/b"])
+    trie.add("tools")
+
+    assert sorted(trie.paths()) == ["libs/core", "tools", "vendor/a/b"]
+    assert trie.is_root("libs/core")
+    assert not trie.is_root("libs")
+    assert not trie.is_root("vendor/a")
+    assert trie.contains("libs/core/src/x.py")
+    assert trie.contains("tools")
+    assert not trie.contains("libs/core_extra/x.py")
+    assert not trie.contains("vendor/a")
+
+
+@pytest.mark.parametrize("scan_backend", ["walk", "git"])
+def test_nested_gitignore_matches_git(repo: Path, scan_backend: str) -> None:
+    assert _scan(repo, scan_backend) == _git_visible_files(repo)
+
+
+def test_scan_cache_tracks_tree_changes(repo: Path, isolated_scan_index: Path) -> None:
+    _backdate_tree(repo)
+    expected = _scan(repo)
+
+    assert _scan(repo, use_scan_cache=True) == expected
+    assert any(isolated_scan_index.iterdir())
+    assert _scan(repo, use_scan_cache=True) == expected
+
+    (repo / "sub" / "deeper" / "new.py").write_text("n = 1\n", encoding="utf-8")
+    (repo / "sub" / "b.py").unlink()
+    (repo / "sub" / ".gitignore").write_text("build/\n", encoding="utf-8")
+
+    changed = _scan(repo, use_scan_cache=True)
+    assert changed == _scan(repo)
+    assert changed == _git_visible_files(repo)
+    assert "sub/deeper/new.py" in changed
+    assert "sub/b.py" not in changed
+    assert "sub/x.bak" in changed
+    assert "sub/deeper/y.bak" in changed
+
+
+def test_pack_rev_reads_committed_content(repo: Path, tmp_path: Path) -> None:
+    _git(repo, "add", "-A")
+    _git(
+        repo,
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-q",
+        "-m",
+        "init",
+    )
+    (repo / "a.py").write_text("a = 2\n", encoding="utf-8")
+    (repo / "untracked.py").write_text("u = 1\n", encoding="utf-8")
+
+    pack_path = tmp_path / "pack.txt"
+    env = dict(os.environ, DUTIL_NO_TRANSFORM_CACHE="1")
+    result = subprocess.run(
+        [sys.executable, str(PCODE_SCRIPT), ".", "-e", "py", "-a"]
+        + ["--rev", "HEAD", "-o", str(pack_path)],
+        cwd=repo,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=PCODE_TIMEOUT_SECONDS,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    packed = pack_path.read_text(encoding="utf-8")
+    assert "a = 1" in packed
+    assert "a = 2" not in packed
+    assert "sub/deeper/e.py" in packed
+    assert "untracked.py" not in packed
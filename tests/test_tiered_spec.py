@@ -0,0 +1,93 @@
+# Path: tests/test_tiered_spec.py
+import itertools
+import random
+from typing import List
+
+import pytest
+
+pathspec = pytest.importorskip("pathspec")
+
+from utils.core.tiered_spec import compile_tiered_spec
+
+__all__: List[str] = []
+
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+NAMES = ["src", "build", "node_modules", "a.py", "b.log", "lib.min.js", ".env", "x"]
+EXTENSIONS = [".py", ".log", ".js", ".min.js", ".txt"]
+
+PATTERN_FAMILIES = {
+    "name": ["build", "node_modules", ".env", "a.py", "x"],
+    "suffix": ["*.log", "*.py", "*.min.js", "*.txt"],
+    "anchored": ["/build", "/src/x", "src/lib.min.js", "/x/a.py"],
+    "dir_only": ["build/", "x/", "node_modules/", "*.log/", "/src/"],
+    "double_star": ["**/x", "src/**", "**/build/**/*.py", "a/**/b.log"],
+    "char_class": ["*.[pt]y", "[ab].*", "b.l?g", "[!x]*.js"],
+    "negation": ["*.log", "!b.log", "build/", "!build/a.py"],
+}
+
+
+def _generate_paths(seed: int, count: int) -> List[str]:
+    rng = random.Random(seed)
+    paths = set()
+    while len(paths) < count:
+        depth = rng.randint(1, 4)
+        parts = [rng.choice(NAMES) for _ in range(depth)]
+        if rng.random() < 0.5:
+            parts[-1] = rng.choice(["a", "b", "lib", "x"]) + rng.choice(EXTENSIONS)
+        path = "/".join(parts)
+        if rng.random() < 0.2:
+            path += "/"
+        paths.add(path)
+    return sorted(paths)
+
+
+PATHS = _generate_paths(seed=1234, count=400)
+
+
+def _pattern_sets():
+    for family, patterns in PATTERN_FAMILIES.items():
+        yield pytest.param(patterns, id=family)
+        for pattern in patterns:
+            yield pytest.param([pattern], id=f"{family}:{pattern}")
+
+    rng = random.Random(4321)
+    pool = list(itertools.chain.from_iterable(PATTERN_FAMILIES.values()))
+    for index in range(20):
+        yield pytest.param(rng.sample(pool, rng.randint(2, 8)), id=f"mixed-{index}")
+
+
+@pytest.mark.parametrize("patterns", list(_pattern_sets()))
+def test_match_file_agrees_with_pathspec(patterns: List[str]) -> None:
+    expected_spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    tiered_spec = compile_tiered_spec(patterns)
+
+    mismatches = [
+        path
+        for path in PATHS
+        if tiered_spec.match_file(path) != expected_spec.match_file(path)
+    ]
+    assert mismatches == []
+
+
+def test_negation_uses_pathspec_fallback() -> None:
+    tiered_spec = compile_tiered_spec(PATTERN_FAMILIES["negation"])
+
+    assert tiered_spec.has_negation
+    assert tiered_spec.match_file("src/a.log")
+    assert not tiered_spec.match_file("src/b.log")
+    assert tiered_spec.check_match("src/b.log") is False
+
+
+def test_literal_patterns_skip_regex_tier() -> None:
+    patterns = (
+        PATTERN_FAMILIES["name"]
+        + PATTERN_FAMILIES["suffix"]
+        + PATTERN_FAMILIES["anchored"]
+    )
+    tiered_spec = compile_tiered_spec(patterns)
+
+    assert tiered_spec.regex_spec is None
+    assert tiered_spec.names
+    assert tiered_spec.suffixes
+    assert tiered_spec.anchored
@@ -28,6 +28,7 @@ try:
         ConfigInitializer,
         run_cli_app,
     )
+    from utils.constants import DEFAULT_SCAN_BACKEND, SCAN_BACKEND_CHOICES
     from utils.logging_config import setup_logging
 except ImportError as e:
     print(f"Lỗi: Không thể import project utilities/modules: {e}", file=sys.stderr)
@@ -92,6 +93,19 @@ def main():
         help="Chế độ gia tăng. Chỉ quét các file đã thay đổi kể từ lần chạy cuối cùng có cùng cài đặt.",
     )
 
+    pack_group.add_argument(
+        "--scan-cache",
+        action="store_true",
+        help="Dùng scan index trên đĩa (~/.cache/dutil/scan/) để bỏ qua các thư mục không thay đổi.",
+    )
+
+    pack_group.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKEND_CHOICES,
+        default=DEFAULT_SCAN_BACKEND,
+        help="Backend liệt kê file: 'walk' (quét thư mục bằng Python) hoặc 'git' (git ls-files, tự động quay về 'walk' nếu không phải Git repo).",
+    )
+
     config_group = parser.add_argument_group("Khởi tạo Cấu hình (chạy riêng)")
     config_group.add_argument(
         "-c",
@@ -28,6 +28,12 @@ try:
         ConfigInitializer,
         run_cli_app,
     )
+    from utils.constants import (
+        DEFAULT_EXECUTOR,
+        DEFAULT_SCAN_BACKEND,
+        EXECUTOR_CHOICES,
+        SCAN_BACKEND_CHOICES,
+    )
     from utils.logging_config import setup_logging
 except ImportError as e:
     print(f"Lỗi: Không thể import project utilities/modules: {e}", file=sys.stderr)
@@ -106,6 +112,33 @@ def main():
         help="Chế độ gia tăng. Chỉ quét các file đã thay đổi kể từ lần chạy cuối cùng có cùng cài đặt.",
     )
 
+    pack_group.add_argument(
+        "--scan-cache",
+        action="store_true",
+        help="Dùng scan index trên đĩa (~/.cache/dutil/scan/) để bỏ qua các thư mục không thay đổi.",
+    )
+
+    pack_group.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKEND_CHOICES,
+        default=DEFAULT_SCAN_BACKEND,
+        help="Backend liệt kê file: 'walk' (quét thư mục bằng Python) hoặc 'git' (git ls-files, tự động quay về 'walk' nếu không phải Git repo).",
+    )
+
+    pack_group.add_argument(
+        "--executor",
+        choices=EXECUTOR_CHOICES,
+        default=DEFAULT_EXECUTOR,
+        help="Backend làm sạch/định dạng: 'auto' (mặc định; dùng 'process' cho tác vụ CPU khi máy có nhiều CPU, ngược lại 'thread'), 'thread', 'process' (đọc file bằng thread, làm sạch theo batch trong ProcessPoolExecutor) hoặc 'interpreter' (không dùng được với libcst, tự chuyển sang 'process').",
+    )
+    pack_group.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Số worker (thread hoặc process) dùng để làm sạch/định dạng. Mặc định: số CPU.",
+    )
+
     config_group = parser.add_argument_group("Khởi tạo Cấu hình (chạy riêng)")
 
     config_group.add_argument(
@@ -125,6 +158,8 @@ def main():
         argcomplete.autocomplete(parser)
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs <= 0:
+        parser.error("--jobs phải là số nguyên dương.")
 
     logger = setup_logging(script_name="NDoc")
     logger.debug("Ndoc script started.")
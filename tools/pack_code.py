@@ -2,7 +2,7 @@
 import argparse
 import sys
 from pathlib import Path
-from typing import Final
+from typing import Final, List
 
 try:
     import argcomplete
@@ -17,17 +17,26 @@ try:
         CONFIG_FILENAME,
         CONFIG_SECTION_NAME,
         DEFAULT_START_PATH,
+        EXTRACT_COMMANDS,
         MODULE_DIR,
         PCODE_DEFAULTS,
         PROJECT_CONFIG_FILENAME,
         PROJECT_CONFIG_ROOT_KEY,
         TEMPLATE_FILENAME,
         orchestrate_pack_code,
+        orchestrate_pack_extract,
     )
     from utils.cli import (
         ConfigInitializer,
         run_cli_app,
     )
+    from utils.constants import (
+        CONSOLE_LOG_LEVEL,
+        DEFAULT_EXECUTOR,
+        DEFAULT_SCAN_BACKEND,
+        EXECUTOR_CHOICES,
+        SCAN_BACKEND_CHOICES,
+    )
     from utils.logging_config import setup_logging
 except ImportError as e:
     print(f"Lỗi: Không thể import project utilities/modules: {e}", file=sys.stderr)
@@ -36,11 +45,89 @@ except ImportError as e:
 THIS_SCRIPT_PATH: Final[Path] = Path(__file__).resolve()
 
 
+def extract_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="pcode",
+        description="Trích xuất file từ một file pack (output của pcode).",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    cat_parser = subparsers.add_parser(
+        "cat",
+        help="In nội dung của một hoặc nhiều file trong pack ra stdout.",
+        epilog="Ví dụ: pcode cat utils/constants.py -p my_context.txt",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    cat_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Đường dẫn tương đối hoặc glob (ví dụ: 'utils/*.py') của file trong pack.",
+    )
+
+    unpack_parser = subparsers.add_parser(
+        "unpack",
+        help="Khôi phục cây thư mục từ pack (song song).",
+        epilog="Ví dụ: pcode unpack -p my_context.txt -d ./restored",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    unpack_parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[],
+        help="Chỉ giải nén các file khớp (đường dẫn hoặc glob). Mặc định: tất cả.",
+    )
+    unpack_parser.add_argument(
+        "-d",
+        "--dest",
+        type=str,
+        default=".",
+        help="Thư mục đích. Mặc định: thư mục hiện tại.",
+    )
+    unpack_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ghi đè các file đã tồn tại trong thư mục đích.",
+    )
+    unpack_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Số luồng ghi file song song.",
+    )
+
+    for sub_parser in (cat_parser, unpack_parser):
+        sub_parser.add_argument(
+            "-p",
+            "--pack",
+            type=Path,
+            default=None,
+            help="File pack cần đọc (tự động nhận các shard <tên>.001.txt, ...). Mặc định: output mặc định của thư mục hiện tại.",
+        )
+
+    args = parser.parse_args(argv)
+
+    console_level = "WARNING" if args.command == "cat" else CONSOLE_LOG_LEVEL
+    logger = setup_logging(script_name="PCode", console_level_str=console_level)
+    logger.debug(f"PCode {args.command} started.")
+
+    run_cli_app(
+        logger=logger,
+        orchestrator_func=orchestrate_pack_extract,
+        cli_args=args,
+        this_script_path=THIS_SCRIPT_PATH,
+    )
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in EXTRACT_COMMANDS:
+        extract_main(sys.argv[1:])
+        return
 
     parser = argparse.ArgumentParser(
         description="Đóng gói mã nguồn thành một file context duy nhất cho LLM.",
-        epilog="Ví dụ: pcode . -e 'py,md' -a -o 'my_context.txt'",
+        epilog="Ví dụ: pcode . -e 'py,md' -a -o 'my_context.txt'\nTrích xuất: pcode cat <path> -p <pack> | pcode unpack -p <pack> -d <dir>",
         formatter_class=argparse.RawTextHelpFormatter,
     )
 
@@ -50,7 +137,7 @@ def main():
         type=str,
         nargs="*",
         default=[],
-        help=f'Các đường dẫn (file hoặc thư mục) để quét. Mặc định: "{DEFAULT_START_PATH}".',
+        help=f'Các đường dẫn (file, thư mục hoặc file nén .zip/.tar/.tar.gz/.tar.xz) để quét. Mặc định: "{DEFAULT_START_PATH}".',
     )
     pack_group.add_argument(
         "-o",
@@ -127,6 +214,36 @@ def main():
         action="store_true",
         help="Không hiển thị cây thư mục ở đầu file output.",
     )
+    pack_group.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="Chia output thành nhiều shard (<tên>.001.txt, ...), mỗi shard tối đa N token (ước lượng).",
+    )
+    pack_group.add_argument(
+        "--max-bytes",
+        type=int,
+        default=None,
+        help="Chia output thành nhiều shard, mỗi shard tối đa N byte. Có thể kết hợp với --max-tokens.",
+    )
+    pack_group.add_argument(
+        "--rev",
+        type=str,
+        default=None,
+        metavar="TREE_ISH",
+        help="Đóng gói nội dung tại một revision Git (tag, branch, commit) mà không cần checkout. Đọc file qua 'git ls-tree' và một tiến trình 'git cat-file --batch'.",
+    )
+    pack_group.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Ghi manifest cạnh file output và tái sử dụng nội dung của các file không đổi từ lần đóng gói trước.",
+    )
+    pack_group.add_argument(
+        "--index",
+        action="store_true",
+        dest="write_index",
+        help="Ghi index offset của từng file (<output>.index.json) để 'pcode cat'/'pcode unpack' truy cập trực tiếp.",
+    )
     pack_group.add_argument(
         "--copy",
         action="store_true",
@@ -134,6 +251,33 @@ def main():
         help="Tự động sao chép ĐƯỜNG DẪN file output vào clipboard.",
     )
 
+    pack_group.add_argument(
+        "--executor",
+        choices=EXECUTOR_CHOICES,
+        default=DEFAULT_EXECUTOR,
+        help="Backend làm sạch/định dạng: 'auto' (mặc định; dùng 'process' cho tác vụ CPU khi máy có nhiều CPU, ngược lại 'thread'), 'thread', 'process' (đọc file bằng thread, làm sạch theo batch trong ProcessPoolExecutor) hoặc 'interpreter' (không dùng được với libcst, tự chuyển sang 'process').",
+    )
+    pack_group.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Số worker (thread hoặc process) dùng để làm sạch/định dạng. Mặc định: số CPU.",
+    )
+
+    pack_group.add_argument(
+        "--scan-cache",
+        action="store_true",
+        help="Dùng scan index trên đĩa (~/.cache/dutil/scan/) để bỏ qua các thư mục không thay đổi.",
+    )
+
+    pack_group.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKEND_CHOICES,
+        default=DEFAULT_SCAN_BACKEND,
+        help="Backend liệt kê file: 'walk' (quét thư mục bằng Python) hoặc 'git' (git ls-files, tự động quay về 'walk' nếu không phải Git repo).",
+    )
+
     config_group = parser.add_argument_group("Khởi tạo Cấu hình (chạy riêng)")
     config_group.add_argument(
         "-c",
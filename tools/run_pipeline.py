@@ -0,0 +1,122 @@
+# Path: tools/run_pipeline.py
+import argparse
+import sys
+from pathlib import Path
+from typing import Final
+
+try:
+    import argcomplete
+except ImportError:
+    argcomplete = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+try:
+    from modules.run_pipeline import (
+        DEFAULT_STAGES,
+        DEFAULT_START_PATH,
+        STAGE_CHOICES,
+        orchestrate_run_pipeline,
+    )
+    from utils.cli import run_cli_app
+    from utils.constants import DEFAULT_SCAN_BACKEND, SCAN_BACKEND_CHOICES
+    from utils.logging_config import setup_logging
+except ImportError as e:
+    print(f"Lỗi: Không thể import project utilities/modules: {e}", file=sys.stderr)
+    sys.exit(1)
+
+THIS_SCRIPT_PATH: Final[Path] = Path(__file__).resolve()
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Chạy nhiều công cụ (cpath, ndoc, forc) trong một lần quét: mỗi file chỉ được đọc và ghi một lần.",
+        epilog="Mặc định: Chạy ở chế độ sửa lỗi. Dùng -d để chạy thử.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    pipeline_group = parser.add_argument_group("Tùy chọn Pipeline")
+    pipeline_group.add_argument(
+        "stages",
+        type=str,
+        help=f"Danh sách giai đoạn theo thứ tự (phân cách bởi dấu phẩy). Hỗ trợ: {', '.join(STAGE_CHOICES)}.\nVí dụ: \"{DEFAULT_STAGES}\".",
+    )
+    pipeline_group.add_argument(
+        "start_paths_arg",
+        type=str,
+        nargs="*",
+        default=[],
+        help=f'Các đường dẫn (file hoặc thư mục) để quét. Mặc định: "{DEFAULT_START_PATH}".',
+    )
+    pipeline_group.add_argument(
+        "-r",
+        "--root",
+        type=str,
+        default=None,
+        help="Đường dẫn gốc (Project Root) tường minh để tính toán '# Path:'.\nMặc định: Tự động tìm gốc Git từ các đường dẫn đầu vào.",
+    )
+    pipeline_group.add_argument(
+        "-a",
+        "--all-clean",
+        action="store_true",
+        help="Giai đoạn ndoc: loại bỏ cả docstring và tất cả comments (ngoại trừ shebang).",
+    )
+    pipeline_group.add_argument(
+        "-I",
+        "--ignore",
+        type=str,
+        default=None,
+        help="Danh sách pattern (giống .gitignore) để bỏ qua, áp dụng cho mọi giai đoạn (THÊM vào config).",
+    )
+    pipeline_group.add_argument(
+        "-d",
+        "--dry-run",
+        action="store_true",
+        help="Chỉ chạy ở chế độ kiểm tra (dry-run) và báo cáo các file cần sửa, không thực hiện ghi file.",
+    )
+    pipeline_group.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Ghi đè file mà không hỏi xác nhận (chỉ áp dụng ở chế độ fix).",
+    )
+    pipeline_group.add_argument(
+        "-g",
+        "--git-commit",
+        action="store_true",
+        help="Tạo MỘT commit Git duy nhất cho mọi thay đổi sau khi hoàn tất.",
+    )
+
+    pipeline_group.add_argument(
+        "--scan-cache",
+        action="store_true",
+        help="Dùng scan index trên đĩa (~/.cache/dutil/scan/) để bỏ qua các thư mục không thay đổi.",
+    )
+
+    pipeline_group.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKEND_CHOICES,
+        default=DEFAULT_SCAN_BACKEND,
+        help="Backend liệt kê file: 'walk' (quét thư mục bằng Python) hoặc 'git' (git ls-files, tự động quay về 'walk' nếu không phải Git repo).",
+    )
+
+    if argcomplete:
+        argcomplete.autocomplete(parser)
+
+    args = parser.parse_args()
+
+    logger = setup_logging(script_name="DRun")
+    logger.debug("DRun script started.")
+
+    run_cli_app(
+        logger=logger,
+        orchestrator_func=orchestrate_run_pipeline,
+        cli_args=args,
+        this_script_path=THIS_SCRIPT_PATH,
+    )
+
+
+if __name__ == "__main__":
+    main()
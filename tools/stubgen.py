@@ -27,6 +27,12 @@ try:
         ConfigInitializer,
         run_cli_app,
     )
+    from utils.constants import (
+        DEFAULT_EXECUTOR,
+        DEFAULT_SCAN_BACKEND,
+        EXECUTOR_CHOICES,
+        SCAN_BACKEND_CHOICES,
+    )
     from utils.logging_config import setup_logging
 except ImportError as e:
     print(f"Lỗi: Không thể import project utilities/modules: {e}", file=sys.stderr)
@@ -72,6 +78,33 @@ def main():
         help="Tự động commit các thay đổi vào Git sau khi hoàn tất.",
     )
 
+    stubgen_group.add_argument(
+        "--scan-cache",
+        action="store_true",
+        help="Dùng scan index trên đĩa (~/.cache/dutil/scan/) để bỏ qua các thư mục không thay đổi.",
+    )
+
+    stubgen_group.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKEND_CHOICES,
+        default=DEFAULT_SCAN_BACKEND,
+        help="Backend liệt kê file: 'walk' (quét thư mục bằng Python) hoặc 'git' (git ls-files, tự động quay về 'walk' nếu không phải Git repo).",
+    )
+
+    stubgen_group.add_argument(
+        "--executor",
+        choices=EXECUTOR_CHOICES,
+        default=DEFAULT_EXECUTOR,
+        help="Backend chạy song song: 'auto' (mặc định; ưu tiên 'interpreter' trên Python 3.14+ khi máy có nhiều CPU), 'thread', 'process' hoặc 'interpreter' (tự quay về 'process' nếu không khả dụng).",
+    )
+    stubgen_group.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Số worker dùng để phân tích song song. Mặc định: số CPU.",
+    )
+
     config_group = parser.add_argument_group("Config Initialization (Chạy riêng lẻ)")
     config_group.add_argument(
         "-c",
@@ -90,6 +123,8 @@ def main():
         argcomplete.autocomplete(parser)
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs <= 0:
+        parser.error("--jobs phải là số nguyên dương.")
 
     logger = setup_logging(script_name="SGen")
     logger.debug("SGen script started.")
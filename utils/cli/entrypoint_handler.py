@@ -4,6 +4,10 @@ import logging
 import sys
 from typing import Any, Callable
 
+from utils.core.formatter_daemon import close_formatter_daemons
+from utils.core.process import log_command_timings, set_process_concurrency
+from utils.core.transform_cache import close_transform_cache
+
 __all__ = ["run_cli_app"]
 
 
@@ -13,6 +17,7 @@ def run_cli_app(
     cli_args: argparse.Namespace,
     **kwargs: Any,
 ) -> None:
+    set_process_concurrency(getattr(cli_args, "jobs", None))
     try:
 
         orchestrator_func(logger=logger, cli_args=cli_args, **kwargs)
@@ -28,3 +33,7 @@ def run_cli_app(
         logger.error(f"❌ Đã xảy ra lỗi không mong muốn: {e}")
         logger.debug("Traceback:", exc_info=True)
         sys.exit(1)
+    finally:
+        close_formatter_daemons()
+        close_transform_cache(logger)
+        log_command_timings(logger)
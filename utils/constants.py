@@ -1,7 +1,7 @@
 # Path: utils/constants.py
 import os
 from pathlib import Path
-from typing import Dict, Final
+from typing import Dict, Final, Tuple
 
 PROJECT_ROOT: Final[Path] = Path(__file__).resolve().parent.parent
 
@@ -12,6 +12,49 @@ FILE_LOG_LEVEL: Final[str] = "DEBUG"
 
 MAX_THREAD_WORKERS: Final[int] = os.cpu_count() or 4
 
+MAX_CONCURRENT_PROCESSES: Final[int] = MAX_THREAD_WORKERS
+PROCESS_TIMEOUT_SECONDS: Final[float] = 600.0
+PROCESS_STDOUT_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+PROCESS_STDERR_MAX_BYTES: Final[int] = 1024 * 1024
+
+EXECUTOR_AUTO: Final[str] = "auto"
+EXECUTOR_THREAD: Final[str] = "thread"
+EXECUTOR_PROCESS: Final[str] = "process"
+EXECUTOR_INTERPRETER: Final[str] = "interpreter"
+EXECUTOR_CHOICES: Final[Tuple[str, ...]] = (
+    EXECUTOR_AUTO,
+    EXECUTOR_THREAD,
+    EXECUTOR_PROCESS,
+    EXECUTOR_INTERPRETER,
+)
+DEFAULT_EXECUTOR: Final[str] = EXECUTOR_AUTO
+WORKLOAD_IO: Final[str] = "io"
+WORKLOAD_CPU: Final[str] = "cpu"
+CPU_BATCH_MAX_BYTES: Final[int] = 512 * 1024
+CPU_BATCH_MAX_ITEMS: Final[int] = 64
+
+DUTIL_CACHE_DIR: Final[Path] = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dutil"
+)
+
+SCAN_INDEX_DIR: Final[Path] = DUTIL_CACHE_DIR / "scan"
+SCAN_INDEX_SUFFIX: Final[str] = ".idx"
+
+TRANSFORM_CACHE_DIR: Final[Path] = DUTIL_CACHE_DIR
+TRANSFORM_CACHE_FILENAME: Final[str] = "transform.db"
+TRANSFORM_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+TRANSFORM_CACHE_DISABLE_ENV: Final[str] = "DUTIL_NO_TRANSFORM_CACHE"
+BLACK_SUBPROCESS_ENV: Final[str] = "DUTIL_BLACK_SUBPROCESS"
+BLACK_PYTHON_ENV: Final[str] = "DUTIL_BLACK_PYTHON"
+
+FORMATTER_DAEMON_MAX_WORKERS: Final[int] = MAX_THREAD_WORKERS
+FORMATTER_DAEMON_START_TIMEOUT: Final[float] = 15.0
+FORMATTER_DAEMON_REQUEST_TIMEOUT: Final[float] = 30.0
+FORMAT_BATCH_MAX_FILES: Final[int] = 256
+
+SCAN_BACKEND_CHOICES: Final[Tuple[str, ...]] = ("walk", "git")
+DEFAULT_SCAN_BACKEND: Final[str] = "walk"
+
 DEFAULT_EXTENSIONS_LANG_MAP: Final[Dict[str, str]] = {
     "": "shell",
     "py": "python",
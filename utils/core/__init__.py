@@ -3,10 +3,16 @@
 
 from .code_cleaner import (
     clean_code,
+    cleaner_fingerprint,
     register_cleaner,
 )
 from .code_formatter import (
     format_code,
+    format_files_in_place,
+    formatter_fingerprint,
+    has_batch_formatter,
+    register_batch_formatter,
+    register_daemon_formatter,
     register_formatter,
 )
 from .config_helpers import (
@@ -19,6 +25,12 @@ from .config_helpers import (
     resolve_config_value,
     resolve_set_modification,
 )
+from .cpu_executor import (
+    create_cpu_executor,
+    interpreter_pool_available,
+    iter_batches,
+    resolve_executor_kind,
+)
 from .file_extensions import (
     is_extension_matched,
 )
@@ -27,11 +39,21 @@ from .file_helpers import (
 )
 from .file_scanner import (
     scan_directory_recursive,
+    stream_directory_recursive,
+)
+from .file_walker import (
+    walk_directory_parallel,
 )
 from .filter import (
     compile_spec_from_patterns,
     is_path_matched,
 )
+from .formatter_daemon import (
+    FormatterDaemonPool,
+    close_formatter_daemons,
+    get_formatter_daemon,
+)
+from .formatter_failure import FormatterFailure
 from .git import (
     auto_commit_changes,
     find_commit_by_hash,
@@ -42,6 +64,20 @@ from .git import (
     git_add_and_commit,
     is_git_repository,
     parse_gitignore,
+    read_gitmodules,
+)
+from .git_scanner import (
+    find_git_work_tree,
+    scan_git_files,
+)
+from .ignore_engine import (
+    GITIGNORE_FILENAME,
+    IgnoreStack,
+    clear_gitignore_cache,
+    extend_ignore_stack,
+    ignore_stack_signature,
+    is_ignored_by_stack,
+    load_gitignore_level,
 )
 from .parsing import (
     parse_cli_set_operators,
@@ -51,12 +87,50 @@ from .platform_utils import (
     copy_file_to_clipboard,
 )
 from .process import (
+    get_command_timings,
+    log_command_timings,
     run_command,
+    set_process_concurrency,
+    stream_command,
+)
+from .scan_context import (
+    ScanContext,
+)
+from .scan_index import (
+    ScanIndex,
+    open_scan_index,
+)
+from .stream_executor import (
+    PathStream,
+    submit_as_arrived,
+)
+from .submodule_trie import (
+    GITMODULES_FILENAME,
+    SubmoduleTrie,
+)
+from .tiered_spec import (
+    TieredPathSpec,
+    compile_tiered_spec,
 )
 from .toml_io import (
     load_toml_file,
     write_toml_file,
 )
+from .transform_cache import (
+    TransformCache,
+    build_transform_key,
+    callable_fingerprint,
+    close_transform_cache,
+    get_transform_cache,
+    mark_transform_cache_worker,
+    merge_transform_cache_stats,
+    source_fingerprint,
+    take_transform_cache_stats,
+)
+from .upward_search import (
+    find_marker_upwards,
+    invalidate_upward_search,
+)
 
 __all__ = [
     "clean_code",
@@ -74,21 +148,71 @@ __all__ = [
     "is_extension_matched",
     "load_text_template",
     "scan_directory_recursive",
+    "stream_directory_recursive",
+    "walk_directory_parallel",
     "is_path_matched",
     "compile_spec_from_patterns",
     "is_git_repository",
     "find_git_root",
     "get_submodule_paths",
+    "read_gitmodules",
     "parse_gitignore",
     "git_add_and_commit",
     "find_file_upwards",
     "auto_commit_changes",
     "find_commit_by_hash",
     "get_diffed_files",
+    "scan_git_files",
+    "find_git_work_tree",
+    "GITIGNORE_FILENAME",
+    "IgnoreStack",
+    "load_gitignore_level",
+    "extend_ignore_stack",
+    "is_ignored_by_stack",
+    "ignore_stack_signature",
+    "clear_gitignore_cache",
     "parse_comma_list",
     "parse_cli_set_operators",
     "copy_file_to_clipboard",
     "run_command",
+    "stream_command",
+    "ScanContext",
+    "PathStream",
+    "submit_as_arrived",
+    "create_cpu_executor",
+    "iter_batches",
+    "SubmoduleTrie",
+    "GITMODULES_FILENAME",
+    "ScanIndex",
+    "open_scan_index",
+    "TieredPathSpec",
+    "compile_tiered_spec",
     "load_toml_file",
     "write_toml_file",
+    "TransformCache",
+    "build_transform_key",
+    "callable_fingerprint",
+    "get_transform_cache",
+    "close_transform_cache",
+    "interpreter_pool_available",
+    "resolve_executor_kind",
+    "register_daemon_formatter",
+    "FormatterDaemonPool",
+    "get_formatter_daemon",
+    "close_formatter_daemons",
+    "register_batch_formatter",
+    "has_batch_formatter",
+    "format_files_in_place",
+    "find_marker_upwards",
+    "invalidate_upward_search",
+    "set_process_concurrency",
+    "get_command_timings",
+    "log_command_timings",
+    "mark_transform_cache_worker",
+    "take_transform_cache_stats",
+    "merge_transform_cache_stats",
+    "source_fingerprint",
+    "FormatterFailure",
+    "cleaner_fingerprint",
+    "formatter_fingerprint",
 ]
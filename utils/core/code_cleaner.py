@@ -1,6 +1,20 @@
 # Path: utils/core/code_cleaner.py
 import logging
-from typing import Dict, Final, Protocol, runtime_checkable
+from typing import (
+    Dict,
+    Final,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+from .transform_cache import (
+    build_transform_key,
+    callable_fingerprint,
+    get_transform_cache,
+)
 
 
 @runtime_checkable
@@ -11,9 +25,12 @@ class CodeCleaner(Protocol):
 
 
 CLEANER_REGISTRY: Final[Dict[str, CodeCleaner]] = {}
+CLEANER_DEPENDENCIES: Final[Dict[str, Tuple[str, ...]]] = {}
 
 
-def register_cleaner(language_id: str, cleaner_func: CodeCleaner) -> None:
+def register_cleaner(
+    language_id: str, cleaner_func: CodeCleaner, dependencies: Sequence[str] = ()
+) -> None:
     lang_id_lower = language_id.lower()
     if lang_id_lower in CLEANER_REGISTRY:
         logger = logging.getLogger("CodeCleanerRegistry")
@@ -21,9 +38,17 @@ def register_cleaner(language_id: str, cleaner_func: CodeCleaner) -> None:
             f"⚠️ Đang ghi đè cleaner đã đăng ký cho ngôn ngữ: {lang_id_lower}"
         )
     CLEANER_REGISTRY[lang_id_lower] = cleaner_func
+    CLEANER_DEPENDENCIES[lang_id_lower] = tuple(dependencies)
 
 
-__all__ = ["clean_code", "register_cleaner"]
+__all__ = ["clean_code", "cleaner_fingerprint", "register_cleaner"]
+
+
+def cleaner_fingerprint(language: str) -> Optional[str]:
+    cleaner = CLEANER_REGISTRY.get(language.lower())
+    if cleaner is None:
+        return None
+    return callable_fingerprint(cleaner, CLEANER_DEPENDENCIES.get(language.lower(), ()))
 
 
 def clean_code(
@@ -38,9 +63,23 @@ def clean_code(
         )
         return code_content
 
+    cache = get_transform_cache(logger)
+    cache_key = None
+    if cache is not None:
+        cache_key = build_transform_key(
+            "clean",
+            language.lower(),
+            str(all_clean),
+            cleaner_fingerprint(language),
+            content=code_content,
+        )
+        cached_content = cache.get(cache_key)
+        if cached_content is not None:
+            return cached_content
+
     try:
 
-        return cleaner(code_content, logger, all_clean)
+        cleaned_content = cleaner(code_content, logger, all_clean)
     except Exception as e:
         logger.error(
             f"❌ Lỗi xảy ra trong quá trình làm sạch code cho '{language}': {e}"
@@ -48,11 +87,17 @@ def clean_code(
         logger.debug("Traceback:", exc_info=True)
         return code_content
 
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, cleaned_content)
+    return cleaned_content
+
 
 try:
     from . import cleaners
 
-    register_cleaner("python", cleaners.cleaner_python.clean_python_code)
+    register_cleaner(
+        "python", cleaners.cleaner_python.clean_python_code, dependencies=("libcst",)
+    )
 
     register_cleaner("javascript", cleaners.cleaner_js.clean_javascript_code)
     register_cleaner("js", cleaners.cleaner_js.clean_javascript_code)
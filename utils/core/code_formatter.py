@@ -1,7 +1,28 @@
 # Path: utils/core/code_formatter.py
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Final, Optional, Protocol, runtime_checkable
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+from ..constants import FORMAT_BATCH_MAX_FILES, MAX_THREAD_WORKERS
+from .formatter_daemon import get_formatter_daemon
+from .formatter_failure import FormatterFailure
+from .transform_cache import (
+    build_transform_key,
+    get_transform_cache,
+    source_fingerprint,
+)
 
 
 @runtime_checkable
@@ -14,10 +35,22 @@ class CodeFormatter(Protocol):
     ) -> str: ...
 
 
+FormatterFingerprint = Callable[[Optional[Path], logging.Logger], Optional[str]]
+FormatterConfigResolver = Callable[[Optional[Path], logging.Logger], Optional[str]]
+BatchFormatter = Callable[[List[Path], logging.Logger, Optional[str]], bool]
+
 FORMATTER_REGISTRY: Final[Dict[str, CodeFormatter]] = {}
+FORMATTER_FINGERPRINTS: Final[Dict[str, FormatterFingerprint]] = {}
+BATCH_FORMATTER_REGISTRY: Final[
+    Dict[str, Tuple[BatchFormatter, Optional[FormatterConfigResolver]]]
+] = {}
 
 
-def register_formatter(language_id: str, formatter_func: CodeFormatter) -> None:
+def register_formatter(
+    language_id: str,
+    formatter_func: CodeFormatter,
+    fingerprint_func: Optional[FormatterFingerprint] = None,
+) -> None:
     lang_id_lower = language_id.lower()
     if lang_id_lower in FORMATTER_REGISTRY:
         logger = logging.getLogger("CodeFormatterRegistry")
@@ -25,9 +58,142 @@ def register_formatter(language_id: str, formatter_func: CodeFormatter) -> None:
             f"⚠️ Đang ghi đè formatter đã đăng ký cho ngôn ngữ: {lang_id_lower}"
         )
     FORMATTER_REGISTRY[lang_id_lower] = formatter_func
+    if fingerprint_func is not None:
+        FORMATTER_FINGERPRINTS[lang_id_lower] = fingerprint_func
+    else:
+        FORMATTER_FINGERPRINTS.pop(lang_id_lower, None)
+
+
+def register_daemon_formatter(
+    language_id: str,
+    command: Sequence[str],
+    config_resolver: Optional[FormatterConfigResolver] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    def daemon_formatter(
+        code_content: str,
+        logger: logging.Logger,
+        file_path: Optional[Path] = None,
+    ) -> str:
+        config = config_resolver(file_path, logger) if config_resolver else None
+        daemon = get_formatter_daemon(logger, command, max_workers=max_workers)
+        try:
+            return daemon.format(
+                code_content, config, file_path.as_posix() if file_path else None
+            )
+        except ValueError as e:
+            logger.warning(f"⚠️ Formatter daemon thất bại ({e}). Trả về nội dung gốc.")
+            raise FormatterFailure(str(e)) from e
+
+    script_fingerprint = "|".join(
+        source_fingerprint(Path(argument))
+        for argument in command
+        if argument.endswith(".py")
+    )
+
+    def daemon_fingerprint(
+        file_path: Optional[Path], logger: logging.Logger
+    ) -> Optional[str]:
+        config = config_resolver(file_path, logger) if config_resolver else None
+        daemon = get_formatter_daemon(logger, command, max_workers=max_workers)
+        fingerprint = daemon.fingerprint(config)
+        if fingerprint is None:
+            return None
+        suffix = file_path.suffix if file_path else ""
+        return f"{script_fingerprint}|{fingerprint}|{suffix}"
 
+    register_formatter(language_id, daemon_formatter, daemon_fingerprint)
 
-__all__ = ["format_code", "register_formatter"]
+
+def register_batch_formatter(
+    language_id: str,
+    batch_func: BatchFormatter,
+    config_resolver: Optional[FormatterConfigResolver] = None,
+) -> None:
+    BATCH_FORMATTER_REGISTRY[language_id.lower()] = (batch_func, config_resolver)
+
+
+__all__ = [
+    "format_code",
+    "formatter_fingerprint",
+    "format_files_in_place",
+    "has_batch_formatter",
+    "register_formatter",
+    "register_daemon_formatter",
+    "register_batch_formatter",
+]
+
+
+def has_batch_formatter(language: str) -> bool:
+    return language.lower() in BATCH_FORMATTER_REGISTRY
+
+
+def _content_hash(file_path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def format_files_in_place(
+    file_paths: List[Path],
+    language: str,
+    logger: logging.Logger,
+    max_files: int = FORMAT_BATCH_MAX_FILES,
+) -> Tuple[List[Path], List[Path]]:
+    registered = BATCH_FORMATTER_REGISTRY.get(language.lower())
+    if registered is None:
+        return [], list(file_paths)
+    batch_func, config_resolver = registered
+
+    groups: Dict[Optional[str], List[Path]] = {}
+    for file_path in file_paths:
+        config = config_resolver(file_path, logger) if config_resolver else None
+        groups.setdefault(config, []).append(file_path)
+
+    chunks: List[Tuple[Optional[str], List[Path]]] = []
+    for config, group_paths in groups.items():
+        logger.debug(
+            f"Định dạng theo lô {len(group_paths)} file '{language}' (config: {config or 'mặc định'})"
+        )
+        chunk_size = max(1, min(max_files, -(-len(group_paths) // MAX_THREAD_WORKERS)))
+        for start in range(0, len(group_paths), chunk_size):
+            chunks.append((config, group_paths[start : start + chunk_size]))
+
+    def _format_chunk(
+        chunk: Tuple[Optional[str], List[Path]],
+    ) -> Tuple[List[Path], List[Optional[str]], bool]:
+        config, chunk_paths = chunk
+        hashes_before = [_content_hash(file_path) for file_path in chunk_paths]
+        return chunk_paths, hashes_before, batch_func(chunk_paths, logger, config)
+
+    changed: List[Path] = []
+    not_formatted: List[Path] = []
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_THREAD_WORKERS, len(chunks) or 1)
+    ) as executor:
+        for chunk_paths, hashes_before, formatted in executor.map(
+            _format_chunk, chunks
+        ):
+            if not formatted:
+                not_formatted.extend(chunk_paths)
+                continue
+            for file_path, hash_before in zip(chunk_paths, hashes_before):
+                if _content_hash(file_path) != hash_before:
+                    changed.append(file_path)
+
+    return changed, not_formatted
+
+
+def formatter_fingerprint(
+    language: str, logger: logging.Logger, file_path: Optional[Path] = None
+) -> Optional[str]:
+    if language.lower() not in FORMATTER_REGISTRY:
+        return ""
+    fingerprint_func = FORMATTER_FINGERPRINTS.get(language.lower())
+    if fingerprint_func is None:
+        return None
+    return fingerprint_func(file_path, logger)
 
 
 def format_code(
@@ -45,9 +211,25 @@ def format_code(
         )
         return code_content
 
+    cache = None
+    cache_key = None
+    if language.lower() in FORMATTER_FINGERPRINTS:
+        cache = get_transform_cache(logger)
+    if cache is not None:
+        fingerprint = formatter_fingerprint(language, logger, file_path)
+        if fingerprint is not None:
+            cache_key = build_transform_key(
+                "format", language.lower(), fingerprint, content=code_content
+            )
+            cached_content = cache.get(cache_key)
+            if cached_content is not None:
+                return cached_content
+
     try:
 
-        return formatter(code_content, logger, file_path)
+        formatted_content = formatter(code_content, logger, file_path)
+    except FormatterFailure:
+        return code_content
     except Exception as e:
         logger.error(
             f"❌ Lỗi xảy ra trong quá trình định dạng code cho '{language}': {e}"
@@ -55,11 +237,32 @@ def format_code(
         logger.debug("Traceback:", exc_info=True)
         return code_content
 
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, formatted_content)
+    return formatted_content
+
 
 try:
     from . import formatters
 
-    register_formatter("python", formatters.formatter_python.format_python_black)
+    black_daemon_command = formatters.formatter_python.black_daemon_command()
+    if black_daemon_command:
+        register_daemon_formatter(
+            "python",
+            black_daemon_command,
+            formatters.formatter_python.resolve_black_config,
+        )
+    else:
+        register_formatter(
+            "python",
+            formatters.formatter_python.format_python_black,
+            formatters.formatter_python.black_cache_fingerprint,
+        )
+        register_batch_formatter(
+            "python",
+            formatters.formatter_python.format_python_black_files,
+            formatters.formatter_python.resolve_black_config,
+        )
 
 
 except ImportError as e:
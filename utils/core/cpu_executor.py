@@ -0,0 +1,152 @@
+# Path: utils/core/cpu_executor.py
+import functools
+import importlib
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:
+    InterpreterPoolExecutor = None
+
+from ..constants import (
+    CPU_BATCH_MAX_BYTES,
+    CPU_BATCH_MAX_ITEMS,
+    EXECUTOR_AUTO,
+    EXECUTOR_INTERPRETER,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    MAX_THREAD_WORKERS,
+    WORKLOAD_CPU,
+    WORKLOAD_IO,
+)
+from .formatter_daemon import close_formatter_daemons
+from .transform_cache import close_transform_cache, mark_transform_cache_worker
+
+__all__ = [
+    "create_cpu_executor",
+    "iter_batches",
+    "interpreter_pool_available",
+    "resolve_executor_kind",
+]
+
+T = TypeVar("T")
+
+WORKER_WARM_MODULES = (".cleaners", ".formatters", ".code_cleaner", ".code_formatter")
+
+
+def _init_process_worker(logger_name: str) -> None:
+    for warm_module in WORKER_WARM_MODULES:
+        importlib.import_module(warm_module, __package__)
+
+    mark_transform_cache_worker()
+    Finalize(
+        None,
+        close_transform_cache,
+        args=(logging.getLogger(logger_name),),
+        kwargs={"report": False},
+        exitpriority=10,
+    )
+    Finalize(None, close_formatter_daemons, exitpriority=11)
+
+
+def _interpreter_initializer(logger_name: str) -> Callable[[], None]:
+    bootstrap = (
+        "import sys\n"
+        f"sys.path[:0] = [p for p in {sys.path!r} if p not in sys.path]\n"
+        f"from {__name__} import _init_process_worker\n"
+        f"_init_process_worker({logger_name!r})\n"
+    )
+    return functools.partial(exec, bootstrap, {})
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def interpreter_pool_available() -> bool:
+    return InterpreterPoolExecutor is not None
+
+
+def resolve_executor_kind(
+    logger: logging.Logger,
+    executor_kind: Optional[str],
+    workload: str = WORKLOAD_CPU,
+    subinterpreter_safe: bool = True,
+) -> str:
+    requested = executor_kind or EXECUTOR_AUTO
+
+    if requested == EXECUTOR_AUTO:
+        if workload == WORKLOAD_IO or (os.cpu_count() or 1) <= 1:
+            resolved = EXECUTOR_THREAD
+        elif subinterpreter_safe and interpreter_pool_available():
+            resolved = EXECUTOR_INTERPRETER
+        else:
+            resolved = EXECUTOR_PROCESS
+        logger.debug(f"Executor 'auto' (workload={workload}) -> '{resolved}'")
+        return resolved
+
+    if requested == EXECUTOR_INTERPRETER:
+        if not interpreter_pool_available():
+            logger.warning(
+                "⚠️ InterpreterPoolExecutor không khả dụng (cần Python 3.14+), chuyển sang 'process'."
+            )
+            return EXECUTOR_PROCESS
+        if not subinterpreter_safe:
+            logger.warning(
+                "⚠️ Tác vụ này dùng extension không hỗ trợ sub-interpreter (ví dụ: libcst), chuyển sang 'process'."
+            )
+            return EXECUTOR_PROCESS
+
+    return requested
+
+
+def create_cpu_executor(
+    logger: logging.Logger, executor_kind: str, max_workers: Optional[int] = None
+) -> Executor:
+    workers = max_workers if max_workers and max_workers > 0 else MAX_THREAD_WORKERS
+
+    if executor_kind == EXECUTOR_INTERPRETER and interpreter_pool_available():
+        logger.debug(f"Sử dụng InterpreterPoolExecutor với max_workers={workers}")
+        return InterpreterPoolExecutor(
+            max_workers=workers,
+            initializer=_interpreter_initializer(logger.name),
+        )
+
+    if executor_kind in (EXECUTOR_PROCESS, EXECUTOR_INTERPRETER):
+        logger.debug(f"Sử dụng ProcessPoolExecutor với max_workers={workers}")
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_process_context(),
+            initializer=_init_process_worker,
+            initargs=(logger.name,),
+        )
+
+    logger.debug(f"Sử dụng ThreadPoolExecutor với max_workers={workers}")
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def iter_batches(
+    items: Iterable[T],
+    size_of: Callable[[T], int],
+    max_bytes: int = CPU_BATCH_MAX_BYTES,
+    max_items: int = CPU_BATCH_MAX_ITEMS,
+) -> Iterator[List[T]]:
+    batch: List[T] = []
+    batch_bytes = 0
+    for item in items:
+        batch.append(item)
+        batch_bytes += size_of(item)
+        if batch_bytes >= max_bytes or len(batch) >= max_items:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
@@ -1,8 +1,7 @@
 # Path: utils/core/file_scanner.py
 import logging
-import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Set
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set
 
 try:
     import pathspec
@@ -12,13 +11,15 @@ except ImportError:
 if TYPE_CHECKING:
     import pathspec
 
-from .file_extensions import is_extension_matched
-from .filter import is_path_matched
+from ..constants import DEFAULT_SCAN_BACKEND
+from .file_walker import walk_directory_parallel
+from .git_scanner import scan_git_files
+from .scan_context import ScanContext
 
-__all__ = ["scan_directory_recursive"]
+__all__ = ["scan_directory_recursive", "stream_directory_recursive"]
 
 
-def scan_directory_recursive(
+def stream_directory_recursive(
     logger: logging.Logger,
     directory: Path,
     scan_root: Path,
@@ -27,52 +28,71 @@ def scan_directory_recursive(
     prune_spec: Optional["pathspec.PathSpec"],
     extensions_filter: Optional[Set[str]],
     submodule_paths: Set[Path],
-) -> List[Path]:
-    found_files: List[Path] = []
-
-    try:
-
-        contents = list(os.scandir(directory))
-    except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
-        logger.debug(f"Không thể truy cập thư mục: {directory.as_posix()} ({e})")
-        return []
-
-    for entry in contents:
-        path = Path(entry.path)
-
-        if is_path_matched(path, ignore_spec, scan_root):
-            continue
-
-        abs_path = path.resolve()
-        if abs_path in submodule_paths:
-            continue
-
-        if entry.is_dir(follow_symlinks=False):
-
-            if is_path_matched(path, prune_spec, scan_root):
-                continue
-
-            found_files.extend(
-                scan_directory_recursive(
-                    logger=logger,
-                    directory=path,
-                    scan_root=scan_root,
-                    ignore_spec=ignore_spec,
-                    include_spec=include_spec,
-                    prune_spec=prune_spec,
-                    extensions_filter=extensions_filter,
-                    submodule_paths=submodule_paths,
-                )
-            )
-        elif entry.is_file(follow_symlinks=False):
-
-            if include_spec and not is_path_matched(path, include_spec, scan_root):
-                continue
+    scan_context: Optional[ScanContext] = None,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
+    respect_gitignore: bool = True,
+) -> Iterator[Path]:
+    if scan_context is None:
+        scan_context = ScanContext(scan_root, submodule_paths)
+
+    if scan_backend == "git":
+        git_files = scan_git_files(
+            logger=logger,
+            directory=directory,
+            scan_context=scan_context,
+            ignore_spec=ignore_spec,
+            include_spec=include_spec,
+            prune_spec=prune_spec,
+            extensions_filter=extensions_filter,
+            respect_gitignore=respect_gitignore,
+        )
+        if git_files is not None:
+            yield from git_files
+            return
+
+    yield from walk_directory_parallel(
+        logger=logger,
+        directory=directory,
+        scan_root=scan_root,
+        ignore_spec=ignore_spec,
+        include_spec=include_spec,
+        prune_spec=prune_spec,
+        extensions_filter=extensions_filter,
+        submodule_paths=submodule_paths,
+        scan_context=scan_context,
+        use_scan_cache=use_scan_cache,
+        use_nested_gitignore=respect_gitignore,
+    )
 
-            if extensions_filter is not None:
-                if not is_extension_matched(path, extensions_filter):
-                    continue
 
-            found_files.append(path)
-
-    return found_files
+def scan_directory_recursive(
+    logger: logging.Logger,
+    directory: Path,
+    scan_root: Path,
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+    prune_spec: Optional["pathspec.PathSpec"],
+    extensions_filter: Optional[Set[str]],
+    submodule_paths: Set[Path],
+    scan_context: Optional[ScanContext] = None,
+    use_scan_cache: bool = False,
+    scan_backend: str = DEFAULT_SCAN_BACKEND,
+    respect_gitignore: bool = True,
+) -> List[Path]:
+    return list(
+        stream_directory_recursive(
+            logger=logger,
+            directory=directory,
+            scan_root=scan_root,
+            ignore_spec=ignore_spec,
+            include_spec=include_spec,
+            prune_spec=prune_spec,
+            extensions_filter=extensions_filter,
+            submodule_paths=submodule_paths,
+            scan_context=scan_context,
+            use_scan_cache=use_scan_cache,
+            scan_backend=scan_backend,
+            respect_gitignore=respect_gitignore,
+        )
+    )
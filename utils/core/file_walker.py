@@ -0,0 +1,255 @@
+# Path: utils/core/file_walker.py
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, Iterator, List, Optional, Set, Tuple
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+from ..constants import MAX_THREAD_WORKERS
+from .file_extensions import is_extension_matched
+from .ignore_engine import (
+    GITIGNORE_FILENAME,
+    IgnoreStack,
+    extend_ignore_stack,
+    ignore_stack_signature,
+    is_ignored_by_stack,
+)
+from .scan_context import ScanContext
+from .scan_index import ScanIndex, open_scan_index
+from .submodule_trie import GITMODULES_FILENAME
+
+__all__ = ["walk_directory_parallel"]
+
+
+PendingDir = Tuple[Path, str, IgnoreStack]
+DirListing = Tuple[List[Path], List[PendingDir]]
+
+
+def _find_gitignore_mtime(contents: List[os.DirEntry]) -> Optional[int]:
+    for entry in contents:
+        if entry.name == GITIGNORE_FILENAME and entry.is_file():
+            try:
+                return entry.stat().st_mtime_ns
+            except OSError:
+                return None
+    return None
+
+
+def _has_gitmodules(contents: List[os.DirEntry]) -> bool:
+    return any(
+        entry.name == GITMODULES_FILENAME and entry.is_file() for entry in contents
+    )
+
+
+def _list_from_index(
+    directory: Path,
+    directory_rel: str,
+    scan_context: ScanContext,
+    scan_index: ScanIndex,
+    mtime_ns: int,
+    parent_stack: IgnoreStack,
+) -> Optional[DirListing]:
+    cached = scan_index.lookup(directory_rel, mtime_ns)
+    if cached is None:
+        return None
+
+    file_names, subdir_names, has_gitignore, ignore_sig = cached
+    ignore_stack = (
+        extend_ignore_stack(parent_stack, directory, directory_rel)
+        if has_gitignore
+        else parent_stack
+    )
+    if ignore_stack_signature(ignore_stack) != ignore_sig:
+        scan_index.record_lookup(hit=False)
+        return None
+
+    scan_index.record_lookup(hit=True)
+    files = [directory / name for name in file_names]
+    subdirs = [
+        (directory / name, scan_context.child(directory_rel, name), ignore_stack)
+        for name in subdir_names
+    ]
+    return files, subdirs
+
+
+def _list_directory(
+    logger: logging.Logger,
+    directory: Path,
+    directory_rel: str,
+    scan_context: ScanContext,
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+    prune_spec: Optional["pathspec.PathSpec"],
+    extensions_filter: Optional[Set[str]],
+    scan_index: Optional[ScanIndex] = None,
+    parent_stack: IgnoreStack = (),
+    use_nested_gitignore: bool = False,
+) -> DirListing:
+    files: List[Path] = []
+    subdirs: List[PendingDir] = []
+
+    mtime_ns: Optional[int] = None
+    try:
+        if scan_index is not None:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            cached = _list_from_index(
+                directory,
+                directory_rel,
+                scan_context,
+                scan_index,
+                mtime_ns,
+                parent_stack,
+            )
+            if cached is not None:
+                return cached
+
+        with os.scandir(directory) as it:
+            contents = list(it)
+    except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+        logger.debug(f"Không thể truy cập thư mục: {directory.as_posix()} ({e})")
+        return files, subdirs
+
+    has_gitmodules = bool(directory_rel) and _has_gitmodules(contents)
+    if has_gitmodules:
+        scan_context.register_gitmodules(directory, directory_rel)
+
+    ignore_stack = parent_stack
+    gitignore_mtime_ns: Optional[int] = None
+    if use_nested_gitignore and directory_rel:
+        gitignore_mtime_ns = _find_gitignore_mtime(contents)
+        if gitignore_mtime_ns is not None:
+            ignore_stack = extend_ignore_stack(
+                parent_stack, directory, directory_rel, gitignore_mtime_ns
+            )
+
+    for entry in contents:
+        rel_path = scan_context.child(directory_rel, entry.name)
+        is_dir = entry.is_dir()
+
+        if scan_context.is_matched(rel_path, is_dir, ignore_spec):
+            continue
+
+        if ignore_stack and is_ignored_by_stack(ignore_stack, rel_path, is_dir):
+            continue
+
+        if scan_context.is_submodule(rel_path):
+            continue
+
+        if entry.is_dir(follow_symlinks=False):
+
+            if scan_context.is_matched(rel_path, True, prune_spec):
+                continue
+
+            subdirs.append((Path(entry.path), rel_path, ignore_stack))
+        elif entry.is_file(follow_symlinks=False):
+
+            if include_spec and not scan_context.is_matched(
+                rel_path, False, include_spec
+            ):
+                continue
+
+            path = Path(entry.path)
+            if extensions_filter is not None:
+                if not is_extension_matched(path, extensions_filter):
+                    continue
+
+            files.append(path)
+
+    if scan_index is not None and mtime_ns is not None and not has_gitmodules:
+        scan_index.store(
+            directory_rel,
+            mtime_ns,
+            [path.name for path in files],
+            [path.name for path, _, _ in subdirs],
+            has_gitignore=gitignore_mtime_ns is not None,
+            ignore_sig=ignore_stack_signature(ignore_stack),
+        )
+
+    return files, subdirs
+
+
+def walk_directory_parallel(
+    logger: logging.Logger,
+    directory: Path,
+    scan_root: Path,
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+    prune_spec: Optional["pathspec.PathSpec"],
+    extensions_filter: Optional[Set[str]],
+    submodule_paths: Set[Path],
+    max_workers: int = MAX_THREAD_WORKERS,
+    scan_context: Optional[ScanContext] = None,
+    use_scan_cache: bool = False,
+    use_nested_gitignore: bool = True,
+) -> Iterator[Path]:
+    if scan_context is None:
+        scan_context = ScanContext(scan_root, submodule_paths)
+
+    scan_index: Optional[ScanIndex] = None
+    if use_scan_cache:
+        scan_index = open_scan_index(
+            logger,
+            scan_context,
+            ignore_spec,
+            include_spec,
+            prune_spec,
+            extensions_filter,
+            use_nested_gitignore,
+        )
+
+    start_rel = scan_context.relative_of(directory)
+    max_in_flight = max(1, max_workers) * 2
+    pending_dirs: Deque[PendingDir] = deque([(directory, start_rel, ())])
+    in_flight: Set[Future[DirListing]] = set()
+
+    logger.debug(
+        f"Walker song song: quét {directory.as_posix()} (max_workers={max_workers})"
+    )
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="dir_walker"
+    )
+    is_completed = False
+    try:
+        while pending_dirs or in_flight:
+            while pending_dirs and len(in_flight) < max_in_flight:
+                next_dir, next_dir_rel, next_dir_stack = pending_dirs.popleft()
+                in_flight.add(
+                    executor.submit(
+                        _list_directory,
+                        logger,
+                        next_dir,
+                        next_dir_rel,
+                        scan_context,
+                        ignore_spec,
+                        include_spec,
+                        prune_spec,
+                        extensions_filter,
+                        scan_index,
+                        next_dir_stack,
+                        use_nested_gitignore,
+                    )
+                )
+
+            done, not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+            in_flight = set(not_done)
+
+            for future in done:
+                files, subdirs = future.result()
+                pending_dirs.extend(subdirs)
+                yield from files
+
+        is_completed = True
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if scan_index is not None:
+            scan_index.close(prune_unvisited=is_completed and not start_rel)
@@ -12,6 +12,8 @@ except ImportError:
 if TYPE_CHECKING:
     import pathspec
 
+from .tiered_spec import compile_tiered_spec
+
 __all__ = ["is_path_matched", "compile_spec_from_patterns"]
 
 
@@ -47,7 +49,7 @@ def compile_spec_from_patterns(
         return None
 
     try:
-        spec = pathspec.PathSpec.from_lines("gitwildmatch", processed_patterns)
+        spec = compile_tiered_spec(processed_patterns)
         return spec
     except Exception as e:
         logger.error(f"Lỗi khi biên dịch các pattern pathspec: {e}")
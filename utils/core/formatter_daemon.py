@@ -0,0 +1,290 @@
+# Path: utils/core/formatter_daemon.py
+import hashlib
+import logging
+import os
+import queue
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..constants import (
+    FORMATTER_DAEMON_MAX_WORKERS,
+    FORMATTER_DAEMON_REQUEST_TIMEOUT,
+    FORMATTER_DAEMON_START_TIMEOUT,
+)
+from .formatters.daemon_protocol import read_message, write_message
+
+__all__ = [
+    "FormatterDaemonPool",
+    "get_formatter_daemon",
+    "close_formatter_daemons",
+]
+
+Message = Tuple[Dict[str, Any], bytes]
+
+_daemon_pools: Dict[Tuple[str, ...], "FormatterDaemonPool"] = {}
+_daemon_pools_lock = threading.Lock()
+_config_digests: Dict[Tuple[str, int], str] = {}
+
+
+def _config_digest(config: str) -> str:
+    try:
+        mtime_ns = os.stat(config).st_mtime_ns
+    except OSError:
+        return ""
+
+    cache_key = (config, mtime_ns)
+    digest = _config_digests.get(cache_key)
+    if digest is None:
+        try:
+            with open(config, "rb") as config_file:
+                digest = hashlib.sha256(config_file.read()).hexdigest()
+        except OSError:
+            digest = ""
+        _config_digests[cache_key] = digest
+    return digest
+
+
+class _DaemonWorker:
+    def __init__(self, command: Sequence[str]):
+        self.process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.responses: "queue.Queue[Optional[Message]]" = queue.Queue()
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+
+    def _read_loop(self) -> None:
+        assert self.process.stdout is not None
+        try:
+            while True:
+                message = read_message(self.process.stdout)
+                self.responses.put(message)
+                if message is None:
+                    return
+        except (OSError, ValueError):
+            self.responses.put(None)
+
+    def request(
+        self, header: Dict[str, Any], body: bytes, timeout: float
+    ) -> Dict[str, Any]:
+        assert self.process.stdin is not None
+        write_message(self.process.stdin, header, body)
+        try:
+            message = self.responses.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"worker không phản hồi sau {timeout:.0f}s")
+        if message is None:
+            raise ConnectionError(f"worker đã dừng (exit code: {self.process.poll()})")
+        response, response_body = message
+        response["body"] = response_body
+        return response
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self, kill: bool = False) -> None:
+        try:
+            if kill:
+                self.process.kill()
+            elif self.process.stdin is not None:
+                self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        finally:
+            if self.process.stdout is not None:
+                self.process.stdout.close()
+
+
+class FormatterDaemonPool:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        command: Sequence[str],
+        max_workers: Optional[int] = None,
+        request_timeout: float = FORMATTER_DAEMON_REQUEST_TIMEOUT,
+        start_timeout: float = FORMATTER_DAEMON_START_TIMEOUT,
+    ):
+        self.logger = logger
+        self.command = list(command)
+        self.max_workers = max(1, max_workers or FORMATTER_DAEMON_MAX_WORKERS)
+        self.request_timeout = request_timeout
+        self.start_timeout = start_timeout
+        self.version: Optional[str] = None
+        self._idle: "queue.LifoQueue[_DaemonWorker]" = queue.LifoQueue()
+        self._workers: List[_DaemonWorker] = []
+        self._lock = threading.Lock()
+        self._starting = 0
+        self._start_error: Optional[Exception] = None
+        self._closed = False
+
+    def _start_worker(self) -> _DaemonWorker:
+        self.logger.debug(f"Khởi động formatter daemon: {' '.join(self.command)}")
+        worker = _DaemonWorker(self.command)
+        try:
+            response = worker.request({"op": "ping"}, b"", self.start_timeout)
+        except (OSError, TimeoutError, ConnectionError):
+            worker.close(kill=True)
+            raise
+        if not response.get("ok"):
+            worker.close(kill=True)
+            raise ConnectionError(response.get("error", "health check thất bại"))
+        self.version = response.get("version", self.version)
+        return worker
+
+    def _acquire(self) -> _DaemonWorker:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("formatter daemon đã đóng")
+                if self._start_error is not None:
+                    raise self._start_error
+                can_start = len(self._workers) + self._starting < self.max_workers
+                if can_start:
+                    self._starting += 1
+
+            if can_start:
+                try:
+                    worker = self._start_worker()
+                except Exception as e:
+                    with self._lock:
+                        self._starting -= 1
+                        if not self._workers:
+                            self._start_error = e
+                    self.logger.error(
+                        f"❌ Không thể khởi động formatter daemon '{self.command[0]}': {e}"
+                    )
+                    raise
+                with self._lock:
+                    self._starting -= 1
+                    self._workers.append(worker)
+                return worker
+
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+    def _discard(self, worker: _DaemonWorker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.close(kill=True)
+
+    def request(self, header: Dict[str, Any], body: bytes = b"") -> Dict[str, Any]:
+        for attempt in range(2):
+            worker = self._acquire()
+            try:
+                response = worker.request(header, body, self.request_timeout)
+            except TimeoutError:
+                self.logger.warning(
+                    f"⚠️ Formatter daemon quá thời gian ({self.request_timeout:.0f}s), khởi động lại worker."
+                )
+                self._discard(worker)
+                raise
+            except (OSError, ConnectionError) as e:
+                self._discard(worker)
+                if attempt:
+                    raise
+                self.logger.warning(
+                    f"⚠️ Formatter daemon bị dừng ({e}), khởi động lại worker."
+                )
+                continue
+            self._idle.put(worker)
+            return response
+        raise ConnectionError("formatter daemon không khả dụng")
+
+    def format(
+        self, content: str, config: Optional[str] = None, path: Optional[str] = None
+    ) -> str:
+        response = self.request(
+            {"op": "format", "config": config, "path": path}, content.encode("utf-8")
+        )
+        if not response.get("ok"):
+            raise ValueError(response.get("error", "formatter daemon thất bại"))
+        return response["body"].decode("utf-8")
+
+    def ping(self) -> Optional[str]:
+        if self.version is None:
+            try:
+                self.request({"op": "ping"})
+            except Exception as e:
+                self.logger.debug(f"Không thể ping formatter daemon: {e}")
+        return self.version
+
+    def fingerprint(self, config: Optional[str] = None) -> Optional[str]:
+        version = self.ping()
+        if version is None or not config:
+            return version
+        return f"{version}|{config}|{_config_digest(config)}"
+
+    def health_check(self) -> bool:
+        idle_workers: List[_DaemonWorker] = []
+        while True:
+            try:
+                idle_workers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        healthy = True
+        for worker in idle_workers:
+            try:
+                if not worker.is_alive():
+                    raise ConnectionError("worker đã dừng")
+                response = worker.request({"op": "ping"}, b"", self.start_timeout)
+                if not response.get("ok"):
+                    raise ConnectionError(response.get("error", "ping thất bại"))
+            except (OSError, TimeoutError, ConnectionError) as e:
+                self.logger.debug(f"Worker formatter daemon không khỏe: {e}")
+                healthy = False
+                self._discard(worker)
+                continue
+            self._idle.put(worker)
+        return healthy
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.close()
+        self.logger.debug(f"Đã đóng {len(workers)} worker formatter daemon.")
+
+
+def get_formatter_daemon(
+    logger: logging.Logger,
+    command: Sequence[str],
+    max_workers: Optional[int] = None,
+    request_timeout: float = FORMATTER_DAEMON_REQUEST_TIMEOUT,
+) -> FormatterDaemonPool:
+    key = tuple(command)
+    with _daemon_pools_lock:
+        pool = _daemon_pools.get(key)
+        if pool is None:
+            pool = FormatterDaemonPool(
+                logger,
+                command,
+                max_workers=max_workers,
+                request_timeout=request_timeout,
+            )
+            _daemon_pools[key] = pool
+        return pool
+
+
+def close_formatter_daemons() -> None:
+    with _daemon_pools_lock:
+        pools = list(_daemon_pools.values())
+        _daemon_pools.clear()
+    for pool in pools:
+        pool.close()
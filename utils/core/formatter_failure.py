@@ -0,0 +1,7 @@
+# Path: utils/core/formatter_failure.py
+
+__all__ = ["FormatterFailure"]
+
+
+class FormatterFailure(Exception):
+    pass
@@ -0,0 +1,80 @@
+# Path: utils/core/formatters/black_daemon_worker.py
+import dataclasses
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+if __package__:
+    from .black_mode import black_mode_from_config
+    from .daemon_protocol import read_message, write_message
+else:
+    from black_mode import black_mode_from_config
+    from daemon_protocol import read_message, write_message
+
+__all__ = ["main"]
+
+ModeKey = Tuple[str, int, bool]
+
+
+def _get_mode(
+    black: Any, config: Optional[str], is_pyi: bool, modes: Dict[ModeKey, Any]
+) -> Any:
+    if not config:
+        cache_key: ModeKey = ("", 0, is_pyi)
+    else:
+        try:
+            cache_key = (config, os.stat(config).st_mtime_ns, is_pyi)
+        except OSError:
+            cache_key = (config, 0, is_pyi)
+
+    mode = modes.get(cache_key)
+    if mode is None:
+        if config:
+            mode = black_mode_from_config(black, black.parse_pyproject_toml(config))
+        else:
+            mode = black.Mode()
+        if is_pyi:
+            mode = dataclasses.replace(mode, is_pyi=True)
+        modes[cache_key] = mode
+    return mode
+
+
+def _format(black: Any, content: str, mode: Any) -> str:
+    try:
+        return black.format_file_contents(content, fast=True, mode=mode)
+    except black.NothingChanged:
+        return content
+
+
+def main() -> None:
+    import black
+
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    modes: Dict[ModeKey, Any] = {}
+
+    while True:
+        message = read_message(stdin)
+        if message is None:
+            return
+        header, body = message
+
+        if header.get("op") == "ping":
+            write_message(
+                stdout, {"ok": True, "version": f"black, {black.__version__}"}
+            )
+            continue
+
+        try:
+            is_pyi = str(header.get("path") or "").endswith(".pyi")
+            mode = _get_mode(black, header.get("config"), is_pyi, modes)
+            formatted = _format(black, body.decode("utf-8"), mode)
+        except Exception as e:
+            write_message(stdout, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+            continue
+        write_message(stdout, {"ok": True}, formatted.encode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# Path: utils/core/formatters/black_mode.py
+from types import ModuleType
+from typing import Any, Dict
+
+__all__ = ["black_mode_from_config"]
+
+
+def black_mode_from_config(black: ModuleType, config: Dict[str, Any]) -> Any:
+    mode_kwargs: Dict[str, Any] = {
+        "target_versions": {
+            black.TargetVersion[version.upper()]
+            for version in config.get("target_version", [])
+        },
+        "string_normalization": not config.get("skip_string_normalization", False),
+        "magic_trailing_comma": not config.get("skip_magic_trailing_comma", False),
+        "is_pyi": config.get("pyi", False),
+        "skip_source_first_line": config.get("skip_source_first_line", False),
+        "preview": config.get("preview", False),
+        "unstable": config.get("unstable", False),
+        "enabled_features": {
+            black.Preview[feature]
+            for feature in config.get("enable_unstable_feature", [])
+        },
+    }
+    if "line_length" in config:
+        mode_kwargs["line_length"] = int(config["line_length"])
+    if "python_cell_magics" in config:
+        mode_kwargs["python_cell_magics"] = set(config["python_cell_magics"])
+    return black.Mode(**mode_kwargs)
@@ -0,0 +1,49 @@
+# Path: utils/core/formatters/daemon_protocol.py
+import json
+import struct
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+__all__ = ["read_message", "write_message"]
+
+FRAME_HEADER = struct.Struct(">I")
+
+Message = Tuple[Dict[str, Any], bytes]
+
+
+def _read_exact(stream: BinaryIO, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_frame(stream: BinaryIO) -> Optional[bytes]:
+    prefix = _read_exact(stream, FRAME_HEADER.size)
+    if prefix is None:
+        return None
+    (length,) = FRAME_HEADER.unpack(prefix)
+    return _read_exact(stream, length)
+
+
+def read_message(stream: BinaryIO) -> Optional[Message]:
+    header = _read_frame(stream)
+    if header is None:
+        return None
+    body = _read_frame(stream)
+    if body is None:
+        return None
+    return json.loads(header.decode("utf-8")), body
+
+
+def write_message(stream: BinaryIO, header: Dict[str, Any], body: bytes = b"") -> None:
+    encoded_header = json.dumps(header).encode("utf-8")
+    stream.write(FRAME_HEADER.pack(len(encoded_header)))
+    stream.write(encoded_header)
+    stream.write(FRAME_HEADER.pack(len(body)))
+    stream.write(body)
+    stream.flush()
@@ -1,58 +1,319 @@
 # Path: utils/core/formatters/formatter_python.py
+import dataclasses
+import hashlib
 import logging
+import os
+import shutil
+import threading
 from pathlib import Path
-from typing import List, Optional
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
+from ...constants import BLACK_PYTHON_ENV, BLACK_SUBPROCESS_ENV
+from ..formatter_failure import FormatterFailure
 from ..git import find_file_upwards
 from ..process import run_command
+from ..transform_cache import callable_fingerprint
+from .black_mode import black_mode_from_config
 
-__all__ = ["format_python_black"]
+__all__ = [
+    "format_python_black",
+    "black_cache_fingerprint",
+    "black_daemon_command",
+    "format_python_black_files",
+    "resolve_black_config",
+]
+
+BLACK_DAEMON_WORKER_PATH = Path(__file__).with_name("black_daemon_worker.py")
+
+_black_version: Optional[str] = None
+_black_version_lock = threading.Lock()
+_config_digests: Dict[Tuple[str, int], str] = {}
+
+_black_module: Optional[ModuleType] = None
+_black_import_attempted = False
+_black_import_lock = threading.Lock()
+_black_modes: Dict[Tuple[str, int, bool], Any] = {}
+_black_modes_lock = threading.Lock()
 
 
 def _find_pyproject_toml(start_dir: Path, logger: logging.Logger) -> Optional[Path]:
     return find_file_upwards("pyproject.toml", start_dir, logger)
 
 
+def _is_stub_file(file_path: Optional[Path]) -> bool:
+    return file_path is not None and file_path.suffix == ".pyi"
+
+
+def black_daemon_command() -> Optional[List[str]]:
+    black_python = os.environ.get(BLACK_PYTHON_ENV, "")
+    if not black_python:
+        return None
+    return [black_python, str(BLACK_DAEMON_WORKER_PATH)]
+
+
+def resolve_black_config(
+    file_path: Optional[Path], logger: logging.Logger
+) -> Optional[str]:
+    if not file_path:
+        return None
+    config_path = _find_pyproject_toml(file_path.parent, logger)
+    return str(config_path) if config_path else None
+
+
+def _load_black_module(logger: logging.Logger) -> Optional[ModuleType]:
+    global _black_module, _black_import_attempted
+
+    if os.environ.get(BLACK_SUBPROCESS_ENV, "") not in ("", "0"):
+        return None
+
+    with _black_import_lock:
+        if not _black_import_attempted:
+            _black_import_attempted = True
+            try:
+                import black
+
+                _black_module = black
+                logger.debug(
+                    f"Sử dụng Black in-process (phiên bản {black.__version__})."
+                )
+            except ImportError:
+                logger.debug(
+                    "Không import được 'black', chuyển sang chạy 'black' qua subprocess."
+                )
+        return _black_module
+
+
+def _get_black_mode(
+    black: ModuleType,
+    config_path: Optional[Path],
+    logger: logging.Logger,
+    is_pyi: bool = False,
+) -> Any:
+    if config_path is None:
+        cache_key = ("", 0, is_pyi)
+    else:
+        try:
+            cache_key = (
+                config_path.as_posix(),
+                config_path.stat().st_mtime_ns,
+                is_pyi,
+            )
+        except OSError:
+            cache_key = (config_path.as_posix(), 0, is_pyi)
+
+    with _black_modes_lock:
+        mode = _black_modes.get(cache_key)
+        if mode is None:
+            if config_path is None:
+                mode = black.Mode()
+            else:
+                logger.debug(f"Đang dựng black.Mode từ {config_path.as_posix()}")
+                mode = black_mode_from_config(
+                    black, black.parse_pyproject_toml(str(config_path))
+                )
+            if is_pyi:
+                mode = dataclasses.replace(mode, is_pyi=True)
+            _black_modes[cache_key] = mode
+        return mode
+
+
+def _format_python_black_inprocess(
+    black: ModuleType,
+    code_content: str,
+    logger: logging.Logger,
+    config_path: Optional[Path],
+    is_pyi: bool = False,
+) -> str:
+    try:
+        mode = _get_black_mode(black, config_path, logger, is_pyi)
+    except Exception as e:
+        logger.warning(f"⚠️ Cấu hình Black không hợp lệ ({e}). Trả về nội dung gốc.")
+        raise FormatterFailure(str(e)) from e
+
+    try:
+        return black.format_file_contents(code_content, fast=True, mode=mode)
+    except black.NothingChanged:
+        return code_content
+    except black.InvalidInput as e:
+        logger.warning(
+            "⚠️ 'black' thất bại. Code có thể chứa lỗi cú pháp. Trả về nội dung gốc."
+        )
+        logger.debug(f"Black error: {e}")
+        raise FormatterFailure(str(e)) from e
+
+
+def _get_black_version(logger: logging.Logger) -> str:
+    global _black_version
+
+    black = _load_black_module(logger)
+    if black is not None:
+        return f"black, {black.__version__} (in-process)"
+
+    with _black_version_lock:
+        if _black_version is None:
+            try:
+                success, output = run_command(
+                    ["black", "--version"],
+                    logger,
+                    description="Đang lấy phiên bản 'black'",
+                )
+            except FileNotFoundError:
+                success, output = False, ""
+            _black_version = output.strip() if success else ""
+        return _black_version
+
+
+def _config_digest(config_path: Path) -> str:
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return ""
+
+    cache_key = (config_path.as_posix(), mtime_ns)
+    digest = _config_digests.get(cache_key)
+    if digest is None:
+        try:
+            digest = hashlib.sha256(config_path.read_bytes()).hexdigest()
+        except OSError:
+            digest = ""
+        _config_digests[cache_key] = digest
+    return digest
+
+
+def black_cache_fingerprint(
+    file_path: Optional[Path], logger: logging.Logger
+) -> Optional[str]:
+    black_version = _get_black_version(logger)
+    if not black_version:
+        return None
+
+    formatter_version = f"{callable_fingerprint(format_python_black)}|{black_version}"
+    if _is_stub_file(file_path):
+        formatter_version += "|pyi"
+    if not file_path:
+        return formatter_version
+
+    config_path = _find_pyproject_toml(file_path.parent, logger)
+    if not config_path:
+        return formatter_version
+
+    return f"{formatter_version}|{config_path.as_posix()}|{_config_digest(config_path)}"
+
+
 def format_python_black(
     code_content: str, logger: logging.Logger, file_path: Optional[Path] = None
 ) -> str:
     logger.debug("Trình định dạng Python (Black) được gọi.")
 
-    command: List[str] = ["black", "--fast", "--quiet", "-"]
-    description: str = "Đang chạy 'black' từ stdin"
-
+    config_path: Optional[Path] = None
     if file_path:
-        start_dir = file_path.parent
-        config_path = _find_pyproject_toml(start_dir, logger)
+        config_path = _find_pyproject_toml(file_path.parent, logger)
         if config_path:
             logger.debug(f"Đã tìm thấy cấu hình Black tại: {config_path.as_posix()}")
-            command.extend(["--config", str(config_path)])
-            description += f" (sử dụng config {config_path.name})"
         else:
             logger.debug(
                 "Không tìm thấy pyproject.toml, sử dụng cài đặt Black mặc định."
             )
 
+    is_pyi = _is_stub_file(file_path)
+    black = _load_black_module(logger)
+    if black is not None:
+        return _format_python_black_inprocess(
+            black, code_content, logger, config_path, is_pyi
+        )
+
+    command: List[str] = ["black", "--fast", "--quiet", "-"]
+    description: str = "Đang chạy 'black' từ stdin"
+    if is_pyi:
+        command.append("--pyi")
+    if config_path:
+        command.extend(["--config", str(config_path)])
+        description += f" (sử dụng config {config_path.name})"
+
     try:
         success, output = run_command(
             command, logger, description=description, input_content=code_content
         )
+    except FileNotFoundError as e:
+        logger.error(
+            "❌ Lỗi: Không tìm thấy lệnh 'black'. Hãy đảm bảo 'black' đã được cài đặt trong $PATH."
+        )
+        raise FormatterFailure(str(e)) from e
+    except Exception as e:
+        logger.error(f"❌ Lỗi không mong muốn khi chạy 'black': {e}")
+        raise FormatterFailure(str(e)) from e
+
+    if not success:
+        logger.warning(
+            "⚠️ 'black' thất bại. Code có thể chứa lỗi cú pháp. Trả về nội dung gốc."
+        )
+        logger.debug(f"Black stderr: {output}")
+        raise FormatterFailure(output)
+    return output
 
-        if success:
-            return output
-        else:
 
+def _format_python_black_files_inprocess(
+    black: ModuleType,
+    file_paths: List[Path],
+    logger: logging.Logger,
+    config_path: Optional[Path],
+) -> bool:
+    failed_count = 0
+    for file_path in file_paths:
+        try:
+            mode = _get_black_mode(black, config_path, logger, _is_stub_file(file_path))
+        except Exception as e:
             logger.warning(
-                "⚠️ 'black' thất bại. Code có thể chứa lỗi cú pháp. Trả về nội dung gốc."
+                f"⚠️ Cấu hình Black không hợp lệ ({e}), chuyển sang định dạng từng file."
             )
-            logger.debug(f"Black stderr: {output}")
-            return code_content
+            return False
 
-    except FileNotFoundError:
-        logger.error(
-            "❌ Lỗi: Không tìm thấy lệnh 'black'. Hãy đảm bảo 'black' đã được cài đặt trong $PATH."
+        try:
+            content = file_path.read_text(encoding="utf-8")
+            formatted = black.format_file_contents(content, fast=True, mode=mode)
+            file_path.write_text(formatted, encoding="utf-8")
+        except black.NothingChanged:
+            continue
+        except Exception as e:
+            failed_count += 1
+            logger.debug(f"Black error ({file_path.as_posix()}): {e}")
+
+    if failed_count:
+        logger.warning(
+            f"⚠️ 'black' báo lỗi với {failed_count} file (có thể do lỗi cú pháp); các file còn lại vẫn được định dạng."
         )
-        return code_content
-    except Exception as e:
-        logger.error(f"❌ Lỗi không mong muốn khi chạy 'black': {e}")
-        return code_content
+    return True
+
+
+def format_python_black_files(
+    file_paths: List[Path], logger: logging.Logger, config: Optional[str] = None
+) -> bool:
+    black = _load_black_module(logger)
+    if black is not None:
+        return _format_python_black_files_inprocess(
+            black, file_paths, logger, Path(config) if config else None
+        )
+
+    if shutil.which("black") is None:
+        logger.warning(
+            "⚠️ Không tìm thấy lệnh 'black' trong $PATH, chuyển sang định dạng từng file."
+        )
+        return False
+
+    command: List[str] = ["black", "--fast", "--quiet"]
+    if config:
+        command.extend(["--config", config])
+    command.append("--")
+    command.extend(str(file_path) for file_path in file_paths)
+
+    success, output = run_command(
+        command,
+        logger,
+        description=f"Đang chạy 'black' trên {len(file_paths)} file",
+    )
+    if not success:
+        logger.warning(
+            "⚠️ 'black' báo lỗi với một số file (có thể do lỗi cú pháp); các file còn lại vẫn được định dạng."
+        )
+    return True
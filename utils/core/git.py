@@ -7,11 +7,13 @@ from typing import Any, Dict, List, Optional, Set
 from ..logging_config import log_success
 from .config_helpers import generate_config_hash
 from .process import run_command
+from .upward_search import MARKER_DIR, MARKER_FILE, find_marker_upwards
 
 __all__ = [
     "is_git_repository",
     "find_git_root",
     "get_submodule_paths",
+    "read_gitmodules",
     "parse_gitignore",
     "git_add_and_commit",
     "find_file_upwards",
@@ -24,16 +26,10 @@ __all__ = [
 def find_file_upwards(
     filename: str, start_path: Path, logger: logging.Logger, max_levels: int = 10
 ) -> Optional[Path]:
-    current_path = start_path.resolve()
-    for _ in range(max_levels):
-        file_to_find = current_path / filename
-        if file_to_find.is_file():
-            logger.debug(f"Đã tìm thấy '{filename}' tại: {current_path.as_posix()}")
-            return file_to_find
-
-        if current_path == current_path.parent:
-            break
-        current_path = current_path.parent
+    found_dir = find_marker_upwards(filename, start_path, MARKER_FILE, max_levels)
+    if found_dir is not None:
+        logger.debug(f"Đã tìm thấy '{filename}' tại: {found_dir.as_posix()}")
+        return found_dir / filename
 
     logger.debug(
         f"Không tìm thấy '{filename}' trong {max_levels} cấp thư mục cha từ {start_path.as_posix()}."
@@ -46,39 +42,39 @@ def is_git_repository(root: Path) -> bool:
 
 
 def find_git_root(start_path: Path, max_levels: int = 5) -> Optional[Path]:
-    current_path = start_path.resolve()
-    for _ in range(max_levels):
-        if is_git_repository(current_path):
-            return current_path
+    return find_marker_upwards(".git", start_path, MARKER_DIR, max_levels)
 
-        if current_path == current_path.parent:
-            break
-        current_path = current_path.parent
 
-    return None
+def read_gitmodules(
+    gitmodules_path: Path, logger: Optional[logging.Logger] = None
+) -> List[str]:
+    module_paths: List[str] = []
+    if not gitmodules_path.is_file():
+        return module_paths
+
+    try:
+        config = configparser.ConfigParser()
+
+        config.read(gitmodules_path, encoding="utf-8")
+        for section in config.sections():
+            if config.has_option(section, "path"):
+                module_paths.append(config.get(section, "path"))
+    except configparser.Error as e:
+        warning_msg = f"Không thể phân tích file .gitmodules: {e}"
+        if logger:
+            logger.warning(f"⚠️ {warning_msg}")
+        else:
+            print(f"Cảnh báo: {warning_msg}")
+    return module_paths
 
 
 def get_submodule_paths(
     root: Path, logger: Optional[logging.Logger] = None
 ) -> Set[Path]:
-    submodule_paths = set()
-    gitmodules_path = root / ".gitmodules"
-    if gitmodules_path.exists():
-        try:
-            config = configparser.ConfigParser()
-
-            config.read(gitmodules_path, encoding="utf-8")
-            for section in config.sections():
-                if config.has_option(section, "path"):
-                    path_str = config.get(section, "path")
-                    submodule_paths.add((root / path_str).resolve())
-        except configparser.Error as e:
-            warning_msg = f"Không thể phân tích file .gitmodules: {e}"
-            if logger:
-                logger.warning(f"⚠️ {warning_msg}")
-            else:
-                print(f"Cảnh báo: {warning_msg}")
-    return submodule_paths
+    return {
+        (root / path_str).resolve()
+        for path_str in read_gitmodules(root / ".gitmodules", logger)
+    }
 
 
 def parse_gitignore(root: Path) -> List[str]:
@@ -0,0 +1,132 @@
+# Path: utils/core/git_scanner.py
+import logging
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+from .file_extensions import is_extension_matched
+from .process import run_command, stream_command
+from .scan_context import ScanContext
+from .upward_search import MARKER_ANY, find_marker_upwards
+
+__all__ = ["scan_git_files", "find_git_work_tree"]
+
+
+SKIPPED_GIT_MODES = frozenset({"120000", "160000"})
+
+
+def find_git_work_tree(start_path: Path) -> Optional[Path]:
+    return find_marker_upwards(".git", start_path, MARKER_ANY)
+
+
+def _parse_ls_files_record(record: str) -> Optional[str]:
+    meta, sep, path = record.partition("\t")
+    if sep and len(meta) > 7 and meta[6] == " " and meta[:6].isdigit():
+        if meta[:6] in SKIPPED_GIT_MODES:
+            return None
+        return path
+
+    if not record or record.endswith("/"):
+        return None
+    return record
+
+
+def scan_git_files(
+    logger: logging.Logger,
+    directory: Path,
+    scan_context: ScanContext,
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+    prune_spec: Optional["pathspec.PathSpec"],
+    extensions_filter: Optional[Set[str]],
+    respect_gitignore: bool = True,
+) -> Optional[List[Path]]:
+    if find_git_work_tree(directory) is None:
+        logger.debug(
+            f"Backend git: {directory.as_posix()} không nằm trong Git repo, dùng walker."
+        )
+        return None
+
+    success, deleted_output = run_command(
+        ["git", "ls-files", "-z", "--deleted"],
+        logger,
+        description="Liệt kê file đã xóa (git ls-files --deleted)",
+        cwd=directory,
+    )
+    if not success:
+        return None
+    deleted_files = set(deleted_output.split("\0"))
+
+    command = ["git", "ls-files", "-z", "-s", "--cached", "--others"]
+    if respect_gitignore:
+        command.append("--exclude-standard")
+
+    start_rel = scan_context.relative_of(directory)
+    dir_excluded: Dict[str, bool] = {start_rel: False, "": False}
+
+    def is_dir_excluded(dir_rel: str) -> bool:
+        cached = dir_excluded.get(dir_rel)
+        if cached is not None:
+            return cached
+
+        parent_rel = dir_rel.rpartition("/")[0]
+        excluded = (
+            is_dir_excluded(parent_rel)
+            or scan_context.is_matched(dir_rel, True, ignore_spec)
+            or scan_context.is_submodule(dir_rel)
+            or scan_context.is_matched(dir_rel, True, prune_spec)
+        )
+        dir_excluded[dir_rel] = excluded
+        return excluded
+
+    found_files: List[Path] = []
+    seen: Set[str] = set()
+
+    try:
+        for record in stream_command(
+            command,
+            logger,
+            description="Liệt kê file bằng git ls-files",
+            cwd=directory,
+        ):
+            entry = _parse_ls_files_record(record)
+            if entry is None or entry in seen or entry in deleted_files:
+                continue
+            seen.add(entry)
+
+            rel_path = scan_context.child(start_rel, entry)
+            parent_rel, _, file_name = rel_path.rpartition("/")
+
+            if is_dir_excluded(parent_rel):
+                continue
+
+            if scan_context.is_matched(rel_path, False, ignore_spec):
+                continue
+
+            if scan_context.is_submodule(rel_path):
+                continue
+
+            if include_spec and not scan_context.is_matched(
+                rel_path, False, include_spec
+            ):
+                continue
+
+            if extensions_filter is not None:
+                if not is_extension_matched(Path(file_name), extensions_filter):
+                    continue
+
+            found_files.append(directory / entry)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"⚠️ Backend git thất bại, chuyển sang walker: {e}")
+        return None
+
+    logger.debug(f"Backend git: {len(found_files)} file từ git ls-files.")
+    return found_files
@@ -0,0 +1,106 @@
+# Path: utils/core/ignore_engine.py
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .tiered_spec import TieredPathSpec, compile_tiered_spec
+
+__all__ = [
+    "IgnoreStack",
+    "GITIGNORE_FILENAME",
+    "load_gitignore_level",
+    "extend_ignore_stack",
+    "is_ignored_by_stack",
+    "ignore_stack_signature",
+    "clear_gitignore_cache",
+]
+
+
+logger = logging.getLogger(__name__)
+
+GITIGNORE_FILENAME = ".gitignore"
+
+IgnoreLevel = Tuple[str, int, TieredPathSpec]
+IgnoreStack = Tuple[IgnoreLevel, ...]
+
+_spec_cache: Dict[Tuple[str, int], Optional[TieredPathSpec]] = {}
+_spec_cache_lock = threading.Lock()
+
+
+def clear_gitignore_cache() -> None:
+    with _spec_cache_lock:
+        _spec_cache.clear()
+
+
+def _compile_gitignore(gitignore_path: str) -> Optional[TieredPathSpec]:
+    try:
+        with open(gitignore_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.debug(f"Không thể đọc {gitignore_path}: {e}")
+        return None
+
+    patterns: List[str] = [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    if not patterns:
+        return None
+
+    try:
+        return compile_tiered_spec(patterns)
+    except Exception as e:
+        logger.debug(f"Lỗi khi biên dịch {gitignore_path}: {e}")
+        return None
+
+
+def load_gitignore_level(
+    directory: Path, base_rel: str, mtime_ns: Optional[int] = None
+) -> Optional[IgnoreLevel]:
+    gitignore_path = os.path.join(directory, GITIGNORE_FILENAME)
+    if mtime_ns is None:
+        try:
+            mtime_ns = os.stat(gitignore_path).st_mtime_ns
+        except OSError:
+            return None
+
+    cache_key = (gitignore_path, mtime_ns)
+    with _spec_cache_lock:
+        if cache_key in _spec_cache:
+            spec = _spec_cache[cache_key]
+            return (base_rel, mtime_ns, spec) if spec is not None else None
+
+    spec = _compile_gitignore(gitignore_path)
+    with _spec_cache_lock:
+        _spec_cache[cache_key] = spec
+
+    if spec is None:
+        return None
+    logger.debug(f"Đã nạp .gitignore lồng nhau: {gitignore_path}")
+    return (base_rel, mtime_ns, spec)
+
+
+def extend_ignore_stack(
+    stack: IgnoreStack,
+    directory: Path,
+    base_rel: str,
+    mtime_ns: Optional[int] = None,
+) -> IgnoreStack:
+    level = load_gitignore_level(directory, base_rel, mtime_ns)
+    return stack + (level,) if level is not None else stack
+
+
+def is_ignored_by_stack(stack: IgnoreStack, rel_path: str, is_dir: bool) -> bool:
+    for base_rel, _, spec in reversed(stack):
+        local_path = rel_path[len(base_rel) + 1 :] if base_rel else rel_path
+        result = spec.check_match(f"{local_path}/" if is_dir else local_path)
+        if result is not None:
+            return result
+    return False
+
+
+def ignore_stack_signature(stack: IgnoreStack) -> str:
+    return "|".join(f"{base_rel}:{mtime_ns}" for base_rel, mtime_ns, _ in stack)
@@ -1,12 +1,145 @@
 # Path: utils/core/process.py
 import logging
+import os
+import signal
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ..constants import (
+    MAX_CONCURRENT_PROCESSES,
+    PROCESS_STDERR_MAX_BYTES,
+    PROCESS_STDOUT_MAX_BYTES,
+    PROCESS_TIMEOUT_SECONDS,
+)
 
 Logger = logging.Logger
 
-__all__ = ["run_command"]
+__all__ = [
+    "run_command",
+    "stream_command",
+    "set_process_concurrency",
+    "get_command_timings",
+    "log_command_timings",
+]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+CommandTiming = Dict[str, float]
+
+_process_slots = threading.BoundedSemaphore(MAX_CONCURRENT_PROCESSES)
+_command_timings: Dict[str, CommandTiming] = {}
+_command_timings_lock = threading.Lock()
+
+
+def set_process_concurrency(max_processes: Optional[int]) -> None:
+    global _process_slots
+
+    if max_processes is None or max_processes <= 0:
+        return
+    _process_slots = threading.BoundedSemaphore(max_processes)
+
+
+def _record_timing(program: str, elapsed: float) -> None:
+    with _command_timings_lock:
+        timing = _command_timings.setdefault(
+            program, {"count": 0, "total": 0.0, "max": 0.0}
+        )
+        timing["count"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+
+
+def get_command_timings() -> Dict[str, CommandTiming]:
+    with _command_timings_lock:
+        return {program: dict(timing) for program, timing in _command_timings.items()}
+
+
+def log_command_timings(logger: Logger) -> None:
+    for program, timing in sorted(get_command_timings().items()):
+        logger.debug(
+            f"Lệnh '{program}': {int(timing['count'])} lần, tổng {timing['total']:.3f}s, lâu nhất {timing['max']:.3f}s"
+        )
+
+
+def _decode_output(raw: bytes) -> str:
+    return (
+        raw.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    )
+
+
+def _prepare_command(
+    command: Union[str, List[str]],
+    logger: Logger,
+    cwd: Optional[Path],
+    input_content: Optional[str],
+) -> List[str]:
+    command_list = command.split() if isinstance(command, str) else command
+
+    cwd_info = f" (trong {cwd})" if cwd else ""
+    stdin_info = " (với input stdin)" if input_content is not None else ""
+    logger.debug(f"Đang chạy lệnh{cwd_info}{stdin_info}: {' '.join(command_list)}")
+    return command_list
+
+
+def _start_failure(
+    command_list: List[str], logger: Logger, error: Exception
+) -> Tuple[bool, str]:
+    if isinstance(error, FileNotFoundError):
+        error_message = f"Lỗi: Lệnh '{command_list[0]}' không tìm thấy. Đảm bảo nó nằm trong $PATH của bạn."
+        logger.error(f"❌ {error_message}")
+        return False, error_message
+
+    error_message = f"Lỗi không mong muốn khi chạy lệnh '{command_list[0]}': {error}"
+    logger.error(f"❌ {error_message}")
+    logger.debug("Traceback:", exc_info=True)
+    return False, error_message
+
+
+def _timeout_failure(
+    command_list: List[str], logger: Logger, timeout: Optional[float]
+) -> Tuple[bool, str]:
+    error_message = (
+        f"Lệnh '{command_list[0]}' quá thời gian ({timeout:g}s) và đã bị dừng."
+    )
+    logger.error(f"❌ {error_message}")
+    return False, error_message
+
+
+def _finish_timing(command_list: List[str], logger: Logger, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    _record_timing(command_list[0], elapsed)
+    logger.debug(f"Lệnh '{command_list[0]}' kết thúc sau {elapsed:.3f}s.")
+
+
+def _command_result(
+    command_list: List[str],
+    logger: Logger,
+    return_code: int,
+    stdout_raw: bytes,
+    stderr_raw: bytes,
+    max_output_bytes: int,
+) -> Tuple[bool, str]:
+    if len(stdout_raw) > max_output_bytes:
+        error_message = f"Output của lệnh '{command_list[0]}' vượt quá giới hạn {max_output_bytes} byte."
+        logger.error(f"❌ {error_message}")
+        return False, error_message
+
+    stdout_content = _decode_output(stdout_raw)
+    if return_code != 0:
+        error_details = _decode_output(stderr_raw[-PROCESS_STDERR_MAX_BYTES:]).strip()
+        if not error_details:
+            error_details = stdout_content.strip()
+
+        error_message = f"Lệnh '{command_list[0]}' thất bại. Lỗi:\n{error_details}"
+        logger.error(f"❌ {error_message}")
+        return False, error_details
+
+    logger.debug(f"Lệnh '{command_list[0]}' thành công.")
+    return True, stdout_content
 
 
 def run_command(
@@ -15,54 +148,144 @@ def run_command(
     description: str = "Thực thi lệnh shell",
     cwd: Optional[Path] = None,
     input_content: Optional[str] = None,
+    timeout: Optional[float] = PROCESS_TIMEOUT_SECONDS,
+    max_output_bytes: int = PROCESS_STDOUT_MAX_BYTES,
 ) -> Tuple[bool, str]:
+    command_list = _prepare_command(command, logger, cwd, input_content)
+
+    slots = _process_slots
+    slots.acquire()
+    started = time.perf_counter()
+    try:
+        try:
+            process = subprocess.Popen(
+                command_list,
+                stdin=(
+                    subprocess.PIPE if input_content is not None else subprocess.DEVNULL
+                ),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+            )
+        except Exception as e:
+            return _start_failure(command_list, logger, e)
+
+        try:
+            stdout_raw, stderr_raw = process.communicate(
+                (input_content.encode("utf-8") if input_content is not None else None),
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return _timeout_failure(command_list, logger, timeout)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    finally:
+        slots.release()
+        _finish_timing(command_list, logger, started)
+
+    return _command_result(
+        command_list,
+        logger,
+        process.returncode,
+        stdout_raw,
+        stderr_raw,
+        max_output_bytes,
+    )
+
 
-    if isinstance(command, str):
-        command_list = command.split()
-    else:
-        command_list = command
+def _kill_process_group(process: subprocess.Popen) -> None:
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def stream_command(
+    command: List[str],
+    logger: Logger,
+    description: str = "Thực thi lệnh shell (stream)",
+    cwd: Optional[Path] = None,
+    separator: bytes = b"\0",
+    timeout: Optional[float] = PROCESS_TIMEOUT_SECONDS,
+) -> Iterator[str]:
 
     cwd_info = f" (trong {cwd})" if cwd else ""
-    stdin_info = " (với input stdin)" if input_content is not None else ""
-    logger.debug(f"Đang chạy lệnh{cwd_info}{stdin_info}: {' '.join(command_list)}")
+    logger.debug(f"Đang stream lệnh{cwd_info}: {' '.join(command)}")
 
+    slots = _process_slots
+    slots.acquire()
+    started = time.perf_counter()
+    expired = threading.Event()
     try:
-        result = subprocess.run(
-            command_list,
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
-            cwd=cwd,
-            input=input_content,
-            encoding="utf-8",
-        )
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                shell=False,
+                cwd=cwd,
+                start_new_session=os.name == "posix",
+            )
+            assert process.stdout is not None
 
-        stdout_content = result.stdout
-        logger.debug(f"Lệnh '{command_list[0]}' thành công.")
-        return True, stdout_content
+            def _expire() -> None:
+                expired.set()
+                _kill_process_group(process)
 
-    except subprocess.CalledProcessError as e:
+            watchdog = threading.Timer(timeout, _expire) if timeout else None
+            if watchdog is not None:
+                watchdog.daemon = True
+                watchdog.start()
 
-        error_details = ""
-        if e.stderr:
-            error_details = e.stderr.strip()
-        if not error_details and e.stdout:
-            error_details = e.stdout.strip()
+            try:
+                pending = b""
+                while True:
+                    chunk = process.stdout.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
 
-        error_message = f"Lệnh '{command_list[0]}' thất bại. Lỗi:\n{error_details}"
-        logger.error(f"❌ {error_message}")
+                    records = (pending + chunk).split(separator)
+                    pending = records.pop()
+                    if expired.is_set():
+                        break
+                    for record in records:
+                        yield os.fsdecode(record)
 
-        return False, error_details
+                if pending and not expired.is_set():
+                    yield os.fsdecode(pending)
 
-    except FileNotFoundError:
+                return_code = process.wait()
+                stderr_file.seek(0)
+                stderr_content = stderr_file.read(PROCESS_STDERR_MAX_BYTES).decode(
+                    "utf-8", errors="replace"
+                )
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+                if process.poll() is None:
+                    _kill_process_group(process)
+                    process.wait()
+                process.stdout.close()
+    finally:
+        slots.release()
+        _finish_timing(command, logger, started)
 
-        error_message = f"Lỗi: Lệnh '{command_list[0]}' không tìm thấy. Đảm bảo nó nằm trong $PATH của bạn."
-        logger.error(f"❌ {error_message}")
-        return False, error_message
-    except Exception as e:
+    if expired.is_set():
+        logger.error(
+            f"❌ Lệnh '{command[0]}' quá thời gian ({timeout:g}s) và đã bị dừng."
+        )
+        raise subprocess.TimeoutExpired(command, timeout or 0.0)
 
-        error_message = f"Lỗi không mong muốn khi chạy lệnh '{command_list[0]}': {e}"
-        logger.error(f"❌ {error_message}")
-        logger.debug("Traceback:", exc_info=True)
-        return False, error_message
+    if return_code != 0:
+        error_details = stderr_content.strip()
+        logger.error(f"❌ Lệnh '{command[0]}' thất bại. Lỗi:\n{error_details}")
+        raise subprocess.CalledProcessError(return_code, command, stderr=stderr_content)
+
+    logger.debug(f"Lệnh '{command[0]}' thành công.")
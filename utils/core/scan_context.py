@@ -0,0 +1,92 @@
+# Path: utils/core/scan_context.py
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+from .git import read_gitmodules
+from .submodule_trie import GITMODULES_FILENAME, SubmoduleTrie
+
+__all__ = ["ScanContext"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScanContext:
+    def __init__(
+        self,
+        scan_root: Path,
+        submodule_paths: Optional[Iterable[Path]] = None,
+    ):
+        self.scan_root = scan_root
+        self.resolved_root = scan_root.resolve()
+        self.submodules = SubmoduleTrie(
+            rel_path
+            for rel_path in (
+                self.relative_of(p, resolve=False) for p in (submodule_paths or ())
+            )
+            if rel_path and not rel_path.startswith("..")
+        )
+        self.submodule_lock = threading.Lock()
+
+    @property
+    def submodule_rel_paths(self) -> List[str]:
+        return sorted(self.submodules.paths())
+
+    def relative_of(self, path: Path, resolve: bool = True) -> str:
+        target = path.resolve() if resolve else path
+        try:
+            rel_path = target.relative_to(self.resolved_root).as_posix()
+        except ValueError:
+            rel_path = Path(
+                os.path.relpath(os.path.abspath(target), self.resolved_root.as_posix())
+            ).as_posix()
+        return "" if rel_path == "." else rel_path
+
+    @staticmethod
+    def child(parent_rel: str, name: str) -> str:
+        return f"{parent_rel}/{name}" if parent_rel else name
+
+    def is_submodule(self, rel_path: str) -> bool:
+        return self.submodules.is_root(rel_path)
+
+    def is_in_submodule(self, rel_path: str) -> bool:
+        return self.submodules.contains(rel_path)
+
+    def register_gitmodules(self, directory: Path, directory_rel: str) -> int:
+        module_paths = read_gitmodules(directory / GITMODULES_FILENAME, logger)
+        added = 0
+        with self.submodule_lock:
+            for path_str in module_paths:
+                if self.submodules.add(self.child(directory_rel, path_str)):
+                    added += 1
+        if added:
+            logger.debug(
+                f"Đã nạp {added} submodule từ .gitmodules lồng nhau: {directory_rel}"
+            )
+        return added
+
+    def is_matched(
+        self,
+        rel_path: str,
+        is_dir: bool,
+        spec: Optional["pathspec.PathSpec"],
+    ) -> bool:
+        if spec is None or not rel_path:
+            return False
+
+        try:
+            return spec.match_file(f"{rel_path}/" if is_dir else rel_path)
+        except Exception as e:
+            logger.debug(f"Lỗi khi khớp đường dẫn '{rel_path}' với spec: {e}")
+            return False
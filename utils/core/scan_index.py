@@ -0,0 +1,223 @@
+# Path: utils/core/scan_index.py
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+from ..constants import SCAN_INDEX_DIR, SCAN_INDEX_SUFFIX
+from .config_helpers import generate_config_hash
+from .scan_context import ScanContext
+
+__all__ = ["ScanIndex", "open_scan_index"]
+
+
+SCAN_INDEX_SCHEMA_VERSION = 2
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+CachedListing = Tuple[List[str], List[str], bool, str]
+IndexRow = Tuple[int, bytes, bytes, int, str]
+
+
+def _encode_names(names: List[str]) -> bytes:
+    return b"\0".join(os.fsencode(name) for name in names)
+
+
+def _decode_names(blob: bytes) -> List[str]:
+    return [os.fsdecode(name) for name in blob.split(b"\0")] if blob else []
+
+
+def _spec_signature(spec: Optional["pathspec.PathSpec"]) -> Optional[List[Any]]:
+    if spec is None:
+        return None
+    return [[p.include, p.regex.pattern] for p in spec.patterns if p.regex is not None]
+
+
+def _index_path(scan_root: Path) -> Path:
+    root_key = os.fsencode(os.path.realpath(scan_root))
+    return SCAN_INDEX_DIR / (
+        hashlib.sha256(root_key).hexdigest()[:32] + SCAN_INDEX_SUFFIX
+    )
+
+
+class ScanIndex:
+    def __init__(self, logger: logging.Logger, scan_root: Path, settings_hash: str):
+        self.logger = logger
+        self.db_path = _index_path(scan_root)
+        self.settings_hash = settings_hash
+        self.entries: Dict[str, IndexRow] = {}
+        self.updates: Dict[str, IndexRow] = {}
+        self.visited: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.connection: Optional[sqlite3.Connection] = None
+
+    def open(self) -> bool:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(
+                self.db_path,
+                timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            with self.connection:
+                (user_version,) = self.connection.execute(
+                    "PRAGMA user_version"
+                ).fetchone()
+                if user_version != SCAN_INDEX_SCHEMA_VERSION:
+                    self.connection.execute("DROP TABLE IF EXISTS listings")
+                    self.connection.execute(
+                        f"PRAGMA user_version={SCAN_INDEX_SCHEMA_VERSION}"
+                    )
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS listings ("
+                    " settings_hash TEXT NOT NULL,"
+                    " rel_dir TEXT NOT NULL,"
+                    " mtime_ns INTEGER NOT NULL,"
+                    " files BLOB NOT NULL,"
+                    " subdirs BLOB NOT NULL,"
+                    " has_gitignore INTEGER NOT NULL,"
+                    " ignore_sig TEXT NOT NULL,"
+                    " PRIMARY KEY (settings_hash, rel_dir)"
+                    ") WITHOUT ROWID"
+                )
+            rows = self.connection.execute(
+                "SELECT rel_dir, mtime_ns, files, subdirs, has_gitignore, ignore_sig"
+                " FROM listings"
+                " WHERE settings_hash = ?",
+                (self.settings_hash,),
+            )
+            self.entries = {row[0]: tuple(row[1:]) for row in rows}
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(
+                f"⚠️ Không thể mở scan index '{self.db_path.as_posix()}': {e}"
+            )
+            self.connection = None
+            return False
+
+        self.logger.debug(
+            f"Scan index: {len(self.entries)} thư mục đã lưu (hash={self.settings_hash})"
+        )
+        return True
+
+    def lookup(self, rel_dir: str, mtime_ns: int) -> Optional[CachedListing]:
+        with self.lock:
+            self.visited.add(rel_dir)
+            row = self.entries.get(rel_dir)
+            if row is None or row[0] != mtime_ns:
+                self.misses += 1
+                return None
+
+        return _decode_names(row[1]), _decode_names(row[2]), bool(row[3]), row[4]
+
+    def record_lookup(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def store(
+        self,
+        rel_dir: str,
+        mtime_ns: int,
+        file_names: List[str],
+        subdir_names: List[str],
+        has_gitignore: bool = False,
+        ignore_sig: str = "",
+    ) -> None:
+        if time.time_ns() - mtime_ns < RACY_MTIME_WINDOW_NS:
+            return
+
+        row = (
+            mtime_ns,
+            _encode_names(file_names),
+            _encode_names(subdir_names),
+            int(has_gitignore),
+            ignore_sig,
+        )
+        with self.lock:
+            self.updates[rel_dir] = row
+
+    def close(self, prune_unvisited: bool = False) -> None:
+        if self.connection is None:
+            return
+
+        stale = (
+            [rel_dir for rel_dir in self.entries if rel_dir not in self.visited]
+            if prune_unvisited
+            else []
+        )
+
+        try:
+            with self.connection:
+                if self.updates:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO listings"
+                        " (settings_hash, rel_dir, mtime_ns, files, subdirs,"
+                        " has_gitignore, ignore_sig)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (self.settings_hash, rel_dir, *row)
+                            for rel_dir, row in self.updates.items()
+                        ],
+                    )
+                if stale:
+                    self.connection.executemany(
+                        "DELETE FROM listings WHERE settings_hash = ? AND rel_dir = ?",
+                        [(self.settings_hash, rel_dir) for rel_dir in stale],
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Không thể ghi scan index: {e}")
+        finally:
+            self.connection.close()
+            self.connection = None
+
+        self.logger.debug(
+            f"Scan index: {self.hits} hit, {self.misses} miss, "
+            f"{len(self.updates)} cập nhật, {len(stale)} xóa"
+        )
+
+
+def open_scan_index(
+    logger: logging.Logger,
+    scan_context: ScanContext,
+    ignore_spec: Optional["pathspec.PathSpec"],
+    include_spec: Optional["pathspec.PathSpec"],
+    prune_spec: Optional["pathspec.PathSpec"],
+    extensions_filter: Optional[Set[str]],
+    use_nested_gitignore: bool = False,
+) -> Optional[ScanIndex]:
+    settings = {
+        "version": SCAN_INDEX_SCHEMA_VERSION,
+        "ignore": _spec_signature(ignore_spec),
+        "include": _spec_signature(include_spec),
+        "prune": _spec_signature(prune_spec),
+        "extensions": (
+            sorted(extensions_filter) if extensions_filter is not None else None
+        ),
+        "submodules": scan_context.submodule_rel_paths,
+        "nested_gitignore": use_nested_gitignore,
+    }
+    settings_hash = generate_config_hash(settings, logger)
+
+    scan_index = ScanIndex(logger, scan_context.scan_root, settings_hash)
+    if not scan_index.open():
+        return None
+    return scan_index
@@ -0,0 +1,53 @@
+# Path: utils/core/stream_executor.py
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+__all__ = ["PathStream", "submit_as_arrived"]
+
+
+class PathStream:
+    def __init__(
+        self, paths: Iterable[Path], processed_files: Optional[Set[Path]] = None
+    ):
+        self._paths = paths
+        self._processed_files = processed_files
+        self.found_count = 0
+        self.submitted_count = 0
+
+    def __iter__(self) -> Iterator[Path]:
+        for path in self._paths:
+            self.found_count += 1
+
+            if self._processed_files is not None:
+                resolved = path.resolve()
+                if resolved in self._processed_files:
+                    continue
+                self._processed_files.add(resolved)
+
+            self.submitted_count += 1
+            yield path
+
+
+def submit_as_arrived(
+    executor: Executor,
+    func: Callable[..., Any],
+    paths: Iterable[Path],
+    *args: Any,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Tuple[Path, Future]]:
+    limit = max_in_flight if max_in_flight and max_in_flight > 0 else 64
+    in_flight: Dict[Future, Path] = {}
+
+    for path in paths:
+        in_flight[executor.submit(func, path, *args)] = path
+
+        if len(in_flight) >= limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future
+
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield in_flight.pop(future), future
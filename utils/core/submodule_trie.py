@@ -0,0 +1,77 @@
+# Path: utils/core/submodule_trie.py
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+__all__ = ["SubmoduleTrie", "GITMODULES_FILENAME"]
+
+
+GITMODULES_FILENAME = ".gitmodules"
+TERMINAL_KEY = "\0"
+
+TrieNode = Dict[str, Any]
+
+
+class SubmoduleTrie:
+    def __init__(self, rel_paths: Iterable[str] = ()):
+        self.root: TrieNode = {}
+        self.count = 0
+        for rel_path in rel_paths:
+            self.add(rel_path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    @staticmethod
+    def _split(rel_path: str) -> List[str]:
+        return [part for part in rel_path.split("/") if part and part != "."]
+
+    def add(self, rel_path: str) -> bool:
+        parts = self._split(rel_path)
+        if not parts or ".." in parts:
+            return False
+
+        node = self.root
+        for part in parts:
+            node = node.setdefault(part, {})
+        if TERMINAL_KEY in node:
+            return False
+
+        node[TERMINAL_KEY] = True
+        self.count += 1
+        return True
+
+    def is_root(self, rel_path: str) -> bool:
+        if not self.count or not rel_path:
+            return False
+
+        node = self.root
+        for part in rel_path.split("/"):
+            node = node.get(part)
+            if node is None:
+                return False
+        return TERMINAL_KEY in node
+
+    def contains(self, rel_path: str) -> bool:
+        if not self.count or not rel_path:
+            return False
+
+        node = self.root
+        for part in rel_path.split("/"):
+            node = node.get(part)
+            if node is None:
+                return False
+            if TERMINAL_KEY in node:
+                return True
+        return False
+
+    def paths(self) -> Iterator[str]:
+        stack: List[Tuple[TrieNode, str]] = [(self.root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            for key, child in node.items():
+                if key == TERMINAL_KEY:
+                    yield prefix
+                    continue
+                stack.append((child, f"{prefix}/{key}" if prefix else key))
@@ -0,0 +1,195 @@
+# Path: utils/core/tiered_spec.py
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+if TYPE_CHECKING:
+    import pathspec
+
+__all__ = ["TieredPathSpec", "compile_tiered_spec"]
+
+
+GLOB_CHARS = frozenset("*?[]\\")
+
+AnchoredPath = Tuple[Tuple[str, ...], bool]
+
+
+def _split_dir_only(pattern: str) -> Tuple[str, bool]:
+    if pattern.endswith("/"):
+        return pattern[:-1], True
+    return pattern, False
+
+
+def _is_literal_name(name: str) -> bool:
+    return (
+        bool(name)
+        and "/" not in name
+        and not GLOB_CHARS.intersection(name)
+        and name == name.strip()
+    )
+
+
+def _anchored_components(body: str) -> Optional[Tuple[str, ...]]:
+    is_rooted = body.startswith("/")
+    components = tuple((body[1:] if is_rooted else body).split("/"))
+    if len(components) == 1 and not is_rooted:
+        return None
+    if any(c in ("", ".", "..") or not _is_literal_name(c) for c in components):
+        return None
+    return components
+
+
+def _classify_pattern(pattern: str) -> Tuple[str, str, bool]:
+    if not pattern or pattern != pattern.strip() or pattern[0] in "#!":
+        return "regex", pattern, False
+
+    body, dir_only = _split_dir_only(pattern)
+
+    if _is_literal_name(body):
+        return "name", body, dir_only
+
+    if body.startswith("*") and _is_literal_name(body[1:]):
+        return "suffix", body[1:], dir_only
+
+    if _anchored_components(body) is not None:
+        return "anchored", body, dir_only
+
+    return "regex", pattern, False
+
+
+class TieredPathSpec:
+    def __init__(
+        self,
+        spec: "pathspec.PathSpec",
+        names: FrozenSet[str],
+        dir_names: FrozenSet[str],
+        suffixes: Tuple[str, ...],
+        dir_suffixes: Tuple[str, ...],
+        anchored: Dict[str, List[AnchoredPath]],
+        regex_spec: Optional["pathspec.PathSpec"],
+        has_negation: bool,
+    ):
+        self.spec = spec
+        self.patterns = spec.patterns
+        self.names = names
+        self.dir_names = dir_names
+        self.suffixes = suffixes
+        self.dir_suffixes = dir_suffixes
+        self.anchored = anchored
+        self.regex_spec = regex_spec
+        self.regexes = tuple(
+            p.regex
+            for p in (regex_spec.patterns if regex_spec is not None else ())
+            if p.include and p.regex is not None
+        )
+        self.has_negation = has_negation
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def check_match(self, file: str) -> Optional[bool]:
+        if self.has_negation:
+            return self.spec.check_file(file).include
+        return True if self.match_file(file) else None
+
+    def match_file(self, file: str) -> bool:
+        if self.has_negation:
+            return self.spec.match_file(file)
+
+        norm_file = str(file)
+        if norm_file.startswith("/"):
+            norm_file = norm_file[1:]
+        elif norm_file.startswith("./"):
+            norm_file = norm_file[2:]
+
+        if norm_file.startswith("/"):
+            return self.spec.match_file(file)
+
+        is_dir_form = norm_file.endswith("/")
+        parts = (norm_file[:-1] if is_dir_form else norm_file).split("/")
+        parent_parts = parts[:-1]
+        last_part = parts[-1]
+
+        names = self.names
+        if names and any(part in names for part in parts):
+            return True
+
+        dir_names = self.dir_names
+        if dir_names:
+            if any(part in dir_names for part in parent_parts):
+                return True
+            if is_dir_form and last_part in dir_names:
+                return True
+
+        suffixes = self.suffixes
+        if suffixes and any(part.endswith(suffixes) for part in parts):
+            return True
+
+        dir_suffixes = self.dir_suffixes
+        if dir_suffixes:
+            if any(part.endswith(dir_suffixes) for part in parent_parts):
+                return True
+            if is_dir_form and last_part.endswith(dir_suffixes):
+                return True
+
+        anchored_paths = self.anchored.get(parts[0]) if self.anchored else None
+        if anchored_paths:
+            for components, dir_only in anchored_paths:
+                depth = len(components)
+                if tuple(parts[:depth]) != components:
+                    continue
+                if not dir_only or len(parts) > depth or is_dir_form:
+                    return True
+
+        for regex in self.regexes:
+            if regex.search(norm_file):
+                return True
+
+        return False
+
+
+def compile_tiered_spec(patterns: Sequence[str]) -> "TieredPathSpec":
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+
+    names: List[str] = []
+    dir_names: List[str] = []
+    suffixes: List[str] = []
+    dir_suffixes: List[str] = []
+    anchored: Dict[str, List[AnchoredPath]] = {}
+    regex_patterns: List[str] = []
+    has_negation = False
+
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            has_negation = True
+
+        tier, value, dir_only = _classify_pattern(pattern)
+        if tier == "name":
+            (dir_names if dir_only else names).append(value)
+        elif tier == "suffix":
+            (dir_suffixes if dir_only else suffixes).append(value)
+        elif tier == "anchored":
+            components = _anchored_components(value)
+            anchored.setdefault(components[0], []).append((components, dir_only))
+        else:
+            regex_patterns.append(value)
+
+    regex_spec = (
+        pathspec.PathSpec.from_lines("gitwildmatch", regex_patterns)
+        if regex_patterns
+        else None
+    )
+
+    return TieredPathSpec(
+        spec=spec,
+        names=frozenset(names),
+        dir_names=frozenset(dir_names),
+        suffixes=tuple(suffixes),
+        dir_suffixes=tuple(dir_suffixes),
+        anchored=anchored,
+        regex_spec=regex_spec,
+        has_negation=has_negation,
+    )
@@ -0,0 +1,330 @@
+# Path: utils/core/transform_cache.py
+import hashlib
+import importlib.metadata
+import inspect
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+from ..constants import (
+    TRANSFORM_CACHE_DIR,
+    TRANSFORM_CACHE_DISABLE_ENV,
+    TRANSFORM_CACHE_FILENAME,
+    TRANSFORM_CACHE_MAX_BYTES,
+)
+
+__all__ = [
+    "TransformCache",
+    "build_transform_key",
+    "callable_fingerprint",
+    "source_fingerprint",
+    "get_transform_cache",
+    "close_transform_cache",
+    "mark_transform_cache_worker",
+    "take_transform_cache_stats",
+    "merge_transform_cache_stats",
+]
+
+
+TRANSFORM_CACHE_SCHEMA_VERSION = 1
+TRANSFORM_CACHE_KEY_VERSION = 1
+TRANSFORM_CACHE_EVICT_RATIO = 0.9
+SQLITE_BUSY_TIMEOUT_MS = 5000
+CACHE_STAT_FIELDS = ("hits", "misses", "stores", "evicted")
+
+CacheStats = Dict[str, int]
+
+
+def build_transform_key(*parts: str, content: str) -> str:
+    digest = hashlib.sha256()
+    for part in (
+        str(TRANSFORM_CACHE_SCHEMA_VERSION),
+        str(TRANSFORM_CACHE_KEY_VERSION),
+        *parts,
+    ):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    digest.update(content.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _package_digest(package_dir: str) -> str:
+    digest = hashlib.sha256()
+    try:
+        source_files = sorted(Path(package_dir).glob("*.py"))
+        for source_file in source_files:
+            digest.update(source_file.name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(source_file.read_bytes())
+            digest.update(b"\0")
+    except OSError:
+        return ""
+    return digest.hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def _distribution_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        module = sys.modules.get(name)
+        return str(getattr(module, "__version__", ""))
+
+
+def source_fingerprint(source_file: Path) -> str:
+    return _package_digest(os.path.dirname(os.path.abspath(source_file)))
+
+
+def callable_fingerprint(func: Callable, distributions: Sequence[str] = ()) -> str:
+    module = inspect.getmodule(func)
+    source_file = getattr(module, "__file__", None)
+    name = getattr(func, "__qualname__", repr(func))
+    parts = [name, source_fingerprint(Path(source_file)) if source_file else ""]
+    parts.extend(
+        f"{distribution}=={_distribution_version(distribution)}"
+        for distribution in distributions
+    )
+    return ":".join(parts)
+
+
+class TransformCache:
+    def __init__(self, logger: logging.Logger, db_path: Path, max_bytes: int):
+        self.logger = logger
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+        self.touched: Dict[str, int] = {}
+        self.shipped: CacheStats = dict.fromkeys(CACHE_STAT_FIELDS, 0)
+        self.lock = threading.Lock()
+        self.connection: Optional[sqlite3.Connection] = None
+
+    def open(self) -> bool:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(
+                self.db_path,
+                timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            with self.connection:
+                (user_version,) = self.connection.execute(
+                    "PRAGMA user_version"
+                ).fetchone()
+                if user_version != TRANSFORM_CACHE_SCHEMA_VERSION:
+                    self.connection.execute("DROP TABLE IF EXISTS entries")
+                    self.connection.execute(
+                        f"PRAGMA user_version={TRANSFORM_CACHE_SCHEMA_VERSION}"
+                    )
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key TEXT PRIMARY KEY,"
+                    " value BLOB NOT NULL,"
+                    " size INTEGER NOT NULL,"
+                    " last_used INTEGER NOT NULL"
+                    ") WITHOUT ROWID"
+                )
+                self.connection.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_last_used"
+                    " ON entries (last_used)"
+                )
+            (self.total_bytes,) = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.debug(
+                f"Không thể mở transform cache '{self.db_path.as_posix()}': {e}"
+            )
+            self.connection = None
+            return False
+
+        return True
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            if self.connection is None:
+                return None
+            try:
+                row = self.connection.execute(
+                    "SELECT value FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.debug(f"Transform cache: lỗi đọc ({e})")
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.touched[key] = time.time_ns()
+
+        return bytes(row[0]).decode("utf-8", "surrogatepass")
+
+    def put(self, key: str, value: str) -> None:
+        blob = value.encode("utf-8", "surrogatepass")
+        if len(blob) > self.max_bytes:
+            return
+
+        with self.lock:
+            if self.connection is None:
+                return
+            try:
+                with self.connection:
+                    previous = self.connection.execute(
+                        "SELECT size FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, size, last_used)"
+                        " VALUES (?, ?, ?, ?)",
+                        (key, blob, len(blob), time.time_ns()),
+                    )
+                self.total_bytes += len(blob) - (previous[0] if previous else 0)
+                self.stores += 1
+
+                if self.total_bytes > self.max_bytes:
+                    self._evict()
+            except sqlite3.Error as e:
+                self.logger.debug(f"Transform cache: lỗi ghi ({e})")
+
+    def _flush_touched(self) -> None:
+        if not self.touched or self.connection is None:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self.touched.items()],
+            )
+        self.touched.clear()
+
+    def _evict(self) -> None:
+        self._flush_touched()
+        target_bytes = int(self.max_bytes * TRANSFORM_CACHE_EVICT_RATIO)
+
+        victims = []
+        cursor = self.connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_used"
+        )
+        for key, size in cursor:
+            if self.total_bytes <= target_bytes:
+                break
+            victims.append((key,))
+            self.total_bytes -= size
+        cursor.close()
+
+        with self.connection:
+            self.connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.evicted += len(victims)
+
+    def stats(self) -> CacheStats:
+        with self.lock:
+            return {field: getattr(self, field) for field in CACHE_STAT_FIELDS}
+
+    def take_unshipped_stats(self) -> CacheStats:
+        with self.lock:
+            delta = {
+                field: getattr(self, field) - self.shipped[field]
+                for field in CACHE_STAT_FIELDS
+            }
+            self.shipped = {field: getattr(self, field) for field in CACHE_STAT_FIELDS}
+        return delta
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is None:
+                return
+            try:
+                self._flush_touched()
+            except sqlite3.Error as e:
+                self.logger.debug(f"Transform cache: lỗi cập nhật LRU ({e})")
+            finally:
+                self.connection.close()
+                self.connection = None
+
+
+_transform_cache: Optional[TransformCache] = None
+_transform_cache_unavailable = False
+_transform_cache_lock = threading.Lock()
+_is_worker = False
+_worker_stats: CacheStats = dict.fromkeys(CACHE_STAT_FIELDS, 0)
+
+
+def get_transform_cache(logger: logging.Logger) -> Optional[TransformCache]:
+    global _transform_cache, _transform_cache_unavailable
+
+    if os.environ.get(TRANSFORM_CACHE_DISABLE_ENV, "") not in ("", "0"):
+        return None
+
+    with _transform_cache_lock:
+        if _transform_cache is None and not _transform_cache_unavailable:
+            cache = TransformCache(
+                logger,
+                TRANSFORM_CACHE_DIR / TRANSFORM_CACHE_FILENAME,
+                TRANSFORM_CACHE_MAX_BYTES,
+            )
+            if cache.open():
+                _transform_cache = cache
+            else:
+                _transform_cache_unavailable = True
+        return _transform_cache
+
+
+def mark_transform_cache_worker() -> None:
+    global _is_worker
+    _is_worker = True
+
+
+def take_transform_cache_stats() -> Optional[CacheStats]:
+    if not _is_worker:
+        return None
+
+    with _transform_cache_lock:
+        cache = _transform_cache
+    if cache is None:
+        return None
+
+    delta = cache.take_unshipped_stats()
+    return delta if any(delta.values()) else None
+
+
+def merge_transform_cache_stats(stats: Optional[CacheStats]) -> None:
+    if not stats:
+        return
+    with _transform_cache_lock:
+        for field in CACHE_STAT_FIELDS:
+            _worker_stats[field] += stats.get(field, 0)
+
+
+def close_transform_cache(logger: logging.Logger, report: bool = True) -> None:
+    global _transform_cache
+
+    with _transform_cache_lock:
+        cache = _transform_cache
+        _transform_cache = None
+        totals = dict(_worker_stats)
+        _worker_stats.update(dict.fromkeys(CACHE_STAT_FIELDS, 0))
+
+    if cache is not None:
+        for field, value in cache.stats().items():
+            totals[field] += value
+
+    if report and (totals["hits"] or totals["misses"]):
+        logger.info(
+            f"🗃️ Transform cache: {totals['hits']} hit, {totals['misses']} miss "
+            f"({totals['stores']} lưu mới, {totals['evicted']} bị loại bỏ)"
+        )
+    if cache is not None:
+        cache.close()
@@ -0,0 +1,108 @@
+# Path: utils/core/upward_search.py
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Final, List, Optional, Tuple
+
+__all__ = [
+    "MARKER_FILE",
+    "MARKER_DIR",
+    "MARKER_ANY",
+    "find_marker_upwards",
+    "invalidate_upward_search",
+]
+
+MARKER_FILE: Final[str] = "file"
+MARKER_DIR: Final[str] = "dir"
+MARKER_ANY: Final[str] = "any"
+
+MARKER_CHECKS: Final[Dict[str, Callable[[str], bool]]] = {
+    MARKER_FILE: os.path.isfile,
+    MARKER_DIR: os.path.isdir,
+    MARKER_ANY: os.path.exists,
+}
+
+SearchKey = Tuple[str, str, str]
+
+_MISSING: Final[str] = "\0"
+
+_nearest_ancestors: Dict[SearchKey, Optional[str]] = {}
+_resolved_paths: Dict[str, str] = {}
+_cache_lock = threading.Lock()
+
+
+def _resolve_dir(start_path: Path) -> str:
+    absolute = os.path.abspath(start_path)
+    resolved = _resolved_paths.get(absolute)
+    if resolved is None:
+        resolved = os.path.realpath(absolute)
+        with _cache_lock:
+            _resolved_paths[absolute] = resolved
+    return resolved
+
+
+def _depth(path: str) -> int:
+    return len(Path(path).parts)
+
+
+def find_marker_upwards(
+    name: str,
+    start_path: Path,
+    kind: str = MARKER_FILE,
+    max_levels: Optional[int] = None,
+) -> Optional[Path]:
+    check = MARKER_CHECKS[kind]
+    start_dir = _resolve_dir(start_path)
+
+    visited: List[str] = []
+    current = start_dir
+    found: Optional[str] = None
+    while True:
+        cached = _nearest_ancestors.get((name, kind, current), _MISSING)
+        if cached != _MISSING:
+            found = cached
+            break
+        visited.append(current)
+        if check(os.path.join(current, name)):
+            found = current
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+
+    with _cache_lock:
+        for directory in visited:
+            _nearest_ancestors[(name, kind, directory)] = found
+
+    if found is None:
+        return None
+    if max_levels is not None and _depth(start_dir) - _depth(found) >= max_levels:
+        return None
+    return Path(found)
+
+
+def invalidate_upward_search(path: Optional[Path] = None) -> None:
+    with _cache_lock:
+        if path is None:
+            _nearest_ancestors.clear()
+            _resolved_paths.clear()
+            return
+
+        prefix = os.path.abspath(path)
+        resolved_prefix = os.path.realpath(prefix)
+
+        def _is_under(directory: str) -> bool:
+            return any(
+                directory == root or directory.startswith(root.rstrip(os.sep) + os.sep)
+                for root in (prefix, resolved_prefix)
+            )
+
+        for key in [key for key in _nearest_ancestors if _is_under(key[2])]:
+            del _nearest_ancestors[key]
+        for absolute in [
+            absolute
+            for absolute, resolved in _resolved_paths.items()
+            if _is_under(absolute) or _is_under(resolved)
+        ]:
+            del _resolved_paths[absolute]